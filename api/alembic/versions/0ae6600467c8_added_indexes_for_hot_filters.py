@@ -0,0 +1,97 @@
+"""added indexes for hot filters
+
+Revision ID: 0ae6600467c8
+Revises: c01bbd3f3af4
+Create Date: 2026-10-18 09:12:44.381205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0ae6600467c8"
+down_revision: Union[str, None] = "c01bbd3f3af4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_invites_event_id_status",
+            "invites",
+            ["event_id", "status"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_invites_event_id_email",
+            "invites",
+            ["event_id", "email"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_invites_user_id_status",
+            "invites",
+            ["user_id", "status"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_invites_email_unlinked",
+            "invites",
+            ["email"],
+            postgresql_where=sa.text("user_id IS NULL"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_events_host_id_start_time",
+            "events",
+            ["host_id", "start_time"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_participants_user_id",
+            "participants",
+            ["user_id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_participants_user_id",
+            table_name="participants",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_events_host_id_start_time",
+            table_name="events",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_invites_email_unlinked",
+            table_name="invites",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_invites_user_id_status",
+            table_name="invites",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_invites_event_id_email",
+            table_name="invites",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_invites_event_id_status",
+            table_name="invites",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,60 @@
+"""added invite counters to events
+
+Revision ID: 3e6e33eaf306
+Revises: bf3303ef6bd1
+Create Date: 2026-10-18 17:02:44.516208
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3e6e33eaf306"
+down_revision: Union[str, None] = "bf3303ef6bd1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = ("pending", "accepted", "declined")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for status in COUNTERS:
+        op.add_column(
+            "events",
+            sa.Column(
+                f"{status}_count",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+            ),
+        )
+    # Backfill from the existing invites
+    op.execute(
+        """
+        UPDATE events SET
+            pending_count = counts.pending,
+            accepted_count = counts.accepted,
+            declined_count = counts.declined
+        FROM (
+            SELECT
+                event_id,
+                count(*) FILTER (WHERE status = 'pending') AS pending,
+                count(*) FILTER (WHERE status = 'accepted') AS accepted,
+                count(*) FILTER (WHERE status = 'declined') AS declined
+            FROM invites
+            GROUP BY event_id
+        ) AS counts
+        WHERE events.id = counts.event_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for status in reversed(COUNTERS):
+        op.drop_column("events", f"{status}_count")
@@ -0,0 +1,81 @@
+"""made invite (event_id, email) unique
+
+Revision ID: 62f33ad2ff8b
+Revises: 7ddc7b91ceb4
+Create Date: 2026-10-18 12:40:51.206733
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "62f33ad2ff8b"
+down_revision: Union[str, None] = "7ddc7b91ceb4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The old create_invite checked for an existing invite before inserting,
+    # which concurrent requests could both pass. Keep one invite per
+    # (event_id, email), preferring an answered one, then the oldest.
+    op.execute(
+        """
+        DELETE FROM invites
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY event_id, email
+                    ORDER BY
+                        CASE status
+                            WHEN 'accepted' THEN 0
+                            WHEN 'declined' THEN 1
+                            ELSE 2
+                        END,
+                        id
+                ) AS position
+                FROM invites
+            ) AS ranked
+            WHERE position > 1
+        )
+        """
+    )
+    with op.get_context().autocommit_block():
+        # A failed concurrent build leaves an INVALID index; drop it so the
+        # migration can be retried
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS uq_invites_event_id_email"
+        )
+        op.create_index(
+            "uq_invites_event_id_email",
+            "invites",
+            ["event_id", "email"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_invites_event_id_email",
+            table_name="invites",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_invites_event_id_email",
+            "invites",
+            ["event_id", "email"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "uq_invites_event_id_email",
+            table_name="invites",
+            postgresql_concurrently=True,
+        )
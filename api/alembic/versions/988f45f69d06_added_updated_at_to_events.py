@@ -0,0 +1,37 @@
+"""added updated_at to events
+
+Revision ID: 988f45f69d06
+Revises: 7fe71320507e
+Create Date: 2026-10-18 15:21:09.470362
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "988f45f69d06"
+down_revision: Union[str, None] = "7fe71320507e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "events",
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("events", "updated_at")
@@ -0,0 +1,37 @@
+"""added participants_version to events
+
+Revision ID: bf3303ef6bd1
+Revises: 988f45f69d06
+Create Date: 2026-10-18 15:48:27.306114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "bf3303ef6bd1"
+down_revision: Union[str, None] = "988f45f69d06"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "events",
+        sa.Column(
+            "participants_version",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("events", "participants_version")
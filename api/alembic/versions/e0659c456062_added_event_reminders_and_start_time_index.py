@@ -0,0 +1,48 @@
+"""added event reminders and start_time index
+
+Revision ID: e0659c456062
+Revises: 3e6e33eaf306
+Create Date: 2026-10-18 19:11:05.873412
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e0659c456062"
+down_revision: Union[str, None] = "3e6e33eaf306"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "events",
+        sa.Column(
+            "reminder_sent_at", sa.TIMESTAMP(timezone=True), nullable=True
+        ),
+    )
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_start_time",
+            "events",
+            ["start_time"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_events_start_time",
+            table_name="events",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("events", "reminder_sent_at")
@@ -0,0 +1,11 @@
+"""
+Load-testing harness for the API.
+
+Seeds a throwaway Postgres with synthetic users, events and invites, drives
+every router endpoint at a fixed concurrency and writes a JSON report
+(throughput, p50/p95/p99 latency and SQL queries per request) that can be
+compared between commits. Run from the api directory:
+
+    python -m benchmarks --output report.json
+    python -m benchmarks --compare report.json --output new.json
+"""
@@ -0,0 +1,140 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import platform
+import random
+import sys
+from datetime import datetime, timezone
+
+from .runner import (
+    compare_reports,
+    free_port,
+    git_revision,
+    run_benchmark,
+    start_server,
+)
+from .scenarios import SCENARIOS, BenchmarkContext
+from .seed import SeedConfig, seed_database
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Seed a database and benchmark every API endpoint.",
+    )
+    parser.add_argument("--users", type=int, default=SeedConfig.users)
+    parser.add_argument("--events", type=int, default=SeedConfig.events)
+    parser.add_argument(
+        "--mean-invites", type=float, default=SeedConfig.mean_invites
+    )
+    parser.add_argument("--seed", type=int, default=SeedConfig.seed)
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Requests per scenario"
+    )
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="uvicorn workers; query counts are only exact with one",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        help="Only run scenarios whose name starts with this (repeatable)",
+    )
+    parser.add_argument(
+        "--database-url",
+        help="Use this empty database instead of a testcontainers Postgres",
+    )
+    parser.add_argument(
+        "--server-env",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Extra environment for the API server (repeatable)",
+    )
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--compare", help="Baseline JSON report to diff")
+    return parser.parse_args(argv)
+
+
+@contextlib.contextmanager
+def benchmark_database(database_url=None):
+    """
+    Yields the given URL, or the URL of a fresh Postgres container.
+    """
+
+    if database_url:
+        yield database_url
+        return
+    from testcontainers.postgres import PostgresContainer
+
+    with PostgresContainer("postgres:15") as postgres:
+        yield postgres.get_connection_url()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = SeedConfig(
+        users=args.users,
+        events=args.events,
+        mean_invites=args.mean_invites,
+        seed=args.seed,
+    )
+    scenarios = [
+        scenario
+        for scenario in SCENARIOS
+        if not args.scenario
+        or any(scenario.name.startswith(prefix) for prefix in args.scenario)
+    ]
+    server_env = dict(item.split("=", 1) for item in args.server_env)
+
+    with benchmark_database(args.database_url) as database_url:
+        print("Seeding database...", file=sys.stderr)
+        seed = seed_database(database_url, config)
+        port = free_port()
+        server = start_server(database_url, port, args.workers, server_env)
+        try:
+            ctx = BenchmarkContext(seed=seed, rng=random.Random(args.seed))
+            results = asyncio.run(
+                run_benchmark(
+                    f"http://127.0.0.1:{port}",
+                    ctx,
+                    scenarios,
+                    args.requests,
+                    args.concurrency,
+                )
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "requests_per_scenario": args.requests,
+            "concurrency": args.concurrency,
+            "workers": args.workers,
+            "server_env": server_env,
+            "seed": seed.counts,
+        },
+        "scenarios": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        print("\n".join(compare_reports(baseline, report)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Drives the scenarios against a live uvicorn server and builds the report.
+
+Latency is measured client side. Queries per request come from the
+server's /metrics endpoint (http_request_db_queries), scraped before and
+after each scenario, so they are exact with a single worker process.
+"""
+
+import asyncio
+import os
+import re
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+from .scenarios import COOKIE_NAME, BenchmarkContext, Scenario
+from .seed import BENCHMARK_PASSWORD
+
+API_ROOT = Path(__file__).resolve().parent.parent
+
+_QUERY_SAMPLE = re.compile(
+    r'^http_request_db_queries_(sum|count)\{method="([^"]+)",'
+    r'route="([^"]+)"\} ([0-9.e+-]+)$'
+)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(database_url: str, port: int, workers: int, env: dict):
+    """
+    Starts the API in a uvicorn subprocess and waits until it answers.
+    """
+
+    server_env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "JWT_SECRET_KEY": os.environ.get("JWT_SECRET_KEY", "benchmark"),
+        "SQL_INSPECT": "off",
+        **env,
+    }
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "src.main.main:app",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=API_ROOT,
+        env=server_env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("The API server exited during startup.")
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/metrics", timeout=1)
+            return process
+        except httpx.TransportError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("The API server did not start within 30 seconds.")
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(fraction * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def scrape_query_totals(client: httpx.AsyncClient) -> dict:
+    """
+    Returns {(method, route): [query_sum, request_count]} from /metrics.
+    """
+
+    response = await client.get("/metrics")
+    totals = {}
+    for line in response.text.splitlines():
+        match = _QUERY_SAMPLE.match(line)
+        if match:
+            kind, method, route, value = match.groups()
+            entry = totals.setdefault((method, route), [0.0, 0.0])
+            entry[0 if kind == "sum" else 1] = float(value)
+    return totals
+
+
+async def sign_in(client: httpx.AsyncClient, email: str) -> str:
+    response = await client.post(
+        "/api/auth/signin",
+        json={"email": email, "password": BENCHMARK_PASSWORD},
+    )
+    response.raise_for_status()
+    return response.cookies[COOKIE_NAME]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    ctx: BenchmarkContext,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+) -> dict:
+    """
+    Sends `requests` requests for one scenario from `concurrency` workers.
+    """
+
+    latencies = []
+    errors = {}
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            try:
+                kwargs = scenario.build(ctx)
+            except IndexError:
+                # Nothing left to consume from an earlier scenario
+                errors["no input"] = errors.get("no input", 0) + 1
+                continue
+            url = kwargs.pop("url")
+            start = time.perf_counter()
+            response = await client.request(scenario.method, url, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code not in scenario.expected_status:
+                key = str(response.status_code)
+                errors[key] = errors.get(key, 0) + 1
+            elif scenario.on_response is not None:
+                scenario.on_response(ctx, response)
+
+    before = await scrape_query_totals(client)
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    after = await scrape_query_totals(client)
+
+    key = (scenario.method, scenario.route)
+    old_sum, old_count = before.get(key, (0.0, 0.0))
+    new_sum, new_count = after.get(key, (0.0, 0.0))
+    query_sum, request_count = new_sum - old_sum, new_count - old_count
+    latencies.sort()
+    ms = [latency * 1000 for latency in latencies]
+    return {
+        "name": scenario.name,
+        "method": scenario.method,
+        "route": scenario.route,
+        "requests": len(latencies),
+        "errors": errors,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0,
+        "latency_ms": {
+            "mean": round(sum(ms) / len(ms), 2) if ms else 0.0,
+            "p50": round(percentile(ms, 0.50), 2),
+            "p95": round(percentile(ms, 0.95), 2),
+            "p99": round(percentile(ms, 0.99), 2),
+            "max": round(ms[-1], 2) if ms else 0.0,
+        },
+        "queries_per_request": (
+            round(query_sum / request_count, 2) if request_count else None
+        ),
+    }
+
+
+async def run_benchmark(
+    base_url: str,
+    ctx: BenchmarkContext,
+    scenarios: list,
+    requests: int,
+    concurrency: int,
+) -> list:
+    """
+    Signs in the busiest host and guest, then runs each scenario in order.
+    """
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        ctx.cookies["host"] = await sign_in(
+            client, ctx.seed.busiest_host_email
+        )
+        ctx.cookies["guest"] = await sign_in(
+            client, ctx.seed.busiest_guest_email
+        )
+        # Requests carry their own cookie headers
+        client.cookies.clear()
+        results = []
+        for scenario in scenarios:
+            result = await run_scenario(
+                client, ctx, scenario, requests, concurrency
+            )
+            print(
+                f"{scenario.name:<28} {result['throughput_rps']:>8} req/s "
+                f"p95 {result['latency_ms']['p95']:>8} ms "
+                f"queries {result['queries_per_request']}",
+                file=sys.stderr,
+            )
+            results.append(result)
+        return results
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=API_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare_reports(baseline: dict, current: dict) -> list:
+    """
+    Per-scenario changes between two reports, for a quick regression check.
+    """
+
+    previous = {row["name"]: row for row in baseline["scenarios"]}
+    lines = []
+    for row in current["scenarios"]:
+        old = previous.get(row["name"])
+        if old is None:
+            continue
+        old_p95 = old["latency_ms"]["p95"] or 1e-9
+        change = (row["latency_ms"]["p95"] - old_p95) / old_p95 * 100
+        lines.append(
+            f"{row['name']:<28} p95 {old['latency_ms']['p95']:>8} -> "
+            f"{row['latency_ms']['p95']:>8} ms ({change:+.0f}%), queries "
+            f"{old['queries_per_request']} -> {row['queries_per_request']}"
+        )
+    return lines
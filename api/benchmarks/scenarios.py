@@ -0,0 +1,340 @@
+"""
+One scenario per router endpoint.
+
+Each scenario builds the keyword arguments of one httpx request from the
+seeded data. Write scenarios that need fresh rows consume what an earlier
+scenario created (e.g. events.delete deletes what events.create made), so
+the list order matters. The admin-only /api/internal/pool and /metrics
+endpoints are operational and left out, as is the long-lived event
+stream.
+"""
+
+import random
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+from .seed import BENCHMARK_PASSWORD, SeedData
+
+COOKIE_NAME = "fast_api_token"
+BULK_INVITE_SIZE = 100
+IMPORT_ROWS = 50
+
+
+@dataclass
+class BenchmarkContext:
+    """
+    Seed data plus rows and cookies created while the benchmark runs.
+    """
+
+    seed: SeedData
+    rng: random.Random
+    cookies: dict = field(default_factory=dict)
+    created_event_ids: deque = field(default_factory=deque)
+    created_invites: deque = field(default_factory=deque)
+    responded_invite_ids: deque = field(default_factory=deque)
+    new_user_cookies: deque = field(default_factory=deque)
+    import_ids: list = field(default_factory=list)
+    calendar_paths: list = field(default_factory=list)
+
+    def auth(self, who: str = "host") -> dict:
+        return {"Cookie": f"{COOKIE_NAME}={self.cookies[who]}"}
+
+    def host_event_id(self) -> int:
+        return self.rng.choice(self.seed.host_event_ids)
+
+    def hot_token(self) -> str:
+        # Shared links are read with a long tail: most hits go to few tokens
+        tokens = self.seed.invite_tokens
+        index = min(int(self.rng.paretovariate(1.2)) - 1, len(tokens) - 1)
+        return tokens[index]
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    route: str
+    build: Callable[[BenchmarkContext], dict]
+    on_response: Optional[Callable] = None
+    expected_status: tuple = (200,)
+
+
+def _unique_email(prefix: str) -> str:
+    return f"{prefix}-{uuid.uuid4().hex[:12]}@bench.example.com"
+
+
+def _event_payload(ctx: BenchmarkContext) -> dict:
+    start = datetime.now(timezone.utc) + timedelta(days=ctx.rng.randint(1, 90))
+    return {
+        "title": "Benchmark created event",
+        "description": "Created during a benchmark run",
+        "start_time": start.isoformat(),
+        "end_time": (start + timedelta(hours=3)).isoformat(),
+    }
+
+
+def _record_created_event(ctx, response):
+    ctx.created_event_ids.append(response.json()["id"])
+
+
+def _record_created_invite(ctx, response):
+    invite = response.json()
+    ctx.created_invites.append((invite["id"], invite["token"]))
+
+
+def _record_responded_invite(ctx, response):
+    ctx.responded_invite_ids.append(response.json()["id"])
+
+
+def _record_new_user(ctx, response):
+    ctx.new_user_cookies.append(response.cookies[COOKIE_NAME])
+
+
+def _record_import(ctx, response):
+    ctx.import_ids.append(response.json()["id"])
+
+
+def _record_calendar_path(ctx, response):
+    ctx.calendar_paths.append(urlsplit(response.json()["url"]).path)
+
+
+def _respond_to_invite(ctx):
+    _, token = ctx.created_invites.popleft()
+    return {"url": f"/api/invites/{token}", "json": {"status": "accepted"}}
+
+
+def _import_file(ctx):
+    rows = ["email,role"] + [
+        f"{_unique_email('import')},participant" for _ in range(IMPORT_ROWS)
+    ]
+    return {
+        "url": f"/api/invites/import?event_id={ctx.host_event_id()}",
+        "files": {"file": ("guests.csv", "\n".join(rows), "text/csv")},
+        "headers": ctx.auth(),
+    }
+
+
+def _delete_new_user(ctx):
+    cookie = ctx.new_user_cookies.popleft()
+    return {
+        "url": "/api/users/me",
+        "headers": {"Cookie": f"{COOKIE_NAME}={cookie}"},
+    }
+
+
+SCENARIOS = [
+    Scenario(
+        "auth.signin",
+        "POST",
+        "/api/auth/signin",
+        lambda ctx: {
+            "url": "/api/auth/signin",
+            "json": {
+                "email": ctx.seed.busiest_host_email,
+                "password": BENCHMARK_PASSWORD,
+            },
+        },
+    ),
+    Scenario(
+        "auth.signout",
+        "DELETE",
+        "/api/auth/signout",
+        lambda ctx: {"url": "/api/auth/signout"},
+    ),
+    Scenario(
+        "users.create",
+        "POST",
+        "/api/users/",
+        lambda ctx: {
+            "url": "/api/users/",
+            "json": {
+                "email": _unique_email("signup"),
+                "password": BENCHMARK_PASSWORD,
+                "first_name": "New",
+                "last_name": "User",
+            },
+        },
+        on_response=_record_new_user,
+    ),
+    Scenario(
+        "users.me",
+        "GET",
+        "/api/users/me",
+        lambda ctx: {"url": "/api/users/me", "headers": ctx.auth()},
+    ),
+    Scenario(
+        "users.get",
+        "GET",
+        "/api/users/{user_id}",
+        lambda ctx: {"url": f"/api/users/{ctx.rng.choice(ctx.seed.user_ids)}"},
+    ),
+    Scenario(
+        "users.delete_me",
+        "DELETE",
+        "/api/users/me",
+        _delete_new_user,
+        expected_status=(204,),
+    ),
+    Scenario(
+        "events.list_hosted",
+        "GET",
+        "/api/private/events/",
+        lambda ctx: {
+            "url": "/api/private/events/?role=host&limit=50",
+            "headers": ctx.auth(),
+        },
+    ),
+    Scenario(
+        "events.list_participating",
+        "GET",
+        "/api/private/events/",
+        lambda ctx: {
+            "url": "/api/private/events/?role=participant&limit=50",
+            "headers": ctx.auth("guest"),
+        },
+    ),
+    Scenario(
+        "events.get",
+        "GET",
+        "/api/private/events/{event_id}",
+        lambda ctx: {
+            "url": f"/api/private/events/{ctx.host_event_id()}",
+            "headers": ctx.auth(),
+        },
+    ),
+    Scenario(
+        "events.create",
+        "POST",
+        "/api/private/events/",
+        lambda ctx: {
+            "url": "/api/private/events/",
+            "json": _event_payload(ctx),
+            "headers": ctx.auth(),
+        },
+        on_response=_record_created_event,
+    ),
+    Scenario(
+        "events.update",
+        "PUT",
+        "/api/private/events/{event_id}",
+        lambda ctx: {
+            "url": f"/api/private/events/{ctx.host_event_id()}",
+            "json": _event_payload(ctx),
+            "headers": ctx.auth(),
+        },
+    ),
+    Scenario(
+        "events.delete",
+        "DELETE",
+        "/api/private/events/{event_id}",
+        lambda ctx: {
+            "url": f"/api/private/events/{ctx.created_event_ids.popleft()}",
+            "headers": ctx.auth(),
+        },
+    ),
+    Scenario(
+        "invites.list",
+        "GET",
+        "/api/invites/",
+        lambda ctx: {
+            "url": f"/api/invites/?event_id={ctx.host_event_id()}&limit=50",
+            "headers": ctx.auth(),
+        },
+    ),
+    Scenario(
+        "invites.create",
+        "POST",
+        "/api/invites/",
+        lambda ctx: {
+            "url": "/api/invites/",
+            "json": {
+                "email": _unique_email("invite"),
+                "event_id": ctx.host_event_id(),
+            },
+            "headers": ctx.auth(),
+        },
+        on_response=_record_created_invite,
+    ),
+    Scenario(
+        "invites.bulk",
+        "POST",
+        "/api/invites/bulk",
+        lambda ctx: {
+            "url": "/api/invites/bulk",
+            "json": {
+                "event_id": ctx.host_event_id(),
+                "invites": [
+                    {"email": _unique_email("bulk")}
+                    for _ in range(BULK_INVITE_SIZE)
+                ],
+            },
+            "headers": ctx.auth(),
+        },
+    ),
+    Scenario(
+        "invites.respond",
+        "PUT",
+        "/api/invites/{token}",
+        _respond_to_invite,
+        on_response=_record_responded_invite,
+    ),
+    Scenario(
+        "invites.delete",
+        "DELETE",
+        "/api/invites/{invite_id}",
+        lambda ctx: {
+            "url": f"/api/invites/{ctx.responded_invite_ids.popleft()}",
+            "headers": ctx.auth(),
+        },
+        expected_status=(204,),
+    ),
+    Scenario(
+        "invites.import",
+        "POST",
+        "/api/invites/import",
+        _import_file,
+        on_response=_record_import,
+        expected_status=(202,),
+    ),
+    Scenario(
+        "invites.import_status",
+        "GET",
+        "/api/invites/imports/{import_id}",
+        lambda ctx: {
+            "url": f"/api/invites/imports/{ctx.rng.choice(ctx.import_ids)}",
+            "headers": ctx.auth(),
+        },
+    ),
+    Scenario(
+        "calendar.feed_url",
+        "GET",
+        "/api/calendar/feed",
+        lambda ctx: {"url": "/api/calendar/feed", "headers": ctx.auth()},
+        on_response=_record_calendar_path,
+    ),
+    Scenario(
+        "calendar.ics",
+        "GET",
+        "/api/calendar/{token}.ics",
+        lambda ctx: {"url": ctx.rng.choice(ctx.calendar_paths)},
+    ),
+    Scenario(
+        "public.event_by_token",
+        "GET",
+        "/api/public/events/token/{token}",
+        lambda ctx: {"url": f"/api/public/events/token/{ctx.hot_token()}"},
+    ),
+    Scenario(
+        "public.participants",
+        "GET",
+        "/api/public/events/{event_id}/participants",
+        lambda ctx: {
+            "url": "/api/public/events/"
+            f"{ctx.rng.choice(ctx.seed.event_ids)}/participants"
+        },
+    ),
+]
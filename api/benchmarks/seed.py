@@ -0,0 +1,209 @@
+"""
+Synthetic data generator for the benchmark database.
+
+Shapes follow what production looks like: a few hosts run most events
+(Zipf), guest lists are long-tailed (log-normal), and most invitees answer
+with an accept. Rows are written with multi-row Core inserts, so seeding a
+few hundred thousand invites takes seconds.
+"""
+
+import math
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+import bcrypt
+from sqlalchemy import create_engine, insert
+from src.main.models import Base, Event, Invite, Participant, User
+
+# Every seeded account signs in with this password
+BENCHMARK_PASSWORD = "benchmark-password"
+
+INSERT_BATCH_SIZE = 5000
+
+
+@dataclass
+class SeedConfig:
+    users: int = 2000
+    events: int = 500
+    mean_invites: float = 25.0
+    registered_ratio: float = 0.7
+    accept_ratio: float = 0.55
+    decline_ratio: float = 0.15
+    host_zipf_exponent: float = 1.1
+    seed: int = 1
+
+
+@dataclass
+class SeedData:
+    """
+    Ids and tokens the scenarios draw their requests from.
+    """
+
+    user_ids: list = field(default_factory=list)
+    registered_emails: list = field(default_factory=list)
+    busiest_host_email: str = ""
+    busiest_guest_email: str = ""
+    host_event_ids: list = field(default_factory=list)
+    event_ids: list = field(default_factory=list)
+    invite_tokens: list = field(default_factory=list)
+    counts: dict = field(default_factory=dict)
+
+
+def _insert_returning_ids(conn, table, rows):
+    ids = []
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        end = start + INSERT_BATCH_SIZE
+        batch = rows[start:end]
+        ids.extend(
+            conn.execute(insert(table).returning(table.c.id), batch).scalars()
+        )
+    return ids
+
+
+def _insert(conn, table, rows):
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        end = start + INSERT_BATCH_SIZE
+        conn.execute(insert(table), rows[start:end])
+
+
+def _guest_list_size(rng: random.Random, mean: float, limit: int) -> int:
+    # Log-normal with sigma 1 has mean exp(mu + 1/2)
+    size = rng.lognormvariate(math.log(mean) - 0.5, 1.0)
+    return max(1, min(limit, int(round(size))))
+
+
+def seed_database(database_url: str, config: SeedConfig) -> SeedData:
+    """
+    Creates the schema on an empty database and fills it with synthetic
+    users, events, invites and participants.
+    """
+
+    rng = random.Random(config.seed)
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    hashed_password = bcrypt.hashpw(
+        BENCHMARK_PASSWORD.encode("utf-8"), bcrypt.gensalt()
+    ).decode("utf-8")
+    data = SeedData()
+
+    with engine.begin() as conn:
+        # Users: a share of invitees never registered an account
+        user_rows = []
+        for index in range(config.users):
+            registered = rng.random() < config.registered_ratio
+            user_rows.append(
+                {
+                    "email": f"user{index}@bench.example.com",
+                    "first_name": f"First{index}" if registered else None,
+                    "last_name": f"Last{index}" if registered else None,
+                    "is_registered": registered,
+                    "hashed_password": hashed_password if registered else None,
+                }
+            )
+        data.user_ids = _insert_returning_ids(conn, User.__table__, user_rows)
+        registered = [
+            (user_id, row["email"])
+            for user_id, row in zip(data.user_ids, user_rows)
+            if row["is_registered"]
+        ]
+        data.registered_emails = [email for _, email in registered]
+        emails = {
+            user_id: row["email"]
+            for user_id, row in zip(data.user_ids, user_rows)
+        }
+
+        # Events: hosts are picked with Zipf weights by rank
+        weights = [
+            1 / (rank**config.host_zipf_exponent)
+            for rank in range(1, len(registered) + 1)
+        ]
+        hosts = rng.choices(registered, weights=weights, k=config.events)
+        now = datetime.now(timezone.utc)
+        event_rows = []
+        for index, (host_id, _) in enumerate(hosts):
+            start = now + timedelta(minutes=rng.randint(-180, 180) * 24 * 60)
+            event_rows.append(
+                {
+                    "title": f"Benchmark event {index}",
+                    "description": "Synthetic event " * rng.randint(0, 20),
+                    "host_id": host_id,
+                    "start_time": start,
+                    "end_time": start + timedelta(hours=rng.randint(1, 8)),
+                }
+            )
+        data.event_ids = _insert_returning_ids(
+            conn, Event.__table__, event_rows
+        )
+
+        # Invites: log-normal guest lists; accepted invites are participants
+        invite_rows = []
+        participant_rows = []
+        accepted_by_user = {}
+        for event_id, (host_id, _) in zip(data.event_ids, hosts):
+            participant_rows.append(
+                {"event_id": event_id, "user_id": host_id, "role": "host"}
+            )
+            size = _guest_list_size(
+                rng, config.mean_invites, len(data.user_ids) - 1
+            )
+            guests = rng.sample(data.user_ids, size + 1)
+            guests = [user_id for user_id in guests if user_id != host_id]
+            for user_id in guests[:size]:
+                roll = rng.random()
+                if roll < config.accept_ratio:
+                    status = "accepted"
+                elif roll < config.accept_ratio + config.decline_ratio:
+                    status = "declined"
+                else:
+                    status = "pending"
+                role = "cohost" if rng.random() < 0.05 else "participant"
+                invite_rows.append(
+                    {
+                        "event_id": event_id,
+                        "user_id": user_id,
+                        "email": emails[user_id],
+                        "role": role,
+                        "token": str(uuid.uuid4()),
+                        "status": status,
+                    }
+                )
+                if status == "accepted":
+                    participant_rows.append(
+                        {
+                            "event_id": event_id,
+                            "user_id": user_id,
+                            "role": role,
+                        }
+                    )
+                    accepted_by_user[user_id] = (
+                        accepted_by_user.get(user_id, 0) + 1
+                    )
+        _insert(conn, Invite.__table__, invite_rows)
+        _insert(conn, Participant.__table__, participant_rows)
+
+    engine.dispose()
+
+    # The busiest host and guest give the per-user listings realistic sizes
+    hosted = {}
+    for (_, host_email), event_id in zip(hosts, data.event_ids):
+        hosted.setdefault(host_email, []).append(event_id)
+    data.busiest_host_email = max(hosted, key=lambda email: len(hosted[email]))
+    data.host_event_ids = hosted[data.busiest_host_email]
+    registered_ids = {user_id for user_id, _ in registered}
+    guests = [
+        user_id for user_id in accepted_by_user if user_id in registered_ids
+    ]
+    busiest_guest = max(guests, key=accepted_by_user.get, default=None)
+    data.busiest_guest_email = emails.get(
+        busiest_guest, data.busiest_host_email
+    )
+    data.invite_tokens = [row["token"] for row in invite_rows]
+    data.counts = {
+        "users": len(user_rows),
+        "events": len(event_rows),
+        "invites": len(invite_rows),
+        "participants": len(participant_rows),
+    }
+    return data
@@ -0,0 +1,104 @@
+"""
+CPU cost of encoding 1,000-item listings, old path vs new.
+
+The old path is what FastAPI does for a returned dict: validate it against
+the response_model, serialize the model to JSON-ready data, then encode
+that with the stdlib json module. The new path hands the serializer output
+straight to SerializedJSONResponse. No database or server is involved:
+
+    python -m benchmarks.serialization
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+from src.main.schemas import EventPage, InvitePage  # noqa: E402
+from src.main.utils import SerializedJSONResponse  # noqa: E402
+
+
+def event_payload(index: int, now: datetime) -> dict:
+    return {
+        "id": index,
+        "title": f"Benchmark event {index}",
+        "description": "Synthetic event " * 5,
+        "host_id": 1,
+        "host_name": "Benchmark Host",
+        "start_time": now + timedelta(hours=index),
+        "end_time": now + timedelta(hours=index + 3),
+    }
+
+
+def listings(size: int) -> dict:
+    now = datetime.now(timezone.utc)
+    events = [event_payload(index, now) for index in range(size)]
+    invites = [
+        {
+            "id": index,
+            "token": f"{index:036d}",
+            "email": f"guest{index}@bench.example.com",
+            "role": "participant",
+            "status": "pending",
+            "event": events[index % 20],
+            "user_name": None,
+        }
+        for index in range(size)
+    ]
+    return {
+        "EventPage": (EventPage, {"items": events, "next_cursor": None}),
+        "InvitePage": (InvitePage, {"items": invites, "next_cursor": None}),
+    }
+
+
+def validated_response(field, content) -> bytes:
+    data = asyncio.run(
+        serialize_response(
+            field=field, response_content=content, is_coroutine=False
+        )
+    )
+    return JSONResponse(data).body
+
+
+def best_of(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        function()
+        timings.append(time.process_time() - start)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.serialization")
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    report = {}
+    for name, (model, content) in listings(args.items).items():
+        field = create_model_field(
+            name=f"Response_{name}", type_=model, mode="serialization"
+        )
+        old = best_of(lambda: validated_response(field, content), args.repeat)
+        new = best_of(
+            lambda: SerializedJSONResponse(content).body, args.repeat
+        )
+        report[name] = {
+            "items": args.items,
+            "validated_ms": round(old * 1000, 2),
+            "serialized_ms": round(new * 1000, 2),
+            "cpu_saved_ms": round((old - new) * 1000, 2),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,26 @@
 """
 Database setup: creates SQLAlchemy engine, session, and Base for ORM models.
+
+The synchronous engine is always available (alembic, tests, the workers and
+the sync routers use it). An asyncpg-backed AsyncEngine can be initialized
+alongside it for the async routers.
+
+Connection pools are sized and tuned from environment variables (see
+pool_options_from_env) and record checkout wait times for pool_statistics.
+Every engine counts and times its statements for /metrics.
 """
 
+import os
+import time
+
 from sqlalchemy import create_engine
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from src.main.instrumentation import instrument_engine
+from src.main.metrics import Histogram
 
 Base = declarative_base()
 
@@ -11,13 +28,161 @@ Base = declarative_base()
 engine = None
 SessionLocal = None
 
+# Optional read-replica session factory and engine. When unset, read-only
+# endpoints fall back to the primary.
+read_engine = None
+ReadSessionLocal = None
+
+# Async session factories and engines, only set when the async path is
+# enabled
+async_engine = None
+AsyncSessionLocal = None
+async_read_engine = None
+AsyncReadSessionLocal = None
+
+
+class _CheckoutTimingMixin:
+    """
+    Records how long each connection checkout waits on the pool, and how
+    many checkouts give up with a pool TimeoutError.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_wait = Histogram()
+        self.checkout_timeouts = 0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except sa_exc.TimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            self.checkout_wait.observe(time.perf_counter() - start)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+def pool_options_from_env() -> dict:
+    """
+    Pool settings for create_engine, read from DB_POOL_* variables. Defaults
+    match SQLAlchemy's, except pre-ping and a 30 minute recycle are on so
+    connections broken by a Postgres failover are replaced transparently.
+    """
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_POOL_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", "true"),
+        "pool_use_lifo": _env_bool("DB_POOL_USE_LIFO", "false"),
+    }
+
+
+def _engine_options(database_url: str, poolclass) -> dict:
+    # SQLite (used by some local tooling) does not take QueuePool options
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return {}
+    return {"poolclass": poolclass, **pool_options_from_env()}
+
 
 def init_engine_and_session(database_url: str):
     global engine, SessionLocal
-    engine = create_engine(database_url)
+    engine = create_engine(
+        database_url, **_engine_options(database_url, InstrumentedQueuePool)
+    )
+    instrument_engine(engine, "primary")
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def init_read_engine_and_session(replica_url: str):
+    global read_engine, ReadSessionLocal
+    read_engine = create_engine(
+        replica_url, **_engine_options(replica_url, InstrumentedQueuePool)
+    )
+    instrument_engine(read_engine, "replica")
+    ReadSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, bind=read_engine
+    )
+
+
+def to_async_database_url(database_url: str) -> str:
+    """
+    Rewrite a postgresql:// or postgresql+psycopg2:// URL to use asyncpg.
+    """
+    url = make_url(database_url)
+    if url.drivername in ("postgresql", "postgresql+psycopg2"):
+        url = url.set(drivername="postgresql+asyncpg")
+    return url.render_as_string(hide_password=False)
+
+
+def _create_async_engine(database_url: str, name: str):
+    async_url = to_async_database_url(database_url)
+    new_engine = create_async_engine(
+        async_url, **_engine_options(async_url, InstrumentedAsyncQueuePool)
+    )
+    instrument_engine(new_engine.sync_engine, name)
+    return new_engine
+
+
+def init_async_engine_and_session(database_url: str, replica_url: str = None):
+    global async_engine, AsyncSessionLocal
+    global async_read_engine, AsyncReadSessionLocal
+    async_engine = _create_async_engine(database_url, "async")
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+    if replica_url:
+        async_read_engine = _create_async_engine(replica_url, "async_replica")
+        AsyncReadSessionLocal = async_sessionmaker(
+            bind=async_read_engine, autoflush=False, expire_on_commit=False
+        )
+
+
+def initialized_pools() -> dict:
+    """
+    The connection pool of every initialized engine, by engine name.
+    """
+    pools = {}
+    if engine is not None:
+        pools["primary"] = engine.pool
+    if read_engine is not None:
+        pools["replica"] = read_engine.pool
+    if async_engine is not None:
+        pools["async"] = async_engine.sync_engine.pool
+    if async_read_engine is not None:
+        pools["async_replica"] = async_read_engine.sync_engine.pool
+    return pools
+
+
+def pool_statistics(pool) -> dict:
+    """
+    Snapshot of a pool's occupancy and checkout wait-time histogram.
+    """
+    if not isinstance(pool, _CheckoutTimingMixin):
+        return {"status": pool.status()}
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checkout_timeouts": pool.checkout_timeouts,
+        "checkout_wait_seconds": pool.checkout_wait.snapshot(),
+    }
+
+
 def get_db():
     if SessionLocal is None:
         raise RuntimeError(
@@ -30,6 +195,82 @@ def get_db():
         db.close()
 
 
+def read_session():
+    """
+    New session on the replica if one is configured, otherwise the primary.
+    """
+    session_factory = ReadSessionLocal or SessionLocal
+    if session_factory is None:
+        raise RuntimeError(
+            "SessionLocal is not initialized. Call init_engine_and_session(database_url) first."
+        )
+    return session_factory()
+
+
+def get_read_db():
+    """
+    Session for read-only endpoints: the replica if one is configured,
+    otherwise the primary. Paths that must read their own writes should keep
+    using get_db.
+    """
+    db = read_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError(
+            "AsyncSessionLocal is not initialized. Call init_async_engine_and_session(database_url) first."
+        )
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def async_read_session():
+    """
+    New AsyncSession on the replica if one is configured, otherwise the
+    primary.
+    """
+    session_factory = AsyncReadSessionLocal or AsyncSessionLocal
+    if session_factory is None:
+        raise RuntimeError(
+            "AsyncSessionLocal is not initialized. Call init_async_engine_and_session(database_url) first."
+        )
+    return session_factory()
+
+
+async def get_async_read_db():
+    async with async_read_session() as db:
+        yield db
+
+
+async def run_sync_handler(db, handler, *args, **kwargs):
+    """
+    Runs a sync route handler on an AsyncSession, passing the session as
+    its db argument. Its statements go through the async driver, so the
+    request waits on Postgres without holding a threadpool worker. Lazy
+    loads inside the handler work as usual.
+    """
+    return await db.run_sync(
+        lambda session: handler(*args, db=session, **kwargs)
+    )
+
+
+async def dispose_async_engine():
+    global async_engine, AsyncSessionLocal
+    global async_read_engine, AsyncReadSessionLocal
+    for pending in (async_engine, async_read_engine):
+        if pending is not None:
+            await pending.dispose()
+    async_engine = None
+    AsyncSessionLocal = None
+    async_read_engine = None
+    AsyncReadSessionLocal = None
+
+
 def create_tables():
     if engine is None:
         raise RuntimeError(
@@ -0,0 +1,236 @@
+"""
+Request and SQL instrumentation exported at /metrics.
+
+MetricsMiddleware times each request by its route template, and the
+listeners added by instrument_engine attribute every SQL statement to the
+request that issued it, so per-endpoint query counts show up as soon as an
+N+1 pattern creeps in.
+
+In development and tests, SQL_INSPECT=log|raise additionally fingerprints
+each request's statements and reports requests that repeat one statement
+shape more than SQL_INSPECT_MAX_REPEATS times (the N+1 signature) or spend
+more than SQL_INSPECT_BUDGET_MS in the database.
+"""
+
+import logging
+import os
+import re
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from src.main.metrics import CounterFamily, GaugeFamily, HistogramFamily
+
+logger = logging.getLogger(__name__)
+
+# Statement counts are small integers, so they get their own buckets
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100, 250, 1000)
+
+HTTP_REQUESTS = CounterFamily(
+    "http_requests_total",
+    "HTTP requests handled, by route template and status code.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = HistogramFamily(
+    "http_request_duration_seconds",
+    "HTTP request latency, including streamed bodies.",
+    ("method", "route"),
+)
+HTTP_REQUESTS_IN_PROGRESS = GaugeFamily(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled.",
+    ("method",),
+)
+HTTP_REQUEST_DB_QUERIES = HistogramFamily(
+    "http_request_db_queries",
+    "SQL statements issued per HTTP request.",
+    ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+HTTP_REQUEST_DB_DURATION = HistogramFamily(
+    "http_request_db_duration_seconds",
+    "Time spent executing SQL per HTTP request.",
+    ("method", "route"),
+)
+DB_QUERIES = CounterFamily(
+    "db_queries_total",
+    "SQL statements executed, including background work.",
+    ("engine",),
+)
+DB_QUERY_DURATION = HistogramFamily(
+    "db_query_duration_seconds",
+    "SQL statement execution time.",
+    ("engine",),
+)
+
+
+class QueryStats:
+    """
+    SQL statements and time accumulated by one request.
+    """
+
+    __slots__ = ("path", "count", "duration", "shapes")
+
+    def __init__(self, path: str = ""):
+        self.path = path
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = {}
+
+
+class QueryInspectionError(RuntimeError):
+    """
+    Raised in SQL_INSPECT=raise mode when a request breaks the N+1 or time
+    budget.
+    """
+
+
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|\$\d+|\?")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint_statement(statement: str) -> str:
+    """
+    Normalizes a statement to its shape: parameters and literals become ?,
+    IN lists collapse to one entry and whitespace is squeezed.
+    """
+
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _LITERAL.sub("?", shape)
+    shape = _VALUE_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryInspector:
+    """
+    Per-request N+1 and DB time checks. mode is "off", "log" or "raise".
+    """
+
+    def __init__(self, mode: str, max_repeats: int, budget_ms: float):
+        self.configure(mode, max_repeats, budget_ms)
+
+    def configure(self, mode=None, max_repeats=None, budget_ms=None):
+        if mode is not None:
+            if mode not in ("off", "log", "raise"):
+                raise ValueError(f"Unknown SQL_INSPECT mode: {mode}")
+            self.mode = mode
+        if max_repeats is not None:
+            self.max_repeats = max_repeats
+        if budget_ms is not None:
+            self.budget_ms = budget_ms
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def _report(self, message: str):
+        if self.mode == "raise":
+            raise QueryInspectionError(message)
+        logger.warning(message)
+
+    def check_statement(self, stats: QueryStats, statement: str):
+        shape = fingerprint_statement(statement)
+        repeats = stats.shapes.get(shape, 0) + 1
+        stats.shapes[shape] = repeats
+        # Report once per shape, on the first repeat over the limit
+        if repeats == self.max_repeats + 1:
+            self._report(
+                f"{stats.path} ran the same statement more than "
+                f"{self.max_repeats} times (likely N+1): {shape}"
+            )
+
+    def check_request(self, stats: QueryStats):
+        duration_ms = stats.duration * 1000
+        if duration_ms > self.budget_ms:
+            self._report(
+                f"{stats.path} spent {duration_ms:.1f} ms in {stats.count} "
+                f"SQL statements (budget {self.budget_ms:.0f} ms)"
+            )
+
+
+query_inspector = QueryInspector(
+    mode=os.getenv("SQL_INSPECT", "off").lower(),
+    max_repeats=int(os.getenv("SQL_INSPECT_MAX_REPEATS", "5")),
+    budget_ms=float(os.getenv("SQL_INSPECT_BUDGET_MS", "500")),
+)
+
+
+# The stats object of the request being handled, shared with the threadpool
+# and greenlets that run its queries
+current_query_stats: ContextVar = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def instrument_engine(engine, name: str):
+    """
+    Counts and times every statement run on a (sync) engine. For an
+    AsyncEngine pass its sync_engine.
+    """
+
+    counter = DB_QUERIES.labels(name)
+    histogram = DB_QUERY_DURATION.labels(name)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, many):
+        context._metrics_started_at = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _record_query(conn, cursor, statement, parameters, context, many):
+        elapsed = time.perf_counter() - context._metrics_started_at
+        counter.inc()
+        histogram.observe(elapsed)
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.duration += elapsed
+            if query_inspector.enabled:
+                query_inspector.check_statement(stats, statement)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request counts, latency, in-flight requests
+    and per-request SQL usage. Requests that match no route share one label
+    so scanners can't blow up the series count.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        stats = QueryStats(scope["path"])
+        token = current_query_stats.set(stats)
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            current_query_stats.reset(token)
+            route = scope.get("route")
+            path = route.path if route is not None else "unmatched"
+            HTTP_REQUESTS.labels(method, path, status["code"]).inc()
+            HTTP_REQUEST_DURATION.labels(method, path).observe(elapsed)
+            HTTP_REQUEST_DB_QUERIES.labels(method, path).observe(stats.count)
+            HTTP_REQUEST_DB_DURATION.labels(method, path).observe(
+                stats.duration
+            )
+        if query_inspector.enabled:
+            query_inspector.check_request(stats)
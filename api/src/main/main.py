@@ -3,28 +3,55 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from src.main.database import engine, init_engine_and_session
+from fastapi.responses import ORJSONResponse
+from src.main.database import (
+    dispose_async_engine,
+    engine,
+    init_async_engine_and_session,
+    init_engine_and_session,
+    init_read_engine_and_session,
+)
+from src.main.instrumentation import MetricsMiddleware
 from src.main.routers import (
+    async_auth_router,
+    async_calendar_router,
+    async_invite_router,
+    async_private_event_router,
+    async_public_event_router,
+    async_user_router,
     auth_router,
+    calendar_router,
+    internal_router,
     invite_router,
+    metrics_router,
     private_event_router,
     public_event_router,
     user_router,
 )
 
+# Serve the async router variants from the asyncpg engine when enabled. The
+# sync engine is still initialized for the workers' background tasks.
+DATABASE_ASYNC = os.getenv("DATABASE_ASYNC", "false").lower() == "true"
+
 
 # Initialize database engine and session
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
     if engine is None:
-        DATABASE_URL = os.getenv("DATABASE_URL")
         if DATABASE_URL:
             init_engine_and_session(DATABASE_URL)
+            if DATABASE_REPLICA_URL:
+                init_read_engine_and_session(DATABASE_REPLICA_URL)
+    if DATABASE_ASYNC and DATABASE_URL:
+        init_async_engine_and_session(DATABASE_URL, DATABASE_REPLICA_URL)
     yield
+    await dispose_async_engine()
 
 
 # Initialize the FastAPI app
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Configure app middleware
 app.add_middleware(
@@ -41,10 +68,24 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
 
 # Register all routes from each router with the app
-app.include_router(auth_router.router)
-app.include_router(invite_router.router)
-app.include_router(private_event_router.router)
-app.include_router(public_event_router.router)
-app.include_router(user_router.router)
+if DATABASE_ASYNC:
+    app.include_router(async_auth_router.router)
+    app.include_router(async_calendar_router.router)
+    app.include_router(internal_router.router)
+    app.include_router(async_invite_router.router)
+    app.include_router(metrics_router.router)
+    app.include_router(async_private_event_router.router)
+    app.include_router(async_public_event_router.router)
+    app.include_router(async_user_router.router)
+else:
+    app.include_router(auth_router.router)
+    app.include_router(calendar_router.router)
+    app.include_router(internal_router.router)
+    app.include_router(invite_router.router)
+    app.include_router(metrics_router.router)
+    app.include_router(private_event_router.router)
+    app.include_router(public_event_router.router)
+    app.include_router(user_router.router)
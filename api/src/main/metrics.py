@@ -0,0 +1,199 @@
+"""
+Lightweight in-process metric primitives.
+
+Kept free of application imports so that database.py can record pool
+statistics without a circular dependency on src.main.utils.
+
+Labeled families register themselves in REGISTRY and are rendered in the
+Prometheus text exposition format by render_metrics.
+"""
+
+import threading
+from bisect import bisect_left
+
+# Seconds; tuned for connection checkout waits and request latencies
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed upper bounds, Prometheus style.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets, counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = cumulative + counts[-1]
+        return {"buckets": buckets, "count": buckets["+Inf"], "sum": total}
+
+
+# Families exported by render_metrics, in registration order
+REGISTRY = []
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Value:
+    """
+    Thread-safe float used for counter and gauge samples.
+    """
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+    def set(self, value: float):
+        with self._lock:
+            self._value = value
+
+    def get(self) -> float:
+        with self._lock:
+            return self._value
+
+
+class _Family:
+    """
+    A named metric with one child per combination of label values.
+    """
+
+    type = None
+
+    def __init__(self, name, documentation, labelnames=(), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+        (REGISTRY if registry is None else registry).append(self)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _label_text(self, values, extra=()):
+        pairs = list(zip(self.labelnames, values)) + list(extra)
+        if not pairs:
+            return ""
+        inner = ",".join(
+            f'{name}="{_escape_label(value)}"' for name, value in pairs
+        )
+        return "{" + inner + "}"
+
+    def _samples(self, values, child):
+        raise NotImplementedError
+
+    def render(self) -> list:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        with self._lock:
+            children = sorted(self._children.items())
+        for values, child in children:
+            lines.extend(self._samples(values, child))
+        return lines
+
+
+class CounterFamily(_Family):
+    type = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def _samples(self, values, child):
+        return [f"{self.name}{self._label_text(values)} {child.get()}"]
+
+
+class GaugeFamily(CounterFamily):
+    type = "gauge"
+
+
+class HistogramFamily(_Family):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name,
+        documentation,
+        labelnames=(),
+        buckets=DEFAULT_BUCKETS,
+        registry=None,
+    ):
+        self.buckets = buckets
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        return Histogram(self.buckets)
+
+    def _samples(self, values, child):
+        snapshot = child.snapshot()
+        lines = [
+            f"{self.name}_bucket"
+            f"{self._label_text(values, [('le', bound)])} {count}"
+            for bound, count in snapshot["buckets"].items()
+        ]
+        labels = self._label_text(values)
+        lines.append(f"{self.name}_sum{labels} {snapshot['sum']}")
+        lines.append(f"{self.name}_count{labels} {snapshot['count']}")
+        return lines
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_metrics(registry=None) -> str:
+    """
+    Renders every registered family in the Prometheus text format.
+    """
+
+    lines = []
+    for family in REGISTRY if registry is None else registry:
+        lines.extend(family.render())
+    return "\n".join(lines) + "\n"
@@ -1,3 +1,5 @@
+from .email_outbox import *
 from .event import *
 from .invite import *
+from .invite_import import *
 from .user import *
@@ -0,0 +1,45 @@
+"""
+SQLAlchemy ORM model for the transactional email outbox.
+
+Emails are written to the email_outbox table in the same transaction as the
+change that triggers them and delivered later by the email worker.
+"""
+
+from sqlalchemy import (
+    TIMESTAMP,
+    Column,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
+from src.main.database import Base
+
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # The worker's scan for messages that are due
+        Index(
+            "ix_email_outbox_due",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+    # pending -> sent, or pending -> dead after too many failed attempts
+    status = Column(String, nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    next_attempt_at = Column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
+    )
+    created_at = Column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
+    )
+    sent_at = Column(TIMESTAMP(timezone=True), nullable=True)
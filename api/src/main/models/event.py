@@ -5,35 +5,89 @@ Defines the structure of the events and participants, and invites tables in
 the database, including columns and constraints.
 """
 
-from sqlalchemy import TIMESTAMP, Column, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    TIMESTAMP,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import backref, relationship
 from src.main.database import Base
 
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # A host's events ordered by start time
+        Index("ix_events_host_id_start_time", "host_id", "start_time"),
+        # The scheduler's scans for upcoming and recently started events
+        Index("ix_events_start_time", "start_time"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     start_time = Column(TIMESTAMP(timezone=True), nullable=False)
     end_time = Column(TIMESTAMP(timezone=True), nullable=False)
+    # Bumped on every update; a cheap version marker for caches and feeds
+    updated_at = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    # Bumped whenever the accepted participant list changes
+    participants_version = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Invites per status, kept in step by the invite endpoints and repaired
+    # by the invite_counter_worker
+    pending_count = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    accepted_count = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    declined_count = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Set once the scheduler has queued the event's reminder emails
+    reminder_sent_at = Column(TIMESTAMP(timezone=True), nullable=True)
     host_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
+    # The foreign keys cascade in the database, so deletes don't load these
+    # collections (passive_deletes)
     host = relationship(
-        "User", backref=backref("hosted_events", cascade="all, delete-orphan")
+        "User",
+        backref=backref(
+            "hosted_events", cascade="all, delete-orphan", passive_deletes=True
+        ),
     )
     participants = relationship(
-        "Participant", back_populates="event", cascade="all, delete-orphan"
+        "Participant",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     invites = relationship(
-        "Invite", back_populates="event", cascade="all, delete-orphan"
+        "Invite",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
 # many-to-many relationship between Event and User
 class Participant(Base):
     __tablename__ = "participants"
+    __table_args__ = (
+        # The primary key leads with event_id, so lookups by user need this
+        Index("ix_participants_user_id", "user_id"),
+    )
     event_id = Column(
         Integer, ForeignKey("events.id", ondelete="CASCADE"), primary_key=True
     )
@@ -44,5 +98,9 @@ class Participant(Base):
     event = relationship("Event", back_populates="participants")
     user = relationship(
         "User",
-        backref=backref("event_participations", cascade="all, delete-orphan"),
+        backref=backref(
+            "event_participations",
+            cascade="all, delete-orphan",
+            passive_deletes=True,
+        ),
     )
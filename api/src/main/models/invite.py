@@ -5,13 +5,28 @@ Defines the structure of the invites table in the database, including columns
 and constraints.
 """
 
-from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import relationship
 from src.main.database import Base
 
 
 class Invite(Base):
     __tablename__ = "invites"
+    __table_args__ = (
+        # Participant lists and per-event status filters
+        Index("ix_invites_event_id_status", "event_id", "status"),
+        # One invite per email per event; also the conflict target for bulk
+        # invites
+        Index("uq_invites_event_id_email", "event_id", "email", unique=True),
+        # An invitee's invites filtered by status
+        Index("ix_invites_user_id_status", "user_id", "status"),
+        # Linking invites to a user when they register
+        Index(
+            "ix_invites_email_unlinked",
+            "email",
+            postgresql_where=text("user_id IS NULL"),
+        ),
+    )
     id = Column(Integer, primary_key=True, index=True)
     event_id = Column(
         Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False
@@ -22,6 +37,8 @@ class Invite(Base):
     email = Column(String, nullable=False)
     role = Column(String, nullable=False)
     token = Column(String, unique=True, nullable=False)
+    # pending -> accepted or declined, or pending -> expired once the event
+    # has started
     status = Column(String, nullable=False, default="pending")
     event = relationship("Event", back_populates="invites")
     user = relationship("User", back_populates="invites")
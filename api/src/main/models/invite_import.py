@@ -0,0 +1,40 @@
+"""
+SQLAlchemy ORM model for InviteImport entities.
+
+Tracks the progress and per-row errors of a guest-list CSV import while it
+runs in the background.
+"""
+
+from sqlalchemy import (
+    JSON,
+    TIMESTAMP,
+    Column,
+    ForeignKey,
+    Integer,
+    String,
+    func,
+)
+from src.main.database import Base
+
+
+class InviteImport(Base):
+    __tablename__ = "invite_imports"
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(
+        Integer,
+        ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # processing -> completed, or processing -> failed
+    status = Column(String, nullable=False, default="processing")
+    processed_rows = Column(Integer, nullable=False, default=0)
+    created_count = Column(Integer, nullable=False, default=0)
+    skipped_count = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)
+    # The first errors found, as {"row", "email", "error"} dicts
+    errors = Column(JSON, nullable=False, default=list)
+    created_at = Column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
+    )
+    finished_at = Column(TIMESTAMP(timezone=True), nullable=True)
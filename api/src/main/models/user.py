@@ -18,6 +18,10 @@ class User(Base):
     first_name = Column(String, nullable=True)
     last_name = Column(String, nullable=True)
     is_registered = Column(Boolean, default=False, nullable=False)
+    # The foreign keys cascade in the database (passive_deletes)
     invites = relationship(
-        "Invite", back_populates="user", cascade="all, delete-orphan"
+        "Invite",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
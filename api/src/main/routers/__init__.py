@@ -1,5 +1,14 @@
+from .async_auth_router import *
+from .async_calendar_router import *
+from .async_invite_router import *
+from .async_private_event_router import *
+from .async_public_event_router import *
+from .async_user_router import *
 from .auth_router import *
+from .calendar_router import *
+from .internal_router import *
 from .invite_router import *
+from .metrics_router import *
 from .private_event_router import *
 from .public_event_router import *
 from .user_router import *
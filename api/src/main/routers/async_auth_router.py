@@ -0,0 +1,73 @@
+"""
+Async variant of the authentication endpoints, backed by the asyncpg engine.
+
+Mounted in place of auth_router when DATABASE_ASYNC is enabled. Password
+checks run on the password pool while the request awaits it.
+"""
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.main.database import get_async_db
+from src.main.models import User
+from src.main.schemas import UserRequest, UserResponse
+from src.main.utils import (
+    hash_password_async,
+    password_needs_rehash,
+    set_jwt_cookie_response,
+    verify_password_async,
+)
+
+from . import auth_router
+
+router = APIRouter(tags=["Authentication"], prefix="/api/auth")
+
+
+@router.post("/signin", response_model=UserResponse)
+async def signin(
+    user_request: UserRequest, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Sign in a user with email and password.
+    """
+    # Try to get the user from the database. Return error if not found.
+    user = await db.scalar(
+        select(User).where(User.email == user_request.email)
+    )
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+        )
+
+    # Verify the user's password. Return error if incorrect.
+    if not await verify_password_async(
+        user_request.password, user.hashed_password
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+        )
+
+    # Upgrade the stored hash if the configured work factor has changed
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password_async(user_request.password)
+        await db.commit()
+
+    # Sign in the user by setting the JWT cookie. Return user details.
+    return set_jwt_cookie_response(user, response_model=UserResponse)
+
+
+@router.delete("/signout")
+async def signout(request: Request, response: Response):
+    """
+    Sign out the current user by deleting the JWT cookie.
+    """
+    return auth_router.signout(request, response)
@@ -0,0 +1,94 @@
+"""
+Async variant of the calendar feed endpoints, backed by the asyncpg engine.
+
+Mounted in place of calendar_router when DATABASE_ASYNC is enabled. The
+feed is streamed from an asyncpg server-side cursor.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.main.database import async_read_session, get_async_read_db
+from src.main.models import Event, User
+from src.main.schemas import CalendarFeedOut
+from src.main.utils import (
+    ICS_FOOTER,
+    ICS_HEADER,
+    decode_jwt_token,
+    etag_matches,
+    get_async_current_user_from_token,
+    make_etag,
+    serialize_vevent,
+)
+
+from . import calendar_router
+from .calendar_router import FEED_YIELD_PER, user_events_filter
+
+router = APIRouter(tags=["Calendar"], prefix="/api/calendar")
+
+
+async def stream_calendar_feed(user_id: int):
+    """
+    Yields the feed one VEVENT at a time from a server-side cursor. Uses its
+    own session because the body is streamed after the endpoint returns.
+    """
+    async with async_read_session() as db:
+        yield ICS_HEADER
+        events = await db.stream_scalars(
+            select(Event)
+            .where(user_events_filter(user_id))
+            .order_by(Event.start_time, Event.id)
+            .execution_options(yield_per=FEED_YIELD_PER)
+        )
+        async for event in events:
+            yield serialize_vevent(event)
+        yield ICS_FOOTER
+
+
+@router.get("/feed", response_model=CalendarFeedOut)
+async def get_calendar_feed_url(
+    request: Request, user: User = Depends(get_async_current_user_from_token)
+):
+    """
+    Get the private calendar subscription URL for the current user.
+    """
+    return calendar_router.get_calendar_feed_url(request, user)
+
+
+@router.get("/{token}.ics", response_class=StreamingResponse)
+async def get_calendar_feed(
+    token: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Stream a user's hosted and participating events as an iCalendar feed.
+    """
+    payload = decode_jwt_token(token)
+    if not payload or payload.get("scope") != "calendar":
+        raise HTTPException(status_code=404, detail="Calendar not found.")
+    user_id = payload["uid"]
+
+    # One aggregate query serves as the version marker for the whole feed
+    count, last_updated, id_sum = (
+        await db.execute(
+            select(
+                func.count(Event.id),
+                func.max(Event.updated_at),
+                func.sum(Event.id),
+            ).where(user_events_filter(user_id))
+        )
+    ).one()
+    etag = make_etag(user_id, count, last_updated, id_sum)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    return StreamingResponse(
+        stream_calendar_feed(user_id),
+        media_type="text/calendar; charset=utf-8",
+        headers=headers,
+    )
@@ -0,0 +1,205 @@
+"""
+Async variant of the invite endpoints, backed by the asyncpg engine.
+
+Mounted in place of invite_router when DATABASE_ASYNC is enabled. Each
+endpoint runs the sync implementation on an AsyncSession with
+run_sync_handler, except that uploads are copied off the event loop.
+Writers that drop cached pages use run_sync_writer, which applies the
+invalidations through the cache's async interface.
+"""
+
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+)
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.main.database import get_async_db, get_async_read_db, run_sync_handler
+from src.main.models.event import Event
+from src.main.models.invite_import import InviteImport
+from src.main.models.user import User
+from src.main.schemas.invite_schema import (
+    InviteBulkCreate,
+    InviteBulkResult,
+    InviteCreate,
+    InviteImportOut,
+    InviteOut,
+    InvitePage,
+    InviteStatusUpdate,
+)
+from src.main.utils import (
+    get_async_current_user_from_token,
+    run_invite_import,
+    run_sync_writer,
+    save_invite_upload,
+)
+
+from . import invite_router
+
+router = APIRouter(tags=["Invites"], prefix="/api/invites")
+
+
+@router.post(
+    "/",
+    response_model=InviteOut,
+    summary="Invite a participant",
+)
+async def create_invite(
+    invite_details: InviteCreate = Body(...),
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Create a new invite for a participant to an event.
+    """
+    return await run_sync_handler(
+        db, invite_router.create_invite, invite_details, user=user
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=list[InviteBulkResult],
+    summary="Invite many participants to an event",
+)
+async def create_invites_bulk(
+    bulk_details: InviteBulkCreate = Body(...),
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Create invites for a list of emails in a single transaction.
+    """
+    return await run_sync_handler(
+        db, invite_router.create_invites_bulk, bulk_details, user=user
+    )
+
+
+@router.post(
+    "/import",
+    response_model=InviteImportOut,
+    status_code=202,
+    summary="Import a guest list from a CSV file",
+)
+async def import_invites(
+    background_tasks: BackgroundTasks,
+    event_id: int = Query(..., description="Event to invite guests to"),
+    file: UploadFile = File(..., description="CSV of email[,role] rows"),
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Start importing a guest list CSV. Rows are validated and invited in
+    batches in the background; poll the returned import for progress.
+    """
+    # Only the host can invite participants
+    hosted_event_id = await db.scalar(
+        select(Event.id).where(Event.id == event_id, Event.host_id == user.id)
+    )
+    if hosted_event_id is None:
+        raise HTTPException(status_code=403, detail="Not authorized.")
+
+    # Copy the spooled upload to a file the background task owns
+    path = await run_in_threadpool(save_invite_upload, file)
+
+    job = InviteImport(event_id=hosted_event_id, errors=[])
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    background_tasks.add_task(run_invite_import, job.id, path)
+    return job
+
+
+@router.get(
+    "/imports/{import_id}",
+    response_model=InviteImportOut,
+    summary="Get the progress of a guest list import",
+)
+async def get_invite_import(
+    import_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Fetch the progress and row errors of a guest list import.
+    """
+    return await run_sync_handler(
+        db, invite_router.get_invite_import, import_id, user=user
+    )
+
+
+@router.put(
+    "/{token}",
+    response_model=InviteOut,
+    summary="Respond to an invite (accept or decline)",
+)
+async def update_invite(
+    token: str,
+    status_update: InviteStatusUpdate = Body(
+        ..., examples={"status": "accepted"}
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Respond to an invite by accepting or declining, in a single transaction.
+    Repeating the same response (e.g. a double-click) returns the invite
+    unchanged.
+    """
+    return await run_sync_writer(
+        db, invite_router.update_invite, token, status_update
+    )
+
+
+@router.delete("/{invite_id}", status_code=204)
+async def delete_invite(
+    invite_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Delete an invite by its ID.
+    """
+    return await run_sync_writer(
+        db, invite_router.delete_invite, invite_id, user=user
+    )
+
+
+@router.get("/", response_model=InvitePage)
+async def get_invites(
+    status: str = Query(
+        None,
+        description="Invite status: pending, accepted, declined, expired, "
+        "all",
+    ),
+    user_id: int = Query(None, description="Filter by user_id"),
+    event_id: int = Query(None, description="Filter by event_id"),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    db: AsyncSession = Depends(get_async_read_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Fetch a page of invites filtered by user_id, event_id, and status,
+    ordered by id. If no user_id is provided, defaults to current user.
+    """
+    return await run_sync_handler(
+        db,
+        invite_router.get_invites,
+        status,
+        user_id,
+        event_id,
+        limit,
+        cursor,
+        user=user,
+    )
@@ -0,0 +1,172 @@
+"""
+Async variant of the private event endpoints, backed by the asyncpg engine.
+
+Mounted in place of private_event_router when DATABASE_ASYNC is enabled.
+Each endpoint runs the sync implementation on an AsyncSession with
+run_sync_handler, so both variants share one set of queries and the request
+waits on Postgres without holding a threadpool worker. Writers that drop
+cached pages use run_sync_writer, which applies the invalidations through
+the cache's async interface.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.main.database import get_async_db, get_async_read_db, run_sync_handler
+from src.main.models import Event, User
+from src.main.schemas import EventCreate, EventOut, EventPage, EventSummaryOut
+from src.main.utils import (
+    get_async_current_user_from_token,
+    get_event_change_broker,
+    run_sync_writer,
+    serialize_invite_counts,
+    stream_event_changes,
+)
+
+from . import private_event_router
+
+router = APIRouter(tags=["PrivateEvents"], prefix="/api/private/events")
+
+
+@router.post("/", response_model=EventOut)
+async def create_event(
+    event_details: EventCreate,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Create a new event hosted by the current user.
+    """
+    return await run_sync_handler(
+        db, private_event_router.create_event, event_details, user=user
+    )
+
+
+@router.get("/", response_model=EventPage)
+async def get_events(
+    role: str = "participant",
+    time: str = "all",
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    db: AsyncSession = Depends(get_async_read_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Fetch a page of events for the current user based on the 'role' query
+    parameter, ordered by start time.
+    """
+    return await run_sync_handler(
+        db,
+        private_event_router.get_events,
+        role,
+        time,
+        limit,
+        cursor,
+        user=user,
+    )
+
+
+@router.get("/{event_id}", response_model=EventOut)
+async def get_event_by_id(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Retrieve a specific event for the current user.
+    """
+    return await run_sync_handler(
+        db, private_event_router.get_event_by_id, event_id, user=user
+    )
+
+
+@router.get("/{event_id}/summary", response_model=EventSummaryOut)
+async def get_event_summary(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_read_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Retrieve the invite counts of an event hosted by the current user.
+    """
+    return await run_sync_handler(
+        db, private_event_router.get_event_summary, event_id, user=user
+    )
+
+
+async def get_event_stream_snapshot(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_async_current_user_from_token),
+) -> dict:
+    """
+    Async variant of private_event_router.get_event_stream_snapshot.
+    """
+    db_event = await db.scalar(
+        select(Event).where(Event.id == event_id, Event.host_id == user.id)
+    )
+    if not db_event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
+        )
+    snapshot = {
+        "event_id": db_event.id,
+        "type": "snapshot",
+        "action": None,
+        "data": {"invite_counts": serialize_invite_counts(db_event)},
+    }
+    # Return the connection now; the stream may stay open for hours
+    await db.close()
+    return snapshot
+
+
+@router.get("/{event_id}/stream", response_class=StreamingResponse)
+async def stream_event(
+    request: Request,
+    event_id: int,
+    snapshot: dict = Depends(get_event_stream_snapshot),
+):
+    """
+    Stream live invite and participant changes of an event hosted by the
+    current user as Server-Sent Events.
+    """
+    queue = await get_event_change_broker().subscribe(event_id)
+    return StreamingResponse(
+        stream_event_changes(request, event_id, snapshot, queue),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.put("/{event_id}", response_model=EventOut)
+async def update_event(
+    event_id: int,
+    event_data: EventCreate,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Update an existing event hosted by the current user.
+    """
+    return await run_sync_writer(
+        db, private_event_router.update_event, event_id, event_data, user=user
+    )
+
+
+@router.delete("/{event_id}")
+async def delete_event(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Delete an event hosted by the current user.
+    """
+    return await run_sync_writer(
+        db, private_event_router.delete_event, event_id, user=user
+    )
@@ -0,0 +1,131 @@
+"""
+Async variant of the public event endpoints, backed by the asyncpg engine.
+
+Mounted in place of public_event_router when DATABASE_ASYNC is enabled, so
+these unauthenticated, heavily shared links do not hold a threadpool worker
+while waiting on Postgres.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from src.main.database import get_async_db
+from src.main.models import Event, Invite
+from src.main.schemas import EventOut, ParticipantOut
+from src.main.utils import (
+    SerializedJSONResponse,
+    cache_event_page_async,
+    cache_participants_async,
+    etag_matches,
+    event_etag,
+    get_cached_event_page_async,
+    get_cached_participants_async,
+    participants_etag,
+    public_cache_headers,
+    serialize_event_summary,
+    serialize_participantout,
+)
+
+router = APIRouter(tags=["PublicEvents"], prefix="/api/public/events")
+
+
+@router.get("/token/{token}", response_model=EventOut)
+async def get_event_by_token(
+    token: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve event details using an invite token.
+
+    Args:
+        token (str): Invite token from the URL.
+        if_none_match (Optional[str]): ETag from a cached copy, if any.
+        db (AsyncSession): Async database session.
+
+    Returns:
+        EventOut: The event associated with the invite token, or 304 Not
+            Modified if the client's copy is current.
+
+    Raises:
+        HTTPException: If the invite or event is not found or invalid.
+    """
+    # Serve the cached page if there is one. Misses read the primary, since
+    # a lagging replica would cache the old page until it expires.
+    page = await get_cached_event_page_async(token)
+    if page is None:
+        event = await db.scalar(
+            select(Event)
+            .join(Invite, Invite.event_id == Event.id)
+            .options(joinedload(Event.host))
+            .filter(Invite.token == token)
+        )
+        if not event:
+            raise HTTPException(
+                status_code=404, detail="Invalid or expired invite token."
+            )
+        page = await cache_event_page_async(
+            token,
+            event.id,
+            event_etag(event, event.host),
+            serialize_event_summary(event, event.host, with_counts=False),
+        )
+
+    # Skip the body if the client already has this version
+    headers = public_cache_headers(page["etag"])
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return SerializedJSONResponse(page["body"], headers=headers)
+
+
+@router.get("/{event_id}/participants", response_model=list[ParticipantOut])
+async def get_participants(
+    event_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve the list of accepted participants for a public event.
+
+    Args:
+        event_id (int): ID of the event to fetch participants for.
+        if_none_match (Optional[str]): ETag from a cached copy, if any.
+        db (AsyncSession): Async database session.
+
+    Returns:
+        List[ParticipantOut]: Accepted participants for the event, or 304
+            Not Modified if the client's copy is current.
+    """
+    # Serve the cached list if there is one. Misses read the primary, since
+    # a lagging replica would cache the old list until it expires.
+    page = await get_cached_participants_async(event_id)
+    if page is not None:
+        headers = public_cache_headers(page["etag"])
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        return SerializedJSONResponse(page["body"], headers=headers)
+
+    # Check the participant list version before loading it
+    version = await db.scalar(
+        select(Event.participants_version).filter(Event.id == event_id)
+    )
+    if version is None:
+        return []
+    headers = public_cache_headers(participants_etag(event_id, version))
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    invites = await db.scalars(
+        select(Invite)
+        .options(joinedload(Invite.user))
+        .filter(Invite.event_id == event_id, Invite.status == "accepted")
+    )
+    page = await cache_participants_async(
+        event_id,
+        headers["ETag"],
+        [serialize_participantout(invite) for invite in invites],
+    )
+    return SerializedJSONResponse(page["body"], headers=headers)
@@ -0,0 +1,69 @@
+"""
+Async variant of the user endpoints, backed by the asyncpg engine.
+
+Mounted in place of user_router when DATABASE_ASYNC is enabled. Each
+endpoint runs the sync implementation on an AsyncSession with
+run_sync_handler. Passwords are hashed on the password pool while the
+request awaits it. Writers that drop cached pages use run_sync_writer,
+which applies the invalidations through the cache's async interface.
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.main.database import get_async_db, run_sync_handler
+from src.main.models import User
+from src.main.schemas import UserCreate, UserResponse
+from src.main.utils import (
+    get_async_current_user_from_token,
+    hash_password_async,
+    run_sync_writer,
+)
+
+from . import user_router
+
+router = APIRouter(tags=["Users"], prefix="/api/users")
+
+
+@router.post("/", response_model=UserResponse)
+async def create_user(
+    user: UserCreate, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Create a new user or register an existing unregistered user.
+    """
+    # Hash before the transaction so no locks are held while it runs
+    hashed_password = await hash_password_async(user.password)
+    return await run_sync_writer(
+        db, user_router.register_user, user, hashed_password
+    )
+
+
+@router.get("/me", response_model=UserResponse)
+async def get_current_user(
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Get the current user from the JWT token in the cookie.
+    """
+    return user
+
+
+@router.delete("/me", status_code=204)
+async def delete_current_user(
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_async_current_user_from_token),
+):
+    """
+    Delete the current user and their invites.
+    """
+    return await run_sync_writer(
+        db, user_router.delete_current_user, user=user
+    )
+
+
+@router.get("/{user_id}", response_model=UserResponse)
+async def get_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Get user details by user_id.
+    """
+    return await run_sync_handler(db, user_router.get_user, user_id)
@@ -14,7 +14,12 @@ from sqlalchemy.orm import Session
 from src.main.database import get_db
 from src.main.models import User
 from src.main.schemas import UserRequest, UserResponse
-from src.main.utils import set_jwt_cookie_response, verify_password
+from src.main.utils import (
+    hash_password,
+    password_needs_rehash,
+    set_jwt_cookie_response,
+    verify_password,
+)
 
 router = APIRouter(tags=["Authentication"], prefix="/api/auth")
 
@@ -49,6 +54,11 @@ def signin(user_request: UserRequest, db: Session = Depends(get_db)):
             detail="Incorrect email or password",
         )
 
+    # Upgrade the stored hash if the configured work factor has changed
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = hash_password(user_request.password)
+        db.commit()
+
     # Sign in the user by setting the JWT cookie. Return user details.
     return set_jwt_cookie_response(user, response_model=UserResponse)
 
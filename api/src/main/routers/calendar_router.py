@@ -0,0 +1,125 @@
+"""
+API Router for the per-user iCalendar feed
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+from src.main.database import get_read_db, read_session
+from src.main.models import Event, Participant, User
+from src.main.schemas import CalendarFeedOut
+from src.main.utils import (
+    ICS_FOOTER,
+    ICS_HEADER,
+    decode_jwt_token,
+    etag_matches,
+    generate_calendar_token,
+    get_current_user_from_token,
+    make_etag,
+    serialize_vevent,
+)
+
+router = APIRouter(tags=["Calendar"], prefix="/api/calendar")
+
+# Rows fetched per round-trip from the server-side cursor
+FEED_YIELD_PER = 500
+
+
+def user_events_filter(user_id: int):
+    """
+    Events a user hosts or participates in.
+    """
+    participating = select(Participant.event_id).where(
+        Participant.user_id == user_id
+    )
+    return or_(Event.host_id == user_id, Event.id.in_(participating))
+
+
+def stream_calendar_feed(user_id: int):
+    """
+    Yields the feed one VEVENT at a time from a server-side cursor. Uses its
+    own session because the body is streamed after the endpoint returns.
+    """
+    db = read_session()
+    try:
+        yield ICS_HEADER
+        events = db.scalars(
+            select(Event)
+            .where(user_events_filter(user_id))
+            .order_by(Event.start_time, Event.id)
+            .execution_options(yield_per=FEED_YIELD_PER)
+        )
+        for event in events:
+            yield serialize_vevent(event)
+        yield ICS_FOOTER
+    finally:
+        db.close()
+
+
+@router.get("/feed", response_model=CalendarFeedOut)
+def get_calendar_feed_url(
+    request: Request, user: User = Depends(get_current_user_from_token)
+):
+    """
+    Get the private calendar subscription URL for the current user.
+
+    Args:
+        request (Request): FastAPI request object.
+        user (User): Current authenticated user.
+
+    Returns:
+        CalendarFeedOut: The .ics feed URL, which embeds a feed-only token.
+    """
+    token = generate_calendar_token(user)
+    return {"url": str(request.url_for("get_calendar_feed", token=token))}
+
+
+@router.get("/{token}.ics", response_class=StreamingResponse)
+def get_calendar_feed(
+    token: str,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Stream a user's hosted and participating events as an iCalendar feed.
+
+    Args:
+        token (str): Calendar token from the feed URL.
+        if_none_match (str): ETag from a previous response, if any.
+        db (Session): Database session.
+
+    Returns:
+        StreamingResponse: The text/calendar feed, or 304 Not Modified if
+        the events haven't changed since the client's copy.
+
+    Raises:
+        HTTPException: If the token is invalid.
+    """
+    payload = decode_jwt_token(token)
+    if not payload or payload.get("scope") != "calendar":
+        raise HTTPException(status_code=404, detail="Calendar not found.")
+    user_id = payload["uid"]
+
+    # One aggregate query serves as the version marker for the whole feed
+    count, last_updated, id_sum = (
+        db.query(
+            func.count(Event.id),
+            func.max(Event.updated_at),
+            func.sum(Event.id),
+        )
+        .filter(user_events_filter(user_id))
+        .one()
+    )
+    etag = make_etag(user_id, count, last_updated, id_sum)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    return StreamingResponse(
+        stream_calendar_feed(user_id),
+        media_type="text/calendar; charset=utf-8",
+        headers=headers,
+    )
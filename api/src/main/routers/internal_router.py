@@ -0,0 +1,27 @@
+"""
+API Router for internal operational endpoints (admin only)
+"""
+
+from fastapi import APIRouter, Depends
+from src.main import database
+from src.main.utils import require_admin
+
+router = APIRouter(
+    tags=["Internal"],
+    prefix="/api/internal",
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get("/pool")
+def get_pool_statistics():
+    """
+    Report connection pool occupancy and checkout wait times.
+
+    Returns:
+        dict: Statistics for each initialized engine's pool.
+    """
+    return {
+        name: database.pool_statistics(pool)
+        for name, pool in database.initialized_pools().items()
+    }
@@ -1,21 +1,51 @@
-import os
 import uuid
-
-from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from src.main.database import get_db
+from src.main.database import get_db, get_read_db
 from src.main.models.event import Event, Participant
 from src.main.models.invite import Invite
+from src.main.models.invite_import import InviteImport
 from src.main.models.user import User
 from src.main.schemas.invite_schema import (
+    InviteBulkCreate,
+    InviteBulkResult,
     InviteCreate,
+    InviteImportOut,
     InviteOut,
+    InvitePage,
     InviteStatusUpdate,
 )
 from src.main.utils import (
+    SerializedJSONResponse,
+    adjust_invite_counts,
+    decode_cursor,
+    encode_cursor,
+    enqueue_invite_email,
     get_current_user_from_token,
-    send_invite_email,
+    insert_invites,
+    invalidate_event_pages,
+    invite_change,
+    invite_links,
+    link_invites_to_user,
+    notify_event_changes,
+    paginate,
+    participant_change,
+    run_invite_import,
+    save_invite_upload,
     serialize_inviteout,
+    serialize_inviteouts,
 )
 
 router = APIRouter(tags=["Invites"], prefix="/api/invites")
@@ -79,17 +109,182 @@ def create_invite(
         user_id=invited_user.id if invited_user else None,
     )
     db.add(new_invite)
+    adjust_invite_counts(db, event.id, {"pending": 1})
+
+    # Queue the invite email with a clickable link to the event. It is
+    # committed with the invite and delivered by the email worker.
+    event_link, register_link = invite_links(
+        new_invite.token, invite_details.email
+    )
+    enqueue_invite_email(
+        db, invite_details.email, event.title, event_link, register_link
+    )
+
+    # Tell the host's open event streams once the invite is committed
+    db.flush()
+    notify_event_changes(db, [invite_change("created", new_invite)])
     db.commit()
     db.refresh(new_invite)
 
-    # Send invite email with clickable link to the event
-    event_link = f"{os.environ.get('UI_URL', 'http://localhost')}/events/token/{new_invite.token}"
-    register_link = f"{os.environ.get('UI_URL', 'http://localhost')}/signup?email={invite_details.email}"
-    send_invite_email(
-        invite_details.email, event.title, event_link, register_link
+    return serialize_inviteout(new_invite, db)
+
+
+@router.post(
+    "/bulk",
+    response_model=list[InviteBulkResult],
+    summary="Invite many participants to an event",
+)
+def create_invites_bulk(
+    bulk_details: InviteBulkCreate = Body(...),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user_from_token),
+):
+    """
+    Create invites for a list of emails in a single transaction.
+
+    Args:
+        bulk_details (InviteBulkCreate): The event_id and the emails and roles
+            to invite.
+        db (Session): Database session.
+        user (User): Current authenticated user (host).
+
+    Returns:
+        List[InviteBulkResult]: The outcome for each requested email, in
+        request order.
+
+    Raises:
+        HTTPException: If not authorized.
+    """
+    # Only the host can invite participants
+    event = (
+        db.query(Event)
+        .filter(Event.id == bulk_details.event_id, Event.host_id == user.id)
+        .first()
+    )
+    if not event:
+        raise HTTPException(status_code=403, detail="Not authorized.")
+
+    # Keep the first occurrence of each email in the request
+    requested = {}
+    for invite in bulk_details.invites:
+        requested.setdefault(invite.email, invite)
+
+    # Insert every new invite and queue its email in one transaction
+    new_invites = insert_invites(
+        db, event, {email: invite.role for email, invite in requested.items()}
     )
 
-    return serialize_inviteout(new_invite, db)
+    # Serialize before committing, which would expire every new invite
+    created = {
+        invite["email"]: invite
+        for invite in serialize_inviteouts(new_invites, db)
+    }
+    db.commit()
+
+    results = []
+    seen = set()
+    for invite in bulk_details.invites:
+        if invite.email in seen:
+            outcome = "duplicate"
+        elif invite.email in created:
+            outcome = "created"
+        else:
+            outcome = "already_invited"
+        results.append(
+            {
+                "email": invite.email,
+                "outcome": outcome,
+                "invite": (
+                    created[invite.email] if outcome == "created" else None
+                ),
+            }
+        )
+        seen.add(invite.email)
+    return SerializedJSONResponse(results)
+
+
+@router.post(
+    "/import",
+    response_model=InviteImportOut,
+    status_code=202,
+    summary="Import a guest list from a CSV file",
+)
+def import_invites(
+    background_tasks: BackgroundTasks,
+    event_id: int = Query(..., description="Event to invite guests to"),
+    file: UploadFile = File(..., description="CSV of email[,role] rows"),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user_from_token),
+):
+    """
+    Start importing a guest list CSV. Rows are validated and invited in
+    batches in the background; poll the returned import for progress.
+
+    Args:
+        event_id (int): ID of the event to invite guests to.
+        file (UploadFile): CSV file with an email and optional role per row.
+        db (Session): Database session.
+        user (User): Current authenticated user (host).
+
+    Returns:
+        InviteImportOut: The newly started import.
+
+    Raises:
+        HTTPException: If not authorized.
+    """
+    # Only the host can invite participants
+    event = (
+        db.query(Event)
+        .filter(Event.id == event_id, Event.host_id == user.id)
+        .first()
+    )
+    if not event:
+        raise HTTPException(status_code=403, detail="Not authorized.")
+
+    # Copy the spooled upload to a file the background task owns
+    path = save_invite_upload(file)
+
+    job = InviteImport(event_id=event.id, errors=[])
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    background_tasks.add_task(run_invite_import, job.id, path)
+    return job
+
+
+@router.get(
+    "/imports/{import_id}",
+    response_model=InviteImportOut,
+    summary="Get the progress of a guest list import",
+)
+def get_invite_import(
+    import_id: int,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user_from_token),
+):
+    """
+    Fetch the progress and row errors of a guest list import.
+
+    Args:
+        import_id (int): ID of the import.
+        db (Session): Database session.
+        user (User): Current authenticated user (host).
+
+    Returns:
+        InviteImportOut: The import's progress so far.
+
+    Raises:
+        HTTPException: If the import is not found or not accessible.
+    """
+    job = (
+        db.query(InviteImport)
+        .join(Event, Event.id == InviteImport.event_id)
+        .filter(InviteImport.id == import_id, Event.host_id == user.id)
+        .first()
+    )
+    if not job:
+        raise HTTPException(status_code=404, detail="Import not found.")
+    return job
 
 
 @router.put(
@@ -105,7 +300,9 @@ def update_invite(
     db: Session = Depends(get_db),
 ):
     """
-    Respond to an invite by accepting or declining.
+    Respond to an invite by accepting or declining, in a single transaction.
+    Repeating the same response (e.g. a double-click) returns the invite
+    unchanged.
 
     Args:
         token (str): Invite token from the URL.
@@ -118,47 +315,74 @@ def update_invite(
     Raises:
         HTTPException: If invite is invalid or status is invalid.
     """
-    # Fetch the invite from the DB
-    invite = db.query(Invite).filter(Invite.token == token).first()
+    # Validate the new status before touching the DB
+    if status_update.status not in ["accepted", "declined"]:
+        raise HTTPException(status_code=400, detail="Invalid status.")
+
+    # Fetch and lock the invite so concurrent responses are serialized
+    invite = (
+        db.query(Invite)
+        .filter(Invite.token == token)
+        .with_for_update()
+        .first()
+    )
+    if invite and invite.status == status_update.status:
+        invite_data = serialize_inviteout(invite, db)
+        db.commit()
+        return invite_data
     if not invite or invite.status != "pending":
         raise HTTPException(
             status_code=404, detail="Invalid or expired invite."
         )
 
-    # Fetch the user from the DB
-    user = db.query(User).filter(User.email == invite.email).first()
-
-    # Validate the new status data and update the invite
-    if status_update.status not in ["accepted", "declined"]:
-        raise HTTPException(status_code=400, detail="Invalid status.")
+    # Link the invite, and any other unlinked invites for its email, to the
+    # user with that email, creating an unregistered user if no account
+    # exists yet
+    if invite.user_id is None:
+        invite.user_id = db.scalar(
+            insert(User)
+            .values(email=invite.email, is_registered=False)
+            .on_conflict_do_update(
+                index_elements=[User.email],
+                set_={"email": insert(User).excluded.email},
+            )
+            .returning(User.id)
+        )
+        link_invites_to_user(db, invite.email, invite.user_id)
     invite.status = status_update.status
+    event_id = invite.event_id
+    accepted = status_update.status == "accepted"
+
+    # Add the user as a participant; accepting twice is a no-op
+    if accepted:
+        db.execute(
+            insert(Participant)
+            .values(
+                event_id=event_id,
+                user_id=invite.user_id,
+                role=invite.role,
+            )
+            .on_conflict_do_nothing(index_elements=["event_id", "user_id"])
+        )
+    adjust_invite_counts(
+        db,
+        event_id,
+        {"pending": -1, status_update.status: 1},
+        participants_changed=accepted,
+    )
 
-    # Create an unregistered user if a registered account doesn't already exist
-    if not user:
-        user = User(email=invite.email, is_registered=False)
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-
-    # Set the invite's user_id whether the user existed previously or not
-    invite.user_id = user.id
-    db.commit()
-
-    # Add the user as a participant
-    if status_update.status == "accepted" and user:
-        event_participant = Participant(
-            event_id=invite.event_id, user_id=user.id, role=invite.role
+    # Serialize before committing, which would expire the invite
+    invite_data = serialize_inviteout(invite, db)
+    changes = [invite_change("updated", invite)]
+    if accepted:
+        changes.append(
+            participant_change("added", invite, invite_data["user_name"])
         )
-        db.add(event_participant)
-        db.commit()
-        db.refresh(invite)
-        return serialize_inviteout(invite, db)
-    elif status_update.status == "accepted":
-        db.refresh(invite)
-        return serialize_inviteout(invite, db)
-    else:
-        db.refresh(invite)
-        return serialize_inviteout(invite, db)
+    notify_event_changes(db, changes)
+    db.commit()
+    if accepted:
+        invalidate_event_pages([event_id])
+    return invite_data
 
 
 @router.delete("/{invite_id}", status_code=204)
@@ -187,37 +411,61 @@ def delete_invite(
     event = db.query(Event).filter(Event.id == invite.event_id).first()
     if not event or event.host_id != user.id:
         raise HTTPException(status_code=403, detail="Not authorized.")
+    token = invite.token
+    changes = [invite_change("deleted", invite)]
+    if invite.status == "accepted":
+        changes.append(participant_change("removed", invite))
     db.delete(invite)
+    # Lock order matches update_invite: the invite row, then the event row
+    db.flush()
+    adjust_invite_counts(
+        db,
+        event.id,
+        {invite.status: -1},
+        participants_changed=invite.status == "accepted",
+    )
+    notify_event_changes(db, changes)
     db.commit()
+    invalidate_event_pages([event.id], tokens=[token])
     return
 
 
-@router.get("/", response_model=list[InviteOut])
+@router.get("/", response_model=InvitePage)
 def get_invites(
     status: str = Query(
-        None, description="Invite status: pending, accepted, declined, all"
+        None,
+        description="Invite status: pending, accepted, declined, expired, "
+        "all",
     ),
     user_id: int = Query(None, description="Filter by user_id"),
     event_id: int = Query(None, description="Filter by event_id"),
-    db: Session = Depends(get_db),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    db: Session = Depends(get_read_db),
     user: User = Depends(get_current_user_from_token),
 ):
     """
-    Fetch invites filtered by user_id, event_id, and status.
-    If no user_id is provided, defaults to current user.
+    Fetch a page of invites filtered by user_id, event_id, and status,
+    ordered by id. If no user_id is provided, defaults to current user.
 
     Args:
         status (str): Status filter for invites.
         user_id (int): User ID to filter invites.
         event_id (int): Event ID to filter invites.
+        limit (int): Maximum number of invites to return.
+        cursor (str): Opaque cursor from a previous page's next_cursor.
         db (Session): Database session.
         user (User): Current authenticated user.
 
     Returns:
-        List[InviteOut]: List of invites matching the filters.
+        InvitePage: Invites matching the filters and the cursor for the next
+        page.
 
     Raises:
-        HTTPException: If event not found, not authorized, or invalid status.
+        HTTPException: If event not found, not authorized, or invalid status
+        or cursor.
     """
 
     query = db.query(Invite)
@@ -260,11 +508,24 @@ def get_invites(
     else:
         query = query.filter(Invite.user_id == user.id)
     if status and status != "all":
-        if status not in ["pending", "accepted", "declined"]:
+        if status not in ["pending", "accepted", "declined", "expired"]:
             raise HTTPException(
                 status_code=400,
-                detail="Invalid status parameter. Must be 'pending', 'accepted', 'declined', or 'all'.",
+                detail="Invalid status parameter. Must be 'pending', 'accepted', 'declined', 'expired', or 'all'.",
             )
         query = query.filter(Invite.status == status)
-    invites = query.all()
-    return [serialize_inviteout(invite, db) for invite in invites]
+
+    # Keyset pagination on id
+    if cursor:
+        (last_id,) = decode_cursor(cursor, 1)
+        if not isinstance(last_id, int):
+            raise HTTPException(status_code=400, detail="Invalid cursor.")
+        query = query.filter(Invite.id > last_id)
+    invites, has_more = paginate(query.order_by(Invite.id), limit)
+    next_cursor = encode_cursor(invites[-1].id) if has_more else None
+    return SerializedJSONResponse(
+        {
+            "items": serialize_inviteouts(invites, db),
+            "next_cursor": next_cursor,
+        }
+    )
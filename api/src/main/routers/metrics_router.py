@@ -0,0 +1,59 @@
+"""
+API Router exposing process metrics in the Prometheus text format
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+from src.main import database
+from src.main.metrics import (
+    CONTENT_TYPE,
+    CounterFamily,
+    GaugeFamily,
+    render_metrics,
+)
+
+router = APIRouter(tags=["Metrics"])
+
+
+def _pool_metrics() -> str:
+    """
+    Connection pool occupancy, read from the pools at scrape time.
+    """
+    registry = []
+    gauges = {
+        key: GaugeFamily(
+            f"db_pool_{key}", description, ("engine",), registry=registry
+        )
+        for key, description in (
+            ("size", "Connections the pool keeps open."),
+            ("checked_out", "Connections currently in use."),
+            ("overflow", "Connections open beyond the pool size."),
+        )
+    }
+    timeouts = CounterFamily(
+        "db_pool_checkout_timeouts_total",
+        "Checkouts that gave up waiting for a connection.",
+        ("engine",),
+        registry=registry,
+    )
+    for name, pool in database.initialized_pools().items():
+        stats = database.pool_statistics(pool)
+        if "size" not in stats:
+            continue
+        for key, gauge in gauges.items():
+            gauge.labels(name).set(stats[key])
+        timeouts.labels(name).inc(stats["checkout_timeouts"])
+    return render_metrics(registry)
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """
+    Render request, SQL and connection pool metrics for Prometheus.
+
+    Returns:
+        Response: Metrics in the Prometheus text exposition format.
+    """
+    return Response(
+        content=render_metrics() + _pool_metrics(), media_type=CONTENT_TYPE
+    )
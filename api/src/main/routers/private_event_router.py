@@ -1,12 +1,31 @@
 from datetime import datetime
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, tuple_
 from sqlalchemy.orm import Session
-from src.main.database import get_db
+from src.main.database import get_db, get_read_db
 from src.main.models import Event, Invite, Participant, User
-from src.main.schemas import EventCreate, EventOut
-from src.main.utils import get_current_user_from_token, serialize_eventout
+from src.main.schemas import (
+    EventCreate,
+    EventOut,
+    EventPage,
+    EventSummaryOut,
+)
+from src.main.utils import (
+    SerializedJSONResponse,
+    decode_cursor,
+    encode_cursor,
+    get_current_user_from_token,
+    get_event_change_broker,
+    invalidate_event_pages,
+    paginate,
+    serialize_eventout,
+    serialize_eventouts,
+    serialize_invite_counts,
+    stream_event_changes,
+)
 
 router = APIRouter(tags=["PrivateEvents"], prefix="/api/private/events")
 
@@ -51,26 +70,34 @@ def create_event(
     return serialize_eventout(new_event, db)
 
 
-@router.get("/", response_model=List[EventOut])
+@router.get("/", response_model=EventPage)
 def get_events(
     role: str = "participant",
     time: str = "all",
-    db: Session = Depends(get_db),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    db: Session = Depends(get_read_db),
     user: User = Depends(get_current_user_from_token),
 ):
     """
-    Fetch events for the current user based on the 'type' query parameter.
+    Fetch a page of events for the current user based on the 'role' query
+    parameter, ordered by start time.
 
     Args:
-        type (str):
+        role (str):
             'host' - returns events the user is hosting.
             'participant' - returns events the user is participating in.
+        time (str): 'upcoming', 'past' or 'all'.
+        limit (int): Maximum number of events to return.
+        cursor (str): Opaque cursor from a previous page's next_cursor.
 
     Returns:
-        List[EventOut]: List of events matching the query type.
+        EventPage: Events matching the query and the cursor for the next page.
 
     Raises:
-        HTTPException: If an invalid type is provided.
+        HTTPException: If an invalid role, time or cursor is provided.
     """
     # Save current time to now
     now = datetime.now()
@@ -102,8 +129,34 @@ def get_events(
             detail="Invalid time parameter. Must be 'upcoming', 'past', or 'all'.",
         )
 
-    events = query.order_by(Event.start_time).all()
-    return [serialize_eventout(event, db) for event in events]
+    # Keyset pagination on (start_time, id)
+    if cursor:
+        start_time, event_id = decode_cursor(cursor, 2)
+        try:
+            start_time = datetime.fromisoformat(start_time)
+            if not isinstance(event_id, int):
+                raise ValueError(event_id)
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor.",
+            )
+        query = query.filter(
+            tuple_(Event.start_time, Event.id) > (start_time, event_id)
+        )
+
+    events, has_more = paginate(
+        query.order_by(Event.start_time, Event.id), limit
+    )
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor(events[-1].start_time, events[-1].id)
+    return SerializedJSONResponse(
+        {
+            "items": serialize_eventouts(events, db),
+            "next_cursor": next_cursor,
+        }
+    )
 
 
 @router.get("/{event_id}", response_model=EventOut)
@@ -153,6 +206,113 @@ def get_event_by_id(
     return serialize_eventout(db_event, db)
 
 
+@router.get("/{event_id}/summary", response_model=EventSummaryOut)
+def get_event_summary(
+    event_id: int,
+    db: Session = Depends(get_read_db),
+    user: User = Depends(get_current_user_from_token),
+):
+    """
+    Retrieve the invite counts of an event hosted by the current user. The
+    counts are read from the event row, so no invites are loaded.
+
+    Args:
+        event_id (int): ID of the event.
+        db (Session): Database session.
+        user (User): Current authenticated user.
+
+    Returns:
+        EventSummaryOut: Invites per status and in total.
+
+    Raises:
+        HTTPException: If the event is not found or not accessible.
+    """
+    # Fetch the event if the user is the host
+    db_event = (
+        db.query(Event)
+        .filter(Event.id == event_id, Event.host_id == user.id)
+        .first()
+    )
+    if not db_event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
+        )
+
+    counts = serialize_invite_counts(db_event)
+    return {
+        "event_id": db_event.id,
+        "invite_counts": counts,
+        "total_invites": sum(counts.values()),
+    }
+
+
+def get_event_stream_snapshot(
+    event_id: int,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user_from_token),
+) -> dict:
+    """
+    Dependency that checks the current user hosts the event and returns the
+    stream's opening snapshot of its invite counts.
+    """
+    db_event = (
+        db.query(Event)
+        .filter(Event.id == event_id, Event.host_id == user.id)
+        .first()
+    )
+    if not db_event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
+        )
+    snapshot = {
+        "event_id": db_event.id,
+        "type": "snapshot",
+        "action": None,
+        "data": {"invite_counts": serialize_invite_counts(db_event)},
+    }
+    # Return the connection now; the stream may stay open for hours
+    db.close()
+    return snapshot
+
+
+@router.get("/{event_id}/stream", response_class=StreamingResponse)
+async def stream_event(
+    request: Request,
+    event_id: int,
+    snapshot: dict = Depends(get_event_stream_snapshot),
+):
+    """
+    Stream live invite and participant changes of an event hosted by the
+    current user as Server-Sent Events, instead of polling the invite and
+    participant lists.
+
+    The first event is a "snapshot" of the invite counts, followed by
+    "invite" and "participant" events with an action (created, updated,
+    deleted, expired / added, removed). A "resync" event means changes
+    were dropped; reload the lists and reconnect.
+
+    Args:
+        request (Request): The incoming request.
+        event_id (int): ID of the event.
+        snapshot (dict): Invite counts when the stream opened.
+
+    Returns:
+        StreamingResponse: A text/event-stream of changes.
+
+    Raises:
+        HTTPException: If the event is not found or not accessible.
+    """
+    # Subscribe before the response starts, so a failure to listen is an
+    # error response rather than a broken stream
+    queue = await get_event_change_broker().subscribe(event_id)
+    return StreamingResponse(
+        stream_event_changes(request, event_id, snapshot, queue),
+        media_type="text/event-stream",
+        # Keep proxies from caching or buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.put("/{event_id}", response_model=EventOut)
 def update_event(
     event_id: int,
@@ -192,6 +352,7 @@ def update_event(
     db_event.start_time = event_data.start_time
     db_event.end_time = event_data.end_time
     db.commit()
+    invalidate_event_pages([event_id])
     db.refresh(db_event)
 
     # Use event_serialization utility to return an EventFullOut instance
@@ -218,15 +379,18 @@ def delete_event(
     Raises:
         HTTPException: If the event is not found or not accessible.
     """
-    db_event = (
-        db.query(Event)
-        .filter(Event.id == event_id, Event.host_id == user.id)
-        .first()
+    # Delete with one statement; the database cascades to the event's
+    # participants, invites and imports
+    deleted_id = db.scalar(
+        delete(Event)
+        .where(Event.id == event_id, Event.host_id == user.id)
+        .returning(Event.id)
+        .execution_options(synchronize_session=False)
     )
-    if not db_event:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
         )
-    db.delete(db_event)
     db.commit()
+    invalidate_event_pages([event_id])
     return {"detail": "Event deleted"}
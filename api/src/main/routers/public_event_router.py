@@ -1,9 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy.orm import Session, joinedload
 from src.main.database import get_db
 from src.main.models import Event, Invite
 from src.main.schemas import EventOut, ParticipantOut
-from src.main.utils import serialize_eventout, serialize_participantout
+from src.main.utils import (
+    SerializedJSONResponse,
+    cache_event_page,
+    cache_participants,
+    etag_matches,
+    event_etag,
+    get_cached_event_page,
+    get_cached_participants,
+    participants_etag,
+    public_cache_headers,
+    serialize_event_summary,
+    serialize_participantout,
+)
 
 router = APIRouter(tags=["PublicEvents"], prefix="/api/public/events")
 
@@ -11,6 +25,7 @@ router = APIRouter(tags=["PublicEvents"], prefix="/api/public/events")
 @router.get("/token/{token}", response_model=EventOut)
 def get_event_by_token(
     token: str,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
     """
@@ -18,45 +33,94 @@ def get_event_by_token(
 
     Args:
         token (str): Invite token from the URL.
+        if_none_match (Optional[str]): ETag from a cached copy, if any.
         db (Session): Database session.
 
     Returns:
-        EventOut: The event associated with the invite token.
+        EventOut: The event associated with the invite token, or 304 Not
+            Modified if the client's copy is current.
 
     Raises:
         HTTPException: If the invite or event is not found or invalid.
     """
-    invite = db.query(Invite).filter(Invite.token == token).first()
-    if not invite:
-        raise HTTPException(
-            status_code=404, detail="Invalid or expired invite token."
+    # Serve the cached page if there is one. Misses read the primary, since
+    # a lagging replica would cache the old page until it expires.
+    page = get_cached_event_page(token)
+    if page is None:
+        # Fetch the event and its host through the invite in one query
+        event = (
+            db.query(Event)
+            .join(Invite, Invite.event_id == Event.id)
+            .options(joinedload(Event.host))
+            .filter(Invite.token == token)
+            .first()
         )
-    event = db.query(Event).filter(Event.id == invite.event_id).first()
-    if not event:
-        raise HTTPException(
-            status_code=404, detail="Event not found for this invite."
+        if not event:
+            raise HTTPException(
+                status_code=404, detail="Invalid or expired invite token."
+            )
+        page = cache_event_page(
+            token,
+            event.id,
+            event_etag(event, event.host),
+            serialize_event_summary(event, event.host, with_counts=False),
         )
-    return serialize_eventout(event, db)
+
+    # Skip the body if the client already has this version
+    headers = public_cache_headers(page["etag"])
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return SerializedJSONResponse(page["body"], headers=headers)
 
 
 @router.get("/{event_id}/participants", response_model=list[ParticipantOut])
-def get_participants(event_id: int, db: Session = Depends(get_db)):
+def get_participants(
+    event_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
     """
     Retrieve the list of accepted participants for a public event.
 
     Args:
         event_id (int): ID of the event to fetch participants for.
+        if_none_match (Optional[str]): ETag from a cached copy, if any.
         db (Session): Database session.
 
     Returns:
-        List[InviteOut]: List of accepted invites (participants) for the event.
-
-    Raises:
-        HTTPException: If the event is not found.
+        List[ParticipantOut]: Accepted participants for the event, or 304
+            Not Modified if the client's copy is current.
     """
+    # Serve the cached list if there is one. Misses read the primary, since
+    # a lagging replica would cache the old list until it expires.
+    page = get_cached_participants(event_id)
+    if page is not None:
+        headers = public_cache_headers(page["etag"])
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        return SerializedJSONResponse(page["body"], headers=headers)
+
+    # Check the participant list version before loading it
+    version = (
+        db.query(Event.participants_version)
+        .filter(Event.id == event_id)
+        .scalar()
+    )
+    if version is None:
+        return []
+    headers = public_cache_headers(participants_etag(event_id, version))
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
     invites = (
         db.query(Invite)
+        .options(joinedload(Invite.user))
         .filter(Invite.event_id == event_id, Invite.status == "accepted")
         .all()
     )
-    return [serialize_participantout(invite) for invite in invites]
+    page = cache_participants(
+        event_id,
+        headers["ETag"],
+        [serialize_participantout(invite) for invite in invites],
+    )
+    return SerializedJSONResponse(page["body"], headers=headers)
@@ -5,19 +5,79 @@ API Router for User CRUD endpoints
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from src.main.database import get_db
-from src.main.models import Invite, User
+from src.main.models import Event, Invite, User
 from src.main.schemas import UserCreate, UserResponse
 from src.main.utils import (
+    accepted_event_ids,
+    bump_participants_version,
     get_current_user_from_token,
     hash_password,
+    invalidate_cached_user,
+    invalidate_event_pages,
+    invite_change,
+    link_invites_to_user,
+    notify_event_changes,
+    participant_change,
+    serialize_display_name,
     set_jwt_cookie_response,
+    subtract_invite_counts,
 )
 
 router = APIRouter(tags=["Users"], prefix="/api/users")
 
 
+def register_user(user: UserCreate, hashed_password: str, db: Session):
+    """
+    Saves a new user with an already hashed password and returns the signed
+    in response. Shared by the sync and async create_user.
+    """
+    # Create the user, or register the unregistered user invited with this
+    # email. A registered account is left alone and nothing is returned.
+    new_user = insert(User).values(
+        email=user.email,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        is_registered=True,
+        hashed_password=hashed_password,
+    )
+    user_obj = db.scalar(
+        new_user.on_conflict_do_update(
+            index_elements=[User.email],
+            set_={
+                "first_name": new_user.excluded.first_name,
+                "last_name": new_user.excluded.last_name,
+                "is_registered": True,
+                "hashed_password": new_user.excluded.hashed_password,
+            },
+            where=User.is_registered.is_(False),
+        ).returning(User)
+    )
+    if user_obj is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=400, detail="An account already exists for this email."
+        )
+
+    # Backfill invites for this email
+    link_invites_to_user(db, user.email, user_obj.id)
+
+    # Participant lists show this user's name now that they're registered
+    event_ids = bump_participants_version(db, accepted_event_ids(user.email))
+
+    # Sign in the user upon creation by setting the JWT cookie. Built before
+    # committing, which would expire the user.
+    response = set_jwt_cookie_response(user_obj, response_model=UserResponse)
+    user_id = user_obj.id
+    db.commit()
+    invalidate_cached_user(user_id)
+    invalidate_event_pages(event_ids)
+    return response
+
+
 @router.post("/", response_model=UserResponse)
 def create_user(
     user: UserCreate, db: Session = Depends(get_db), response: Response = None
@@ -36,48 +96,8 @@ def create_user(
     Raises:
         HTTPException: If an account already exists for the email.
     """
-    existing_user = db.query(User).filter(User.email == user.email).first()
-    if existing_user and existing_user.is_registered == True:
-        raise HTTPException(
-            status_code=400, detail="An account already exists for this email."
-        )
-
-    # Register the user's account if email already exists in the DB
-    if existing_user and existing_user.is_registered == False:
-        existing_user.first_name = user.first_name
-        existing_user.last_name = user.last_name
-        existing_user.is_registered = True
-        existing_user.hashed_password = hash_password(user.password)
-        db.commit()
-        db.refresh(existing_user)
-        user_obj = existing_user
-
-    # Otherwise, create a new user
-    else:
-        new_user = User(
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            is_registered=True,
-            hashed_password=hash_password(user.password),
-        )
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
-        user_obj = new_user
-
-    # Backfill invites for this email
-    invites = (
-        db.query(Invite)
-        .filter(Invite.email == user_obj.email, Invite.user_id == None)
-        .all()
-    )
-    for invite in invites:
-        invite.user_id = user_obj.id
-    db.commit()
-
-    # Sign in the user upon creation by setting the JWT cookie
-    return set_jwt_cookie_response(user_obj, response_model=UserResponse)
+    # Hash before the transaction so no locks are held while it runs
+    return register_user(user, hash_password(user.password), db)
 
 
 @router.get("/me", response_model=UserResponse)
@@ -109,14 +129,51 @@ def delete_current_user(
     Returns:
         None
     """
-    # Delete invites by user_id or email
-    db.query(Invite).filter(
-        (Invite.user_id == user.id) | (Invite.email == user.email)
-    ).delete(synchronize_session=False)
-    db.commit()
-    # Delete the current user from the database. Commit changes.
-    db.delete(user)
+    # The user may belong to this session, which the commit would expire
+    user_id = user.id
+
+    # Delete invites by user_id or email, dropping the user from participant
+    # lists and counters
+    deleted_invites = db.execute(
+        delete(Invite)
+        .where((Invite.user_id == user_id) | (Invite.email == user.email))
+        .returning(
+            Invite.event_id,
+            Invite.token,
+            Invite.status,
+            Invite.id,
+            Invite.email,
+            Invite.role,
+        )
+    ).all()
+    subtract_invite_counts(
+        db, [(invite.event_id, invite.status) for invite in deleted_invites]
+    )
+    name = serialize_display_name(user)
+    changes = []
+    for invite in deleted_invites:
+        changes.append(invite_change("deleted", invite))
+        if invite.status == "accepted":
+            changes.append(participant_change("removed", invite, name))
+    notify_event_changes(db, changes)
+
+    # Delete the user with one statement; the database cascades to hosted
+    # events and their participants and invites
+    hosted_event_ids = db.scalars(
+        select(Event.id).where(Event.host_id == user_id)
+    ).all()
+    db.execute(
+        delete(User)
+        .where(User.id == user_id)
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
+    invalidate_cached_user(user_id)
+    invalidate_event_pages(
+        {invite.event_id for invite in deleted_invites}
+        | set(hosted_event_ids),
+        tokens=[invite.token for invite in deleted_invites],
+    )
 
 
 @router.get("/{user_id}", response_model=UserResponse)
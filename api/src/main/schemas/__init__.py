@@ -1,3 +1,4 @@
+from .calendar_schema import *
 from .event_schema import *
 from .invite_schema import *
 from .user_schema import *
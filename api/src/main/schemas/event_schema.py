@@ -15,10 +15,29 @@ class EventCreate(EventBase):
     pass
 
 
+class InviteCounts(BaseModel):
+    pending: int
+    accepted: int
+    declined: int
+
+
 class EventOut(EventBase):
     id: int
     host_id: int
     host_name: str
+    # Omitted (null) on the public, unauthenticated event pages
+    invite_counts: Optional[InviteCounts] = None
+
+
+class EventSummaryOut(BaseModel):
+    event_id: int
+    invite_counts: InviteCounts
+    total_invites: int
+
+
+class EventPage(BaseModel):
+    items: list[EventOut]
+    next_cursor: Optional[str] = None
 
 
 class ParticipantOut(BaseModel):
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 from .event_schema import EventOut
 
@@ -14,6 +14,11 @@ class InviteCreate(InviteBase):
     event_id: int
 
 
+class InviteBulkCreate(BaseModel):
+    event_id: int
+    invites: list[InviteBase] = Field(..., min_length=1, max_length=1000)
+
+
 class InviteOut(InviteBase):
     id: int
     token: str
@@ -22,5 +27,36 @@ class InviteOut(InviteBase):
     user_name: Optional[str] = None
 
 
+class InvitePage(BaseModel):
+    items: list[InviteOut]
+    next_cursor: Optional[str] = None
+
+
+class InviteBulkResult(BaseModel):
+    email: EmailStr
+    # "created", "already_invited" or "duplicate" (repeated in the request)
+    outcome: str
+    invite: Optional[InviteOut] = None
+
+
+class InviteImportError(BaseModel):
+    row: Optional[int] = None
+    email: Optional[str] = None
+    error: str
+
+
+class InviteImportOut(BaseModel):
+    id: int
+    event_id: int
+    status: str
+    processed_rows: int
+    created_count: int
+    skipped_count: int
+    error_count: int
+    errors: list[InviteImportError]
+
+    model_config = {"from_attributes": True}
+
+
 class InviteStatusUpdate(BaseModel):
     status: str
@@ -1,4 +1,15 @@
 from .authentication import *
+from .cache import *
+from .calendar import *
+from .conditional import *
 from .email import *
 from .event_serialization import *
+from .event_stream import *
+from .event_versions import *
+from .invite_counters import *
+from .invite_creation import *
+from .invite_import import *
 from .invite_serialization import *
+from .pagination import *
+from .response_cache import *
+from .responses import *
@@ -2,7 +2,10 @@
 Helper functions for implementing authentication
 """
 
+import asyncio
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Annotated, Optional
 
@@ -11,23 +14,85 @@ from fastapi import Cookie, Depends, HTTPException
 from fastapi.responses import JSONResponse
 from jose import JWTError, jwt
 from jose.constants import ALGORITHMS
-from sqlalchemy.orm import Session
-from src.main.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from src.main.database import get_async_db, get_db
 from src.main.models import User
 from src.main.schemas import UserRequest
 
+from .cache import TTLCache
+
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 if not JWT_SECRET_KEY:
     raise ValueError("JWT_SECRET_KEY environment variable is not set.")
 
+# bcrypt work factor for new hashes; stored hashes with a different cost are
+# rehashed on the next successful sign in
+PASSWORD_HASH_ROUNDS = int(os.getenv("PASSWORD_HASH_ROUNDS", "12"))
+
+# Password hashing runs on a dedicated, bounded pool so a sign-in storm can
+# use at most PASSWORD_HASH_WORKERS cores, and at most
+# PASSWORD_HASH_QUEUE_DEPTH further requests wait for it. Anything beyond
+# that is rejected with a 503 instead of tying up the request threadpool.
+PASSWORD_HASH_WORKERS = int(
+    os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1))
+)
+PASSWORD_HASH_QUEUE_DEPTH = int(os.getenv("PASSWORD_HASH_QUEUE_DEPTH", "16"))
+
+_password_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+_password_slots = threading.BoundedSemaphore(
+    PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_DEPTH
+)
+
+
+def _run_password_job(fn, *args):
+    """
+    Runs a bcrypt call on the password pool (bcrypt releases the GIL while
+    hashing), failing fast when the pool's queue is full.
+    """
+
+    if not _password_slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=503,
+            detail="Too many sign in attempts, please try again.",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        return _password_executor.submit(fn, *args).result()
+    finally:
+        _password_slots.release()
+
+
+async def _run_password_job_async(fn, *args):
+    """
+    Like _run_password_job, awaiting the pool instead of blocking the event
+    loop.
+    """
+
+    if not _password_slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=503,
+            detail="Too many sign in attempts, please try again.",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        return await asyncio.wrap_future(_password_executor.submit(fn, *args))
+    finally:
+        _password_slots.release()
+
 
 def hash_password(plain_password) -> str:
     """
     Hashes a password
     """
 
-    return bcrypt.hashpw(
-        plain_password.encode("utf-8"), bcrypt.gensalt()
+    return _run_password_job(
+        bcrypt.hashpw,
+        plain_password.encode("utf-8"),
+        bcrypt.gensalt(rounds=PASSWORD_HASH_ROUNDS),
     ).decode("utf-8")
 
 
@@ -37,18 +102,110 @@ def verify_password(plain_password, hash_password) -> bool:
     database. Used during user login to verify credentials.
     """
 
-    return bcrypt.checkpw(
-        plain_password.encode("utf-8"), hash_password.encode("utf-8")
+    return _run_password_job(
+        bcrypt.checkpw,
+        plain_password.encode("utf-8"),
+        hash_password.encode("utf-8"),
+    )
+
+
+async def hash_password_async(plain_password) -> str:
+    """
+    Hashes a password from async code
+    """
+
+    hashed = await _run_password_job_async(
+        bcrypt.hashpw,
+        plain_password.encode("utf-8"),
+        bcrypt.gensalt(rounds=PASSWORD_HASH_ROUNDS),
+    )
+    return hashed.decode("utf-8")
+
+
+async def verify_password_async(plain_password, hash_password) -> bool:
+    """
+    Checks a password against a stored hash from async code
+    """
+
+    return await _run_password_job_async(
+        bcrypt.checkpw,
+        plain_password.encode("utf-8"),
+        hash_password.encode("utf-8"),
+    )
+
+
+def password_needs_rehash(hash_password) -> bool:
+    """
+    Checks if a stored bcrypt hash was made with a different work factor than
+    PASSWORD_HASH_ROUNDS.
+    """
+
+    # bcrypt hashes look like $2b$<cost>$<salt and digest>
+    parts = hash_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return True
+    return int(parts[2]) != PASSWORD_HASH_ROUNDS
+
+
+# Resolved users keyed by id, so authenticated requests skip the user lookup.
+# The cache is per process: invalidation on one worker does not reach the
+# others, so USER_CACHE_TTL bounds how long they can serve a stale entry.
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+_USER_CACHE_COLUMNS = (
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "is_registered",
+)
+_user_cache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
+
+def cache_user(user: User):
+    """
+    Stores the identity columns of a user in the authenticated-user cache.
+    """
+
+    _user_cache.set(
+        user.id,
+        {column: getattr(user, column) for column in _USER_CACHE_COLUMNS},
     )
 
 
+def get_cached_user(user_id: int) -> Optional[User]:
+    """
+    Returns a fresh detached User built from the cache, or None on a miss.
+    Columns outside the cached set (e.g. hashed_password) and relationships
+    are expired and can't be read without attaching it to a session.
+    """
+
+    data = _user_cache.get(user_id)
+    if data is None:
+        return None
+    user = User(**data)
+    make_transient_to_detached(user)
+    return user
+
+
+def invalidate_cached_user(user_id: int):
+    """
+    Drops a user from the authenticated-user cache after it changes.
+    """
+
+    _user_cache.delete(user_id)
+
+
 def generate_jwt_token(user: UserRequest) -> str:
     """
     Generates a new JWT token using the user's information, including their
-    role.
+    id and role.
     """
 
     payload = {"sub": user.email}
+    # Include the user id so requests can be resolved from the user cache
+    if getattr(user, "id", None) is not None:
+        payload["uid"] = user.id
     # Only add role if present
     if hasattr(user, "role") and user.role is not None:
         payload["role"] = user.role
@@ -56,6 +213,16 @@ def generate_jwt_token(user: UserRequest) -> str:
     return token
 
 
+def generate_calendar_token(user: User) -> str:
+    """
+    Generates a JWT for a user's calendar feed URL. It is scoped to the feed
+    and is not accepted as a session token.
+    """
+
+    payload = {"sub": user.email, "uid": user.id, "scope": "calendar"}
+    return jwt.encode(payload, JWT_SECRET_KEY, algorithm=ALGORITHMS.HS256)
+
+
 def decode_jwt_token(token: str) -> Optional[dict]:
     """
     Decodes a JWT token and returns the payload if valid, otherwise returns
@@ -82,7 +249,8 @@ def get_jwt_user_data(
     if not fast_api_token:
         return None
     payload = decode_jwt_token(fast_api_token)
-    if not payload:
+    # Scoped tokens (e.g. calendar feed links) never grant a session
+    if not payload or "scope" in payload:
         return None
     return payload
 
@@ -97,9 +265,46 @@ def get_current_user_from_token(
     """
     if not jwt_payload or "sub" not in jwt_payload:
         raise HTTPException(status_code=404, detail="Not logged in")
-    user = db.query(User).filter(User.email == jwt_payload["sub"]).first()
-    if not user:
+
+    # Resolve by id from the cache when the token carries one. Older tokens
+    # only carry the email and fall back to a lookup by email.
+    user_id = jwt_payload.get("uid")
+    if user_id is not None:
+        user = get_cached_user(user_id)
+        if user and user.email == jwt_payload["sub"]:
+            return user
+        user = db.query(User).filter(User.id == user_id).first()
+    else:
+        user = db.query(User).filter(User.email == jwt_payload["sub"]).first()
+    if not user or user.email != jwt_payload["sub"]:
         raise HTTPException(status_code=404, detail="Not logged in")
+    cache_user(user)
+    return user
+
+
+async def get_async_current_user_from_token(
+    db: AsyncSession = Depends(get_async_db),
+    jwt_payload: dict = Depends(get_jwt_user_data),
+) -> Optional[User]:
+    """
+    Async variant of get_current_user_from_token for the async routers.
+    """
+    if not jwt_payload or "sub" not in jwt_payload:
+        raise HTTPException(status_code=404, detail="Not logged in")
+
+    user_id = jwt_payload.get("uid")
+    if user_id is not None:
+        user = get_cached_user(user_id)
+        if user and user.email == jwt_payload["sub"]:
+            return user
+        user = await db.scalar(select(User).where(User.id == user_id))
+    else:
+        user = await db.scalar(
+            select(User).where(User.email == jwt_payload["sub"])
+        )
+    if not user or user.email != jwt_payload["sub"]:
+        raise HTTPException(status_code=404, detail="Not logged in")
+    cache_user(user)
     return user
 
 
@@ -123,12 +328,15 @@ def set_jwt_cookie_response(user, response_model=None, custom_content=None):
     """
 
     class UserObj:
-        def __init__(self, email, role=None):
+        def __init__(self, email, role=None, id=None):
             self.email = email
             self.role = role
+            self.id = id
 
     role = getattr(user, "role", None)
-    jwt_token = generate_jwt_token(UserObj(user.email, role))
+    jwt_token = generate_jwt_token(
+        UserObj(user.email, role, getattr(user, "id", None))
+    )
     if custom_content is not None:
         content = custom_content
     elif response_model:
@@ -0,0 +1,63 @@
+"""
+Helpers for rendering events as an iCalendar (RFC 5545) feed.
+"""
+
+from datetime import timezone
+
+ICS_HEADER = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//Loopd In//Events//EN\r\n"
+    "CALSCALE:GREGORIAN\r\n"
+    "X-WR-CALNAME:Loopd In\r\n"
+)
+ICS_FOOTER = "END:VCALENDAR\r\n"
+
+
+def ics_escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def ics_datetime(value) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def ics_fold(line: str) -> str:
+    """
+    Folds a content line to 75 octets per physical line.
+    """
+
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts = []
+    while encoded:
+        limit = 75 if not parts else 74
+        cut = min(limit, len(encoded))
+        # Don't split a multi-byte character
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def serialize_vevent(event) -> str:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:event-{event.id}@loopdin",
+        f"DTSTAMP:{ics_datetime(event.updated_at)}",
+        f"DTSTART:{ics_datetime(event.start_time)}",
+        f"DTEND:{ics_datetime(event.end_time)}",
+        f"SUMMARY:{ics_escape(event.title)}",
+    ]
+    if event.description:
+        lines.append(f"DESCRIPTION:{ics_escape(event.description)}")
+    lines.append("END:VEVENT")
+    return "".join(ics_fold(line) for line in lines)
@@ -0,0 +1,66 @@
+"""
+Helpers for HTTP conditional requests (ETag / If-None-Match).
+"""
+
+import hashlib
+import os
+from typing import Optional
+
+# Seconds browsers and shared caches may reuse a public response before
+# revalidating it with If-None-Match
+PUBLIC_CACHE_MAX_AGE = int(os.getenv("PUBLIC_CACHE_MAX_AGE", "30"))
+
+
+def make_etag(*parts) -> str:
+    """
+    Builds a strong ETag from version marker values.
+    """
+
+    digest = hashlib.sha256(
+        ":".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Checks an If-None-Match header value against an ETag.
+    """
+
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def public_cache_headers(etag: str) -> dict:
+    """
+    Headers for unauthenticated responses that a CDN may share between
+    clients.
+    """
+
+    return {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={PUBLIC_CACHE_MAX_AGE}, "
+            f"stale-while-revalidate={PUBLIC_CACHE_MAX_AGE}"
+        ),
+    }
+
+
+def event_etag(event, host) -> str:
+    """
+    ETag for an event summary. Host names are part of the payload, so they
+    are part of the tag.
+    """
+
+    host_name = (host.first_name, host.last_name) if host else None
+    return make_etag("event", event.id, event.updated_at, host_name)
+
+
+def participants_etag(event_id: int, version: int) -> str:
+    """
+    ETag for an event's accepted participant list.
+    """
+
+    return make_etag("participants", event_id, version)
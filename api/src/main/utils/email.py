@@ -1,50 +1,243 @@
 import os
+import queue
 import smtplib
 import ssl
+import threading
+import time
+from datetime import timezone
 from email.message import EmailMessage
 
+from sqlalchemy import insert
+from src.main.models import EmailOutbox
+
 ENV = os.getenv("ENV")
 
+# Authenticated SMTP sessions kept open per process
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "2"))
+# Messages per second per process, to stay under the SES sending quota.
+# 0 disables the limit.
+SMTP_RATE_LIMIT = float(os.getenv("SMTP_RATE_LIMIT", "14"))
+# Reconnect after this many messages so long-lived sessions are recycled
+SMTP_MAX_MESSAGES_PER_CONNECTION = int(
+    os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", "100")
+)
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "30"))
 
-def send_invite_email(
-    to_email: str, title: str, event_link: str, register_link: str
-):
+
+class RateLimiter:
+    """
+    Token bucket allowing up to `rate` acquisitions per second, shared
+    between threads. The bucket holds at least one token, so rates below
+    one per second still let messages through.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SMTPConnectionPool:
+    """
+    Reuses authenticated SMTP sessions across messages instead of paying
+    for a TCP + TLS handshake and AUTH per email.
+
+    `connect` returns a new, ready-to-send smtplib.SMTP. A session dropped by
+    the server is replaced and the message retried once.
+    """
+
+    def __init__(
+        self,
+        connect,
+        size: int = SMTP_POOL_SIZE,
+        rate: float = SMTP_RATE_LIMIT,
+        max_messages: int = SMTP_MAX_MESSAGES_PER_CONNECTION,
+    ):
+        self._connect = connect
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._limiter = RateLimiter(rate)
+        self.max_messages = max_messages
+
+    def send_message(self, msg: EmailMessage):
+        self._limiter.acquire()
+        with self._slots:
+            smtp, sent = self._checkout()
+            try:
+                try:
+                    smtp.send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    self._close(smtp)
+                    smtp, sent = self._connect(), 0
+                    smtp.send_message(msg)
+            except smtplib.SMTPResponseException:
+                # The server rejected this message but the session is intact
+                self._checkin(smtp, sent)
+                raise
+            except Exception:
+                self._close(smtp)
+                raise
+            self._checkin(smtp, sent + 1)
+
+    def close(self):
+        while True:
+            try:
+                smtp, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(smtp)
+
+    def _checkout(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect(), 0
+
+    def _checkin(self, smtp, sent: int):
+        if sent >= self.max_messages:
+            self._close(smtp)
+        else:
+            self._idle.put((smtp, sent))
+
+    @staticmethod
+    def _close(smtp):
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
+
+def _connect_smtp() -> smtplib.SMTP:
     # Use Amazon SES SMTP in production
     if ENV == "prod":
         SMTP_HOST = os.getenv("SES_SMTP_HOST")
         SMTP_PORT = int(os.getenv("SES_SMTP_PORT"))
         SMTP_USER = os.getenv("SES_SMTP_USERNAME")
         SMTP_PASS = os.getenv("SES_SMTP_PASSWORD")
-        FROM_EMAIL = os.getenv("SES_FROM_EMAIL")
-
-        msg = EmailMessage()
-        msg["Subject"] = f"You're invited to {title}!"
-        msg["From"] = FROM_EMAIL
-        msg["To"] = to_email
-        msg.set_content(
-            f"Hello! You've been invited to {title}. "
-            f"Click here to <a href='{event_link}'>view the event</a> or "
-            f"register <a href='{register_link}'>here</a>!",
-            subtype="html",
-        )
 
         context = ssl.create_default_context()
 
-        with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as smtp:
-            smtp.starttls(context=context)
-            smtp.login(SMTP_USER, SMTP_PASS)
-            smtp.send_message(msg)
+        smtp = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
+        smtp.starttls(context=context)
+        smtp.login(SMTP_USER, SMTP_PASS)
+        return smtp
 
     # Use Mailhog in development
+    return smtplib.SMTP("mailhog", 1025, timeout=SMTP_TIMEOUT)
+
+
+_smtp_pool = None
+_smtp_pool_lock = threading.Lock()
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    global _smtp_pool
+    with _smtp_pool_lock:
+        if _smtp_pool is None:
+            _smtp_pool = SMTPConnectionPool(_connect_smtp)
+        return _smtp_pool
+
+
+def build_invite_email(
+    title: str, event_link: str, register_link: str
+) -> tuple[str, str]:
+    """
+    Returns the subject and HTML body of an invite email.
+    """
+
+    subject = f"You're invited to {title}!"
+    body = (
+        f"Hello! You've been invited to {title}. "
+        f"Click here to <a href='{event_link}'>view the event</a> or "
+        f"register <a href='{register_link}'>here</a>!"
+    )
+    return subject, body
+
+
+def build_reminder_email(
+    title: str, start_time, event_link: str
+) -> tuple[str, str]:
+    """
+    Returns the subject and HTML body of an upcoming event reminder.
+    """
+
+    start = start_time.astimezone(timezone.utc).strftime("%B %d at %H:%M UTC")
+    subject = f"Reminder: {title} starts soon"
+    body = (
+        f"Hello! {title} starts on {start}. "
+        f"Click here to <a href='{event_link}'>view the event</a>."
+    )
+    return subject, body
+
+
+def enqueue_email(db, to_email: str, subject: str, body: str) -> EmailOutbox:
+    """
+    Adds an email to the outbox without committing, so it is only delivered
+    if the caller's transaction commits.
+    """
+
+    message = EmailOutbox(to_email=to_email, subject=subject, body=body)
+    db.add(message)
+    return message
+
+
+def enqueue_emails(db, messages: list[tuple[str, str, str]]):
+    """
+    Adds (to_email, subject, body) messages to the outbox with one
+    multi-row INSERT, without committing.
+    """
+
+    if messages:
+        db.execute(
+            insert(EmailOutbox),
+            [
+                {"to_email": to_email, "subject": subject, "body": body}
+                for to_email, subject, body in messages
+            ],
+        )
+
+
+def enqueue_invite_email(
+    db, to_email: str, title: str, event_link: str, register_link: str
+) -> EmailOutbox:
+    subject, body = build_invite_email(title, event_link, register_link)
+    return enqueue_email(db, to_email, subject, body)
+
+
+def send_email(to_email: str, subject: str, body: str):
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    if ENV == "prod":
+        msg["From"] = os.getenv("SES_FROM_EMAIL")
     else:
-        msg = EmailMessage()
-        msg["Subject"] = f"You're invited to {title}!"
         msg["From"] = "noreply@yourapp.local"
-        msg["To"] = to_email
-        msg.set_content(
-            f"Hello! You've been invited to {title}. Click here to <a href='{event_link}'>view the event</a> or register <a href='{register_link}'>here</a>!",
-            subtype="html",
-        )
+    msg["To"] = to_email
+    msg.set_content(body, subtype="html")
 
-        with smtplib.SMTP("mailhog", 1025) as smtp:
-            smtp.send_message(msg)
+    get_smtp_pool().send_message(msg)
+
+
+def send_invite_email(
+    to_email: str, title: str, event_link: str, register_link: str
+):
+    subject, body = build_invite_email(title, event_link, register_link)
+    send_email(to_email, subject, body)
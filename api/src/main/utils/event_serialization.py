@@ -1,29 +1,76 @@
-from src.main.models import User
+from sqlalchemy.orm import joinedload
+from src.main.models import Event, User
 
+from .invite_counters import serialize_invite_counts
 
-def serialize_eventout(event, db):
-    host = db.query(User).filter(User.id == event.host_id).first()
-    host_name = (
-        f"{host.first_name or ''} {host.last_name or ''}".strip() or host.email
+
+def serialize_display_name(user):
+    return (
+        f"{user.first_name or ''} {user.last_name or ''}".strip() or user.email
     )
+
+
+def serialize_eventout(event, db):
+    return serialize_eventouts([event], db)[0]
+
+
+def serialize_eventouts(events, db):
+    """
+    Serialize a list of events, loading every referenced host in a single
+    query instead of one query per event.
+    """
+    host_ids = {event.host_id for event in events}
+    hosts = {}
+    if host_ids:
+        hosts = {
+            host.id: host
+            for host in db.query(User).filter(User.id.in_(host_ids)).all()
+        }
+    return [
+        serialize_event_summary(event, hosts.get(event.host_id))
+        for event in events
+    ]
+
+
+def serialize_event_summary(event, host, with_counts=True):
+    """
+    Serialize an event. Pass with_counts=False where the viewer shouldn't
+    see the invite counters, or where they would churn a cached page.
+    """
     return {
         "id": event.id,
         "title": event.title,
         "description": event.description or None,
         "host_id": event.host_id,
-        "host_name": host_name,
+        "host_name": serialize_display_name(host) if host else None,
         "start_time": event.start_time,
         "end_time": event.end_time,
+        "invite_counts": (
+            serialize_invite_counts(event) if with_counts else None
+        ),
     }
 
 
+def load_events_with_hosts(event_ids, db):
+    """
+    Load events by id with their hosts eager-loaded in the same query.
+    Returns a dict keyed by event id.
+    """
+    if not event_ids:
+        return {}
+    events = (
+        db.query(Event)
+        .options(joinedload(Event.host))
+        .filter(Event.id.in_(event_ids))
+        .all()
+    )
+    return {event.id: event for event in events}
+
+
 def serialize_participantout(invite):
     user = invite.user
     if user:
-        name = (
-            f"{user.first_name or ''} {user.last_name or ''}".strip()
-            or user.email
-        )
+        name = serialize_display_name(user)
     else:
         name = invite.email
     return {
@@ -0,0 +1,251 @@
+"""
+Live invite and participant changes per event.
+
+Writers publish changes with Postgres NOTIFY in their own transaction, so
+a change is seen only once it commits, and by every API worker. Each
+worker keeps one LISTEN connection, read from the event loop, and fans the
+changes out to the Server-Sent Events streams open for that event.
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+
+import orjson
+from sqlalchemy import text
+from src.main import database
+
+from .event_serialization import serialize_participantout
+from .responses import dump_json
+
+logger = logging.getLogger(__name__)
+
+EVENT_STREAM_CHANNEL = "event_changes"
+# Seconds between keep-alive comments on an idle stream
+EVENT_STREAM_HEARTBEAT = float(os.getenv("EVENT_STREAM_HEARTBEAT", "15"))
+# Changes buffered per stream before a slow client is told to resync
+EVENT_STREAM_QUEUE_SIZE = int(os.getenv("EVENT_STREAM_QUEUE_SIZE", "100"))
+
+
+def invite_change(action: str, invite) -> dict:
+    """
+    An invite was created, updated, deleted or expired. Accepts an Invite
+    or a RETURNING row with the same columns.
+    """
+
+    return {
+        "event_id": invite.event_id,
+        "type": "invite",
+        "action": action,
+        "data": {
+            "id": invite.id,
+            "email": invite.email,
+            "role": invite.role,
+            "status": invite.status,
+        },
+    }
+
+
+def participant_change(action: str, invite, participant_name=None) -> dict:
+    """
+    A participant was added or removed through the given invite.
+    """
+
+    if participant_name is None:
+        participant = serialize_participantout(invite)
+    else:
+        participant = {
+            "participant_name": participant_name,
+            "role": invite.role,
+        }
+    return {
+        "event_id": invite.event_id,
+        "type": "participant",
+        "action": action,
+        "data": {"invite_id": invite.id, **participant},
+    }
+
+
+def notify_event_changes(db, changes: list[dict]):
+    """
+    Publishes changes with one statement, without committing. Postgres
+    delivers them to listeners only if the caller's transaction commits.
+    """
+
+    if changes:
+        db.execute(
+            text(
+                "SELECT pg_notify(:channel, payload) "
+                "FROM unnest(CAST(:payloads AS text[])) AS payload"
+            ),
+            {
+                "channel": EVENT_STREAM_CHANNEL,
+                "payloads": [dump_json(change).decode() for change in changes],
+            },
+        )
+
+
+def resync_change() -> dict:
+    """
+    Tells a stream's client to reload, since changes were dropped.
+    """
+
+    return {"event_id": None, "type": "resync", "action": None, "data": None}
+
+
+def format_sse(change: dict) -> str:
+    """
+    Formats a change as a Server-Sent Event named after its type.
+    """
+
+    return f"event: {change['type']}\ndata: {dump_json(change).decode()}\n\n"
+
+
+class EventChangeBroker:
+    """
+    Fans NOTIFY payloads out to per-event subscriber queues in this worker.
+
+    `connect` returns a psycopg2 connection for LISTEN. It is opened, off
+    the event loop, by the first subscriber and closed once no subscriber
+    is left. A subscriber whose queue fills up, or every subscriber if the
+    connection is lost, receives a "resync" change and should reload its
+    lists.
+
+    Queues are held weakly, so a stream dropped before it started does not
+    keep its subscription alive.
+    """
+
+    def __init__(self, connect, queue_size: int = EVENT_STREAM_QUEUE_SIZE):
+        self._connect = connect
+        self.queue_size = queue_size
+        self._subscribers = {}
+        self._connection = None
+        self._loop = None
+        self._connecting = asyncio.Lock()
+
+    async def subscribe(self, event_id: int) -> asyncio.Queue:
+        """
+        Returns a queue of the event's changes. Raises if the LISTEN
+        connection can't be opened.
+        """
+
+        async with self._connecting:
+            if self._connection is None:
+                # Checking out and connecting can block for the pool or
+                # connect timeout, so keep it off the event loop
+                connection = await asyncio.to_thread(self._listen_connection)
+                self._loop = asyncio.get_running_loop()
+                self._loop.add_reader(connection.fileno(), self._on_readable)
+                self._connection = connection
+        queue = asyncio.Queue(self.queue_size)
+        self._subscribers.setdefault(event_id, weakref.WeakSet()).add(queue)
+        return queue
+
+    def unsubscribe(self, event_id: int, queue: asyncio.Queue):
+        self._subscribers.get(event_id, weakref.WeakSet()).discard(queue)
+        self._close_if_unused()
+
+    def publish(self, change: dict):
+        for queue in list(self._subscribers.get(change["event_id"], ())):
+            self._put(queue, change)
+
+    def close(self):
+        if self._connection is None:
+            return
+        self._loop.remove_reader(self._connection.fileno())
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+    def _listen_connection(self):
+        connection = self._connect()
+        try:
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {EVENT_STREAM_CHANNEL}")
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    def _close_if_unused(self):
+        for event_id, queues in list(self._subscribers.items()):
+            if not queues:
+                del self._subscribers[event_id]
+        if not self._subscribers:
+            self.close()
+
+    def _on_readable(self):
+        try:
+            self._connection.poll()
+        except Exception:
+            logger.exception("Event stream listener connection lost")
+            self.close()
+            for queues in self._subscribers.values():
+                for queue in queues:
+                    self._put(queue, resync_change())
+            return
+        while self._connection.notifies:
+            notify = self._connection.notifies.pop(0)
+            self.publish(orjson.loads(notify.payload))
+        self._close_if_unused()
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, change: dict):
+        try:
+            queue.put_nowait(change)
+        except asyncio.QueueFull:
+            # Drop the backlog; the client reloads instead of replaying it
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(resync_change())
+
+
+_event_change_broker = None
+
+
+def get_event_change_broker() -> EventChangeBroker:
+    global _event_change_broker
+    if _event_change_broker is None:
+
+        def connect():
+            # A connection of our own, outside the pool, for as long as
+            # anyone is listening
+            connection = database.engine.raw_connection()
+            driver_connection = connection.driver_connection
+            connection.detach()
+            return driver_connection
+
+        _event_change_broker = EventChangeBroker(connect)
+    return _event_change_broker
+
+
+async def stream_event_changes(
+    request, event_id: int, snapshot: dict, queue: asyncio.Queue
+):
+    """
+    Yields Server-Sent Events for one event from a queue subscribed to it:
+    the snapshot first, then each change, with keep-alive comments while
+    idle. Ends when the client disconnects or after a resync.
+    """
+
+    try:
+        yield format_sse(snapshot)
+        while True:
+            try:
+                change = await asyncio.wait_for(
+                    queue.get(), EVENT_STREAM_HEARTBEAT
+                )
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield ": keep-alive\n\n"
+                continue
+            yield format_sse(change)
+            if change["type"] == "resync":
+                return
+    finally:
+        get_event_change_broker().unsubscribe(event_id, queue)
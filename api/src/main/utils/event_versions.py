@@ -0,0 +1,35 @@
+from sqlalchemy import select, update
+from src.main.models import Event, Invite
+
+
+def bump_participants_version(db, event_ids) -> list[int]:
+    """
+    Marks the participant lists of the given events (a list or a subquery)
+    as changed, without committing, and returns the ids of the bumped
+    events. Leaves updated_at alone since the event itself didn't change.
+    """
+
+    return list(
+        db.scalars(
+            update(Event)
+            .where(Event.id.in_(event_ids))
+            .values(
+                {
+                    Event.participants_version: Event.participants_version + 1,
+                    Event.updated_at: Event.updated_at,
+                }
+            )
+            .returning(Event.id)
+            .execution_options(synchronize_session=False)
+        )
+    )
+
+
+def accepted_event_ids(email: str):
+    """
+    Subquery of events where an invite for this email was accepted.
+    """
+
+    return select(Invite.event_id).where(
+        Invite.email == email, Invite.status == "accepted"
+    )
@@ -0,0 +1,145 @@
+from sqlalchemy import (
+    Integer,
+    case,
+    column,
+    func,
+    or_,
+    select,
+    update,
+    values,
+)
+from src.main.models import Event, Invite
+
+# Invite status -> the Event column counting invites in that status
+INVITE_COUNT_COLUMNS = {
+    "pending": Event.pending_count,
+    "accepted": Event.accepted_count,
+    "declined": Event.declined_count,
+}
+
+
+def adjust_invite_counts(
+    db, event_id: int, changes: dict, participants_changed: bool = False
+):
+    """
+    Applies {status: delta} to an event's invite counters in the caller's
+    transaction. The increments happen in SQL, so concurrent writers don't
+    lose updates. Leaves updated_at alone since the event didn't change.
+    Statuses without a counter, such as expired, are ignored.
+
+    With participants_changed, the same UPDATE also bumps the event's
+    participants_version (see bump_participants_version).
+    """
+
+    values = {
+        INVITE_COUNT_COLUMNS[status]: INVITE_COUNT_COLUMNS[status] + delta
+        for status, delta in changes.items()
+        if delta and status in INVITE_COUNT_COLUMNS
+    }
+    if participants_changed:
+        values[Event.participants_version] = Event.participants_version + 1
+    if not values:
+        return
+    values[Event.updated_at] = Event.updated_at
+    db.query(Event).filter(Event.id == event_id).update(
+        values, synchronize_session=False
+    )
+
+
+def subtract_invite_counts(db, invites):
+    """
+    Decrements the counters for deleted or expired invites, given
+    (event_id, status) pairs, with a single UPDATE joined to the per-event
+    totals. Events that lost an accepted invite also get their
+    participants_version bumped. Expired invites aren't counted.
+    """
+
+    removed = {}
+    for event_id, status in invites:
+        if status not in INVITE_COUNT_COLUMNS:
+            continue
+        counts = removed.setdefault(
+            event_id, dict.fromkeys(INVITE_COUNT_COLUMNS, 0)
+        )
+        counts[status] += 1
+    if not removed:
+        return
+
+    deltas = values(
+        column("event_id", Integer),
+        *(column(status, Integer) for status in INVITE_COUNT_COLUMNS),
+        name="deltas",
+    ).data(
+        [
+            (event_id, *counts.values())
+            for event_id, counts in sorted(removed.items())
+        ]
+    )
+    db.execute(
+        update(Event)
+        .where(Event.id == deltas.c.event_id)
+        .values(
+            {
+                column: column - deltas.c[status]
+                for status, column in INVITE_COUNT_COLUMNS.items()
+            }
+            | {
+                Event.participants_version: Event.participants_version
+                + case((deltas.c.accepted > 0, 1), else_=0),
+                Event.updated_at: Event.updated_at,
+            }
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def serialize_invite_counts(event) -> dict:
+    return {
+        "pending": event.pending_count,
+        "accepted": event.accepted_count,
+        "declined": event.declined_count,
+    }
+
+
+def reconcile_invite_counts(db, first_id: int, last_id: int) -> list[int]:
+    """
+    Recomputes the counters of events first_id..last_id from their invites
+    and returns the ids of events whose counters had drifted. Does not
+    commit.
+
+    The events are locked first, so an invite written concurrently either
+    is visible to the recount or adjusts the counter after it.
+    """
+
+    in_range = Event.id.between(first_id, last_id)
+    db.execute(select(Event.id).where(in_range).with_for_update())
+    # Each recount is an index-only scan on ix_invites_event_id_status
+    recounted = {
+        status: select(func.count())
+        .where(Invite.event_id == Event.id, Invite.status == status)
+        .scalar_subquery()
+        for status in INVITE_COUNT_COLUMNS
+    }
+    return list(
+        db.scalars(
+            update(Event)
+            .where(
+                in_range,
+                or_(
+                    *(
+                        column != recounted[status]
+                        for status, column in INVITE_COUNT_COLUMNS.items()
+                    )
+                ),
+            )
+            .values(
+                {
+                    column: recounted[status]
+                    for status, column in INVITE_COUNT_COLUMNS.items()
+                }
+                | {Event.updated_at: Event.updated_at}
+            )
+            .returning(Event.id)
+            .execution_options(synchronize_session=False)
+        )
+    )
@@ -0,0 +1,88 @@
+import os
+import uuid
+
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from src.main.models import Invite, User
+
+from .email import build_invite_email, enqueue_emails
+from .event_stream import invite_change, notify_event_changes
+from .invite_counters import adjust_invite_counts
+
+
+def invite_links(token: str, email: str) -> tuple[str, str]:
+    """
+    Returns the event and registration links included in an invite email.
+    """
+
+    ui_url = os.environ.get("UI_URL", "http://localhost")
+    return f"{ui_url}/events/token/{token}", f"{ui_url}/signup?email={email}"
+
+
+def insert_invites(db, event, roles_by_email: dict) -> list[Invite]:
+    """
+    Invites each email (mapped to its role) to the event with set-based
+    statements and queues the invite emails, without committing.
+
+    Emails already invited to the event hit the (event_id, email) unique
+    index and are skipped; only the newly created invites are returned and
+    added to the event's pending count.
+    """
+
+    if not roles_by_email:
+        return []
+
+    # Link invites to registered users with one lookup
+    user_ids = dict(
+        db.query(User.email, User.id)
+        .filter(User.email.in_(roles_by_email.keys()))
+        .all()
+    )
+
+    new_invites = db.scalars(
+        insert(Invite)
+        .values(
+            [
+                {
+                    "event_id": event.id,
+                    "email": email,
+                    "role": role,
+                    "token": str(uuid.uuid4()),
+                    "status": "pending",
+                    "user_id": user_ids.get(email),
+                }
+                for email, role in roles_by_email.items()
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=["event_id", "email"])
+        .returning(Invite)
+    ).all()
+    adjust_invite_counts(db, event.id, {"pending": len(new_invites)})
+    notify_event_changes(
+        db, [invite_change("created", invite) for invite in new_invites]
+    )
+
+    # Queue all invite emails in the caller's transaction
+    emails = []
+    for invite in new_invites:
+        event_link, register_link = invite_links(invite.token, invite.email)
+        subject, body = build_invite_email(
+            event.title, event_link, register_link
+        )
+        emails.append((invite.email, subject, body))
+    enqueue_emails(db, emails)
+    return new_invites
+
+
+def link_invites_to_user(db, email: str, user_id: int):
+    """
+    Links every unlinked invite for the email to the user with one UPDATE,
+    without committing.
+    """
+
+    db.execute(
+        update(Invite)
+        .where(Invite.email == email, Invite.user_id.is_(None))
+        .values(user_id=user_id)
+        .execution_options(synchronize_session=False)
+    )
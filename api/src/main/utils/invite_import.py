@@ -0,0 +1,124 @@
+"""
+Background processing for guest-list CSV imports.
+
+The CSV is read row by row and inserted in bounded batches, so memory stays
+flat regardless of file size. Progress is committed after every batch of
+rows, valid or not, and can be polled through the InviteImport row.
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+
+from pydantic import TypeAdapter, ValidationError
+from src.main import database
+from src.main.models import Event, InviteImport
+from src.main.schemas import InviteBase
+
+from .invite_creation import insert_invites
+
+INVITE_IMPORT_BATCH_SIZE = int(os.getenv("INVITE_IMPORT_BATCH_SIZE", "500"))
+# Only the first errors are kept on the import; error_count has the total
+INVITE_IMPORT_MAX_ERRORS = 500
+
+_invite_row = TypeAdapter(InviteBase)
+
+
+def parse_invite_rows(lines):
+    """
+    Yields (row_number, email, role, error) for each non-empty CSV row of
+    "email[,role]". A leading "email" header row is skipped. Rows that fail
+    InviteBase validation have an error message and no role.
+    """
+
+    for row_number, row in enumerate(csv.reader(lines), start=1):
+        if not any(cell.strip() for cell in row):
+            continue
+        email = row[0].strip()
+        if row_number == 1 and email.lower() == "email":
+            continue
+        role = row[1].strip() if len(row) > 1 and row[1].strip() else None
+        data = {"email": email}
+        if role:
+            data["role"] = role
+        try:
+            invite = _invite_row.validate_python(data)
+        except ValidationError as error:
+            yield row_number, email, None, error.errors()[0]["msg"]
+        else:
+            yield row_number, invite.email, invite.role, None
+
+
+def save_invite_upload(file) -> str:
+    """
+    Copies an uploaded CSV to a temporary file for run_invite_import, which
+    deletes it when done, and returns its path.
+    """
+
+    with tempfile.NamedTemporaryFile(
+        suffix=".csv", delete=False
+    ) as destination:
+        shutil.copyfileobj(file.file, destination)
+    return destination.name
+
+
+def _flush_batch(db, job, event, batch: dict, errors: list, rows: int):
+    created = insert_invites(db, event, batch)
+    job.processed_rows += rows
+    job.created_count += len(created)
+    job.skipped_count += len(batch) - len(created)
+    job.error_count += len(errors)
+    room = INVITE_IMPORT_MAX_ERRORS - len(job.errors)
+    if errors and room > 0:
+        job.errors = job.errors + errors[:room]
+    db.commit()
+
+
+def run_invite_import(import_id: int, path: str):
+    """
+    Imports the CSV at path for an InviteImport, then deletes the file.
+    """
+
+    db = database.SessionLocal()
+    try:
+        job = db.get(InviteImport, import_id)
+        event = db.get(Event, job.event_id)
+        batch, errors, rows = {}, [], 0
+        with open(path, newline="", encoding="utf-8-sig") as lines:
+            for row_number, email, role, error in parse_invite_rows(lines):
+                rows += 1
+                if error:
+                    errors.append(
+                        {"row": row_number, "email": email, "error": error}
+                    )
+                elif email in batch:
+                    # Repeated within the batch; later batches are caught
+                    # by the unique index
+                    job.skipped_count += 1
+                else:
+                    batch[email] = role
+                # Count every row, valid or not, so files of mostly bad or
+                # repeated rows still flush and report progress
+                if rows >= INVITE_IMPORT_BATCH_SIZE:
+                    _flush_batch(db, job, event, batch, errors, rows)
+                    batch, errors, rows = {}, [], 0
+        _flush_batch(db, job, event, batch, errors, rows)
+        job.status = "completed"
+        job.finished_at = datetime.now(timezone.utc)
+        db.commit()
+    except Exception as error:
+        db.rollback()
+        job = db.get(InviteImport, import_id)
+        if job:
+            job.status = "failed"
+            job.errors = job.errors + [
+                {"row": None, "email": None, "error": str(error)}
+            ]
+            job.finished_at = datetime.now(timezone.utc)
+            db.commit()
+        raise
+    finally:
+        db.close()
+        os.unlink(path)
@@ -1,46 +1,51 @@
-from src.main.models.event import Event
 from src.main.models.user import User
 
+from .event_serialization import (
+    load_events_with_hosts,
+    serialize_display_name,
+    serialize_event_summary,
+)
+
 
 def serialize_inviteout(invite, db):
-    event = db.query(Event).filter(Event.id == invite.event_id).first()
-    host = (
-        db.query(User).filter(User.id == event.host_id).first()
-        if event
-        else None
+    return serialize_inviteouts([invite], db)[0]
+
+
+def serialize_inviteouts(invites, db):
+    """
+    Serialize a list of invites with a constant number of queries: one for
+    the referenced events (hosts joined in) and one for the invited users.
+    """
+    events = load_events_with_hosts(
+        {invite.event_id for invite in invites}, db
     )
-    event_summary = None
-    if event:
-        host_name = None
-        if host:
-            host_name = (
-                f"{host.first_name or ''} {host.last_name or ''}".strip()
-                or host.email
-            )
-        event_summary = {
-            "id": event.id,
-            "title": event.title,
-            "description": event.description,
-            "host_id": event.host_id,
-            "host_name": host_name,
-            "start_time": event.start_time,
-            "end_time": event.end_time,
+    user_ids = {invite.user_id for invite in invites if invite.user_id}
+    users = {}
+    if user_ids:
+        users = {
+            user.id: user
+            for user in db.query(User).filter(User.id.in_(user_ids)).all()
         }
-    # Get user_name from invite.user_id
-    user_name = None
-    if invite.user_id:
-        user = db.query(User).filter(User.id == invite.user_id).first()
-        if user:
-            user_name = (
-                f"{user.first_name or ''} {user.last_name or ''}".strip()
-                or user.email
-            )
-    return {
-        "id": invite.id,
-        "token": invite.token,
-        "email": invite.email,
-        "role": invite.role,
-        "status": invite.status,
-        "event": event_summary,
-        "user_name": user_name,
-    }
+
+    results = []
+    for invite in invites:
+        event = events.get(invite.event_id)
+        # Invitees see the event, not how the rest of the guest list replied
+        event_summary = (
+            serialize_event_summary(event, event.host, with_counts=False)
+            if event
+            else None
+        )
+        user = users.get(invite.user_id)
+        results.append(
+            {
+                "id": invite.id,
+                "token": invite.token,
+                "email": invite.email,
+                "role": invite.role,
+                "status": invite.status,
+                "event": event_summary,
+                "user_name": serialize_display_name(user) if user else None,
+            }
+        )
+    return results
@@ -0,0 +1,51 @@
+"""
+Helpers for keyset (cursor) pagination of listing endpoints.
+"""
+
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+
+
+def encode_cursor(*values) -> str:
+    """
+    Encodes the sort key of the last row on a page as an opaque cursor.
+    """
+
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value
+        for value in values
+    ]
+    return (
+        base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8"))
+        .decode("ascii")
+        .rstrip("=")
+    )
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """
+    Decodes a cursor produced by encode_cursor into its sort key values.
+    Raises HTTPException if the cursor is malformed.
+    """
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except ValueError:
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+    return values
+
+
+def paginate(query, limit: int):
+    """
+    Runs an already-ordered query for one page. Returns the rows and whether
+    more rows follow.
+    """
+
+    rows = query.limit(limit + 1).all()
+    return rows[:limit], len(rows) > limit
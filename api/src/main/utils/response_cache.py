@@ -0,0 +1,275 @@
+"""
+Server-side cache for the public event pages.
+
+Invite links are shared widely and nearly every hit after a mass invite
+asks for the same payload, so the serialized responses are kept here and
+dropped by the routers that change them once their transaction commits.
+
+The cache lives in process memory by default. Set RESPONSE_CACHE_URL to a
+redis:// URL (requires the redis package) to share it between workers.
+
+The async routers use the *_async functions, which reach Redis through
+redis.asyncio, so a slow Redis never blocks the event loop.
+"""
+
+import asyncio
+import json
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import orjson
+from src.main.database import run_sync_handler
+
+from .cache import TTLCache
+from .responses import dump_json
+
+RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL", "")
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "10000"))
+
+
+class MemoryResponseCache:
+    """
+    Per-process backend built on TTLCache.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, key):
+        return self._cache.get(key)
+
+    def set(self, key, value):
+        self._cache.set(key, value)
+
+    def delete(self, *keys):
+        for key in keys:
+            self._cache.delete(key)
+
+    async def get_async(self, key):
+        return self.get(key)
+
+    async def set_async(self, key, value):
+        self.set(key, value)
+
+    async def delete_async(self, *keys):
+        self.delete(*keys)
+
+
+class RedisResponseCache:
+    """
+    Shared backend for any client with the redis-py get/set/delete API.
+    Values are stored as JSON and expire after ttl seconds.
+
+    The async methods use async_client (e.g. a redis.asyncio client) when
+    given, and otherwise run the sync client in a worker thread.
+    """
+
+    def __init__(
+        self,
+        client,
+        ttl: float,
+        prefix: str = "response:",
+        async_client=None,
+    ):
+        self.client = client
+        self.async_client = async_client
+        self.ttl = max(1, int(ttl))
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    def set(self, key, value):
+        self.client.set(self.prefix + key, json.dumps(value), ex=self.ttl)
+
+    def delete(self, *keys):
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    async def get_async(self, key):
+        if self.async_client is None:
+            return await asyncio.to_thread(self.get, key)
+        raw = await self.async_client.get(self.prefix + key)
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    async def set_async(self, key, value):
+        if self.async_client is None:
+            return await asyncio.to_thread(self.set, key, value)
+        await self.async_client.set(
+            self.prefix + key, json.dumps(value), ex=self.ttl
+        )
+
+    async def delete_async(self, *keys):
+        if self.async_client is None:
+            return await asyncio.to_thread(self.delete, *keys)
+        if keys:
+            await self.async_client.delete(
+                *(self.prefix + key for key in keys)
+            )
+
+
+def create_response_cache(url: str = RESPONSE_CACHE_URL):
+    """
+    Builds the backend for the given URL; empty means in-process memory.
+    """
+
+    if not url:
+        return MemoryResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+    try:
+        import redis
+        import redis.asyncio
+    except ImportError:
+        raise RuntimeError(
+            "RESPONSE_CACHE_URL is set but the redis package is not "
+            "installed."
+        )
+    return RedisResponseCache(
+        redis.Redis.from_url(url),
+        RESPONSE_CACHE_TTL,
+        async_client=redis.asyncio.Redis.from_url(url),
+    )
+
+
+_response_cache = None
+
+
+def get_response_cache():
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = create_response_cache()
+    return _response_cache
+
+
+def set_response_cache(cache):
+    """
+    Replaces the process-wide backend (used by tests and benchmarks).
+    """
+
+    global _response_cache
+    _response_cache = cache
+
+
+def get_cached_event_page(token: str):
+    """
+    Returns the cached {"etag", "body"} entry for an invite token's event
+    page, or None.
+    """
+
+    cache = get_response_cache()
+    event_id = cache.get(f"invite-token:{token}")
+    if event_id is None:
+        return None
+    return cache.get(f"event:{event_id}")
+
+
+async def get_cached_event_page_async(token: str):
+    cache = get_response_cache()
+    event_id = await cache.get_async(f"invite-token:{token}")
+    if event_id is None:
+        return None
+    return await cache.get_async(f"event:{event_id}")
+
+
+def _page_entry(etag: str, body) -> dict:
+    return {"etag": etag, "body": orjson.loads(dump_json(body))}
+
+
+def cache_event_page(token: str, event_id: int, etag: str, body):
+    """
+    Caches an event page and returns it in its cached (JSON-ready) form.
+    """
+
+    entry = _page_entry(etag, body)
+    cache = get_response_cache()
+    cache.set(f"invite-token:{token}", event_id)
+    cache.set(f"event:{event_id}", entry)
+    return entry
+
+
+async def cache_event_page_async(token: str, event_id: int, etag: str, body):
+    entry = _page_entry(etag, body)
+    cache = get_response_cache()
+    await cache.set_async(f"invite-token:{token}", event_id)
+    await cache.set_async(f"event:{event_id}", entry)
+    return entry
+
+
+def get_cached_participants(event_id: int):
+    return get_response_cache().get(f"participants:{event_id}")
+
+
+async def get_cached_participants_async(event_id: int):
+    return await get_response_cache().get_async(f"participants:{event_id}")
+
+
+def cache_participants(event_id: int, etag: str, body):
+    entry = _page_entry(etag, body)
+    get_response_cache().set(f"participants:{event_id}", entry)
+    return entry
+
+
+async def cache_participants_async(event_id: int, etag: str, body):
+    entry = _page_entry(etag, body)
+    await get_response_cache().set_async(f"participants:{event_id}", entry)
+    return entry
+
+
+# Set while an async router runs a sync handler on the event loop; the
+# handler's invalidations are collected here and applied afterwards
+_deferred_invalidations = ContextVar("deferred_invalidations", default=None)
+
+
+def invalidate_event_pages(event_ids, tokens=()):
+    """
+    Drops cached pages for the given events and invite tokens. Call after
+    the change is committed. Pages are rebuilt from the primary, so a miss
+    after this call caches the committed data. A reader that loaded the old
+    data before the commit can still store it afterwards, which
+    RESPONSE_CACHE_TTL bounds.
+    """
+
+    keys = [f"event:{event_id}" for event_id in event_ids]
+    keys += [f"participants:{event_id}" for event_id in event_ids]
+    keys += [f"invite-token:{token}" for token in tokens]
+    deferred = _deferred_invalidations.get()
+    if deferred is not None:
+        deferred.extend(keys)
+    else:
+        get_response_cache().delete(*keys)
+
+
+@contextmanager
+def defer_invalidations():
+    """
+    Collects the keys invalidate_event_pages would drop within the block,
+    for the caller to delete with the cache's async interface.
+    """
+
+    keys = []
+    token = _deferred_invalidations.set(keys)
+    try:
+        yield keys
+    finally:
+        _deferred_invalidations.reset(token)
+
+
+async def run_sync_writer(db, handler, *args, **kwargs):
+    """
+    run_sync_handler for handlers that invalidate cached pages. The handler
+    runs on the event loop, so its invalidations are deferred and applied
+    through the cache's async interface once it returns.
+    """
+
+    with defer_invalidations() as keys:
+        try:
+            return await run_sync_handler(db, handler, *args, **kwargs)
+        finally:
+            if keys:
+                await get_response_cache().delete_async(*keys)
@@ -0,0 +1,27 @@
+"""
+Fast JSON responses for payloads built by the serializers in this package.
+"""
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+def dump_json(content) -> bytes:
+    """
+    Encodes JSON-ready data plus datetimes, UTC as "Z" like pydantic does.
+    """
+
+    return orjson.dumps(
+        content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    )
+
+
+class SerializedJSONResponse(ORJSONResponse):
+    """
+    Encodes serializer output with orjson as-is. Returning it from an
+    endpoint bypasses response_model validation, so the content must already
+    have the declared model's shape; the serializer tests check this.
+    """
+
+    def render(self, content) -> bytes:
+        return dump_json(content)
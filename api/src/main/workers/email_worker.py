@@ -0,0 +1,122 @@
+"""
+Email outbox worker.
+
+Drains the email_outbox table in batches, retrying failed deliveries with
+exponential backoff and marking messages dead after EMAIL_MAX_ATTEMPTS.
+Several workers can run side by side: rows are claimed with
+SELECT ... FOR UPDATE SKIP LOCKED.
+
+Run with: python -m src.main.workers.email_worker
+"""
+
+import logging
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.main import database
+from src.main.models import EmailOutbox
+from src.main.utils.email import send_email
+
+logger = logging.getLogger(__name__)
+
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", "50"))
+EMAIL_POLL_INTERVAL = float(os.getenv("EMAIL_POLL_INTERVAL", "2"))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "8"))
+EMAIL_BACKOFF_BASE = float(os.getenv("EMAIL_BACKOFF_BASE", "30"))
+EMAIL_BACKOFF_MAX = float(os.getenv("EMAIL_BACKOFF_MAX", "3600"))
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Exponential backoff with jitter: base * 2^(attempts - 1), capped.
+    """
+
+    delay = min(EMAIL_BACKOFF_BASE * 2 ** (attempts - 1), EMAIL_BACKOFF_MAX)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def claim_batch(db, batch_size: int = EMAIL_BATCH_SIZE) -> list[EmailOutbox]:
+    """
+    Locks up to batch_size due messages for this worker's transaction.
+    """
+
+    return (
+        db.query(EmailOutbox)
+        .filter(
+            EmailOutbox.status == "pending",
+            EmailOutbox.next_attempt_at <= datetime.now(timezone.utc),
+        )
+        .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+
+def deliver(messages: list[EmailOutbox], send=send_email):
+    """
+    Sends each message and records the outcome on the row.
+    """
+
+    for message in messages:
+        now = datetime.now(timezone.utc)
+        try:
+            send(message.to_email, message.subject, message.body)
+        except Exception as error:
+            message.attempts += 1
+            message.last_error = repr(error)
+            if message.attempts >= EMAIL_MAX_ATTEMPTS:
+                message.status = "dead"
+                logger.error(
+                    "Email %s dead after %s attempts: %r",
+                    message.id,
+                    message.attempts,
+                    error,
+                )
+            else:
+                message.next_attempt_at = now + retry_delay(message.attempts)
+        else:
+            message.attempts += 1
+            message.status = "sent"
+            message.sent_at = now
+
+
+def process_batch(db, batch_size: int = EMAIL_BATCH_SIZE) -> int:
+    """
+    Claims, delivers and commits one batch. Returns the number of messages
+    processed.
+    """
+
+    messages = claim_batch(db, batch_size)
+    deliver(messages)
+    db.commit()
+    return len(messages)
+
+
+def run():
+    while True:
+        with database.SessionLocal() as db:
+            try:
+                processed = process_batch(db)
+            except Exception:
+                logger.exception("Email outbox batch failed")
+                db.rollback()
+                processed = 0
+        # Keep draining while there is a backlog
+        if processed < EMAIL_BATCH_SIZE:
+            time.sleep(EMAIL_POLL_INTERVAL)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable is not set.")
+    database.init_engine_and_session(database_url)
+    run()
+
+
+if __name__ == "__main__":
+    main()
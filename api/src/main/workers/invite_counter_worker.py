@@ -0,0 +1,71 @@
+"""
+Invite counter reconciliation worker.
+
+The invite endpoints keep each event's pending/accepted/declined counts in
+step with its invites, but a write that bypasses them (a manual fix, a
+restored backup) leaves the counters wrong. This worker periodically
+recounts every event in id-ordered batches, repairs drifted counters and
+logs which events had drifted.
+
+Run with: python -m src.main.workers.invite_counter_worker
+"""
+
+import logging
+import os
+import time
+
+from sqlalchemy import func
+from src.main import database
+from src.main.models import Event
+from src.main.utils.invite_counters import reconcile_invite_counts
+
+logger = logging.getLogger(__name__)
+
+INVITE_COUNT_BATCH_SIZE = int(os.getenv("INVITE_COUNT_BATCH_SIZE", "500"))
+INVITE_COUNT_RECONCILE_INTERVAL = float(
+    os.getenv("INVITE_COUNT_RECONCILE_INTERVAL", "3600")
+)
+
+
+def reconcile_all(db, batch_size: int = INVITE_COUNT_BATCH_SIZE) -> int:
+    """
+    Reconciles every event, committing after each batch of event ids so
+    row locks are held briefly. Returns the number of repaired events.
+    """
+
+    repaired = 0
+    first_id, max_id = db.query(func.min(Event.id), func.max(Event.id)).one()
+    while first_id is not None and first_id <= max_id:
+        last_id = first_id + batch_size - 1
+        drifted = reconcile_invite_counts(db, first_id, last_id)
+        db.commit()
+        if drifted:
+            logger.warning("Repaired invite counts of events %s", drifted)
+        repaired += len(drifted)
+        first_id = last_id + 1
+    return repaired
+
+
+def run():
+    while True:
+        with database.SessionLocal() as db:
+            try:
+                repaired = reconcile_all(db)
+                logger.info("Invite counts reconciled, %s repaired", repaired)
+            except Exception:
+                logger.exception("Invite count reconciliation failed")
+                db.rollback()
+        time.sleep(INVITE_COUNT_RECONCILE_INTERVAL)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable is not set.")
+    database.init_engine_and_session(database_url)
+    run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Scheduled jobs worker.
+
+Runs the periodic jobs every SCHEDULER_INTERVAL seconds:
+- event_reminders: queues a reminder email to each accepted guest of the
+  events starting within REMINDER_LEAD_HOURS, once per event.
+- invite_expiry: marks invites still pending when their event starts as
+  expired.
+
+Any number of replicas can run this worker. A session-level Postgres
+advisory lock elects one leader and the others stand by, taking over
+within one interval if the leader's connection goes away.
+
+Jobs never compete with request traffic for long: each batch is a short
+transaction that claims its rows with SKIP LOCKED, batches are separated
+by SCHEDULER_BATCH_PAUSE, and a job stops after SCHEDULER_MAX_BATCHES per
+tick, picking up the rest on the next one. Reminder emails go through the
+outbox, so the email worker's SMTP rate limit applies to them.
+
+Run with: python -m src.main.workers.scheduler
+"""
+
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import DBAPIError
+from src.main import database
+from src.main.models import Event, Invite
+from src.main.utils.email import build_reminder_email, enqueue_emails
+from src.main.utils.event_stream import invite_change, notify_event_changes
+from src.main.utils.invite_counters import subtract_invite_counts
+from src.main.utils.invite_creation import invite_links
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_INTERVAL = float(os.getenv("SCHEDULER_INTERVAL", "60"))
+SCHEDULER_BATCH_SIZE = int(os.getenv("SCHEDULER_BATCH_SIZE", "100"))
+SCHEDULER_BATCH_PAUSE = float(os.getenv("SCHEDULER_BATCH_PAUSE", "0.5"))
+SCHEDULER_MAX_BATCHES = int(os.getenv("SCHEDULER_MAX_BATCHES", "20"))
+REMINDER_LEAD_HOURS = float(os.getenv("REMINDER_LEAD_HOURS", "24"))
+# How far back invite_expiry looks for started events. Older events were
+# handled by earlier ticks, so the start_time range scan stays small.
+INVITE_EXPIRY_LOOKBACK_DAYS = float(
+    os.getenv("INVITE_EXPIRY_LOOKBACK_DAYS", "7")
+)
+
+# Advisory lock key shared by every scheduler replica
+SCHEDULER_LOCK_ID = 7_310_024
+
+
+class AdvisoryLockLeader:
+    """
+    Leader election with a session-level advisory lock held on a dedicated
+    connection. Postgres releases the lock when that connection ends, so a
+    crashed leader is replaced by whichever replica asks next.
+    """
+
+    def __init__(self, engine, lock_id: int = SCHEDULER_LOCK_ID):
+        self.engine = engine
+        self.lock_id = lock_id
+        self._connection = None
+
+    def is_leader(self) -> bool:
+        try:
+            if self._connection is None:
+                connection = self.engine.connect()
+                acquired = connection.scalar(
+                    select(func.pg_try_advisory_lock(self.lock_id))
+                )
+                connection.commit()
+                if not acquired:
+                    connection.close()
+                    return False
+                self._connection = connection
+                logger.info("Scheduler leadership acquired")
+            else:
+                # The lock lives as long as this connection does
+                self._connection.scalar(select(1))
+                self._connection.commit()
+            return True
+        except DBAPIError:
+            logger.exception("Scheduler leadership check failed")
+            self.release()
+            return False
+
+    def release(self):
+        if self._connection is not None:
+            # Discard the connection rather than pooling it with the lock
+            self._connection.invalidate()
+            self._connection.close()
+            self._connection = None
+
+
+def queue_reminders(db, now: datetime, batch_size: int) -> int:
+    """
+    Claims a batch of events starting within REMINDER_LEAD_HOURS that have
+    no reminder yet, queues an email to each accepted guest and commits.
+    Returns the number of events handled.
+    """
+
+    events = (
+        db.query(Event)
+        .filter(
+            Event.start_time > now,
+            Event.start_time <= now + timedelta(hours=REMINDER_LEAD_HOURS),
+            Event.reminder_sent_at.is_(None),
+        )
+        .order_by(Event.start_time)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not events:
+        return 0
+    events_by_id = {event.id: event for event in events}
+
+    guests = db.query(Invite.event_id, Invite.email, Invite.token).filter(
+        Invite.event_id.in_(events_by_id), Invite.status == "accepted"
+    )
+    emails = []
+    for event_id, email, token in guests:
+        event = events_by_id[event_id]
+        event_link, _ = invite_links(token, email)
+        subject, body = build_reminder_email(
+            event.title, event.start_time, event_link
+        )
+        emails.append((email, subject, body))
+    enqueue_emails(db, emails)
+
+    # Leave updated_at alone so event ETags and feeds don't change
+    db.query(Event).filter(Event.id.in_(events_by_id)).update(
+        {Event.reminder_sent_at: now, Event.updated_at: Event.updated_at},
+        synchronize_session=False,
+    )
+    db.commit()
+    return len(events)
+
+
+def expire_invites(db, now: datetime, batch_size: int) -> int:
+    """
+    Expires a batch of pending invites to events that have started, keeps
+    the events' pending counts in step and commits. Returns the number of
+    invites expired.
+    """
+
+    started = select(Event.id).where(
+        Event.start_time <= now,
+        Event.start_time > now - timedelta(days=INVITE_EXPIRY_LOOKBACK_DAYS),
+    )
+    stale = (
+        select(Invite.id)
+        .where(Invite.event_id.in_(started), Invite.status == "pending")
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    expired = db.execute(
+        update(Invite)
+        .where(Invite.id.in_(stale))
+        .values(status="expired")
+        .returning(
+            Invite.event_id,
+            Invite.id,
+            Invite.email,
+            Invite.role,
+            Invite.status,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+    subtract_invite_counts(
+        db, [(invite.event_id, "pending") for invite in expired]
+    )
+    notify_event_changes(
+        db, [invite_change("expired", invite) for invite in expired]
+    )
+    db.commit()
+    return len(expired)
+
+
+JOBS = {
+    "event_reminders": queue_reminders,
+    "invite_expiry": expire_invites,
+}
+
+
+def run_job(job, now: datetime, batch_size: int = SCHEDULER_BATCH_SIZE):
+    """
+    Runs a job batch by batch until it runs dry or reaches
+    SCHEDULER_MAX_BATCHES. Returns the number of rows processed.
+    """
+
+    total = 0
+    for _ in range(SCHEDULER_MAX_BATCHES):
+        with database.SessionLocal() as db:
+            processed = job(db, now, batch_size)
+        total += processed
+        if processed < batch_size:
+            break
+        time.sleep(SCHEDULER_BATCH_PAUSE)
+    return total
+
+
+def tick():
+    now = datetime.now(timezone.utc)
+    for name, job in JOBS.items():
+        try:
+            processed = run_job(job, now)
+        except Exception:
+            logger.exception("Scheduled job %s failed", name)
+            continue
+        if processed:
+            logger.info("Scheduled job %s processed %s", name, processed)
+
+
+def run():
+    leader = AdvisoryLockLeader(database.engine)
+    while True:
+        if leader.is_leader():
+            tick()
+        time.sleep(SCHEDULER_INTERVAL)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable is not set.")
+    database.init_engine_and_session(database_url)
+    run()
+
+
+if __name__ == "__main__":
+    main()
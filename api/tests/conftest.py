@@ -7,7 +7,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from testcontainers.postgres import PostgresContainer
 
-from src.main.database import get_db, init_engine_and_session
+from src.main.database import get_db, get_read_db, init_engine_and_session
+from src.main.instrumentation import instrument_engine, query_inspector
 from src.main.main import app
 from src.main.models import Base
 
@@ -26,6 +27,7 @@ def db_engine(postgres_container):
     # Initialize the app's database engine/session for tests
     init_engine_and_session(test_db_url)
     engine = create_engine(test_db_url)
+    instrument_engine(engine, "test")
     # Create all tables from SQLAlchemy models
     Base.metadata.create_all(engine)
     yield engine
@@ -43,6 +45,9 @@ def test_client(TestingSessionLocal):
     """
     Override the application's get_db dependency to use the test session,
     then yield a FastAPI TestClient that talks to the app using the test DB.
+
+    Requests fail with QueryInspectionError if they repeat a statement
+    shape (N+1) or exceed the DB time budget, see SQL_INSPECT_* settings.
     """
     def override_get_db():
         db = TestingSessionLocal()
@@ -52,9 +57,15 @@ def test_client(TestingSessionLocal):
             db.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    previous_mode = query_inspector.mode
+    query_inspector.configure(mode="raise")
 
     with TestClient(app) as client:
         yield client
 
+    query_inspector.configure(mode=previous_mode)
+
     # cleanup override so other tests are not affected
     app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_read_db, None)
@@ -0,0 +1,190 @@
+"""
+Tests for the async router variants:
+- Test that each async router serves the same routes as its sync router.
+- Test that sync handlers run on the async session's sync session.
+- Test that the public router waits on a slow Redis without blocking the
+  event loop.
+- Test that writers apply their cache invalidations asynchronously.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.routing import APIRoute
+from src.main.database import run_sync_handler
+from src.main.routers import (
+    async_auth_router,
+    async_calendar_router,
+    async_invite_router,
+    async_private_event_router,
+    async_public_event_router,
+    async_user_router,
+    auth_router,
+    calendar_router,
+    invite_router,
+    private_event_router,
+    public_event_router,
+    user_router,
+)
+from src.main.utils import (
+    RedisResponseCache,
+    invalidate_event_pages,
+    response_cache,
+    run_sync_writer,
+)
+
+
+# --- Mocks ---
+class MockAsyncSession:
+    sync_session = object()
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.sync_session, *args, **kwargs)
+
+
+class MockPublicSession:
+    async def scalar(self, statement):
+        return 3
+
+    async def scalars(self, statement):
+        return []
+
+
+class BlockingRedis:
+    """
+    Sync client the async code paths must not touch.
+    """
+
+    def __getattr__(self, name):
+        raise AssertionError(f"sync Redis client used: {name}")
+
+
+class SlowAsyncRedis:
+    """
+    redis.asyncio stand-in whose every command takes delay seconds.
+    """
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.data = {}
+
+    async def get(self, key):
+        await asyncio.sleep(self.delay)
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        await asyncio.sleep(self.delay)
+        self.data[key] = value.encode("utf-8")
+
+    async def delete(self, *keys):
+        await asyncio.sleep(self.delay)
+        for key in keys:
+            self.data.pop(key, None)
+
+
+def route_table(router):
+    return [
+        (
+            route.path,
+            route.methods,
+            route.name,
+            route.response_model,
+            route.status_code,
+            route.summary,
+        )
+        for route in router.routes
+        if isinstance(route, APIRoute)
+    ]
+
+
+# --- Tests ---
+@pytest.mark.parametrize(
+    "async_module, sync_module",
+    [
+        (async_auth_router, auth_router),
+        (async_calendar_router, calendar_router),
+        (async_invite_router, invite_router),
+        (async_private_event_router, private_event_router),
+        (async_public_event_router, public_event_router),
+        (async_user_router, user_router),
+    ],
+)
+def test_async_router_mirrors_sync_router(async_module, sync_module):
+    # Act
+    async_routes = route_table(async_module.router)
+    sync_routes = route_table(sync_module.router)
+
+    # Assert
+    assert async_routes == sync_routes
+    assert all(
+        asyncio.iscoroutinefunction(route.endpoint)
+        for route in async_module.router.routes
+    )
+
+
+def test_run_sync_handler_passes_sync_session():
+    # Arrange
+    db = MockAsyncSession()
+
+    def handler(event_id, db, user=None):
+        return event_id, db, user
+
+    # Act
+    result = asyncio.run(run_sync_handler(db, handler, 7, user="host"))
+
+    # Assert
+    assert result == (7, db.sync_session, "host")
+
+
+def test_async_public_router_does_not_block_on_slow_redis(monkeypatch):
+    # Arrange
+    redis = SlowAsyncRedis(delay=0.05)
+    cache = RedisResponseCache(BlockingRedis(), 60, async_client=redis)
+    monkeypatch.setattr(response_cache, "_response_cache", cache)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0.01)
+
+    async def fetch_twice():
+        tick_task = asyncio.create_task(ticker())
+        try:
+            miss = await async_public_event_router.get_participants(
+                7, if_none_match=None, db=MockPublicSession()
+            )
+            hit = await async_public_event_router.get_participants(
+                7, if_none_match=None, db=None
+            )
+        finally:
+            tick_task.cancel()
+        return miss, hit
+
+    # Act: a miss (get + set) and a hit (get) take three slow round trips
+    miss, hit = asyncio.run(fetch_twice())
+
+    # Assert
+    assert miss.body == hit.body == b"[]"
+    assert hit.headers["ETag"] == miss.headers["ETag"]
+    assert "response:participants:7" in redis.data
+    assert len(ticks) >= 10
+
+
+def test_run_sync_writer_invalidates_through_async_cache(monkeypatch):
+    # Arrange
+    redis = SlowAsyncRedis(delay=0)
+    redis.data = {"response:event:7": b"{}", "response:event:8": b"{}"}
+    cache = RedisResponseCache(BlockingRedis(), 60, async_client=redis)
+    monkeypatch.setattr(response_cache, "_response_cache", cache)
+
+    def handler(event_id, db):
+        invalidate_event_pages([event_id])
+        return event_id
+
+    # Act
+    result = asyncio.run(run_sync_writer(MockAsyncSession(), handler, 7))
+
+    # Assert
+    assert result == 7
+    assert list(redis.data) == ["response:event:8"]
@@ -0,0 +1,77 @@
+"""
+Tests for the email outbox worker:
+- Test successful delivery, retries with backoff, and dead-lettering.
+"""
+
+from datetime import datetime, timezone
+
+from src.main.workers import email_worker
+
+
+# --- Mocks ---
+class MockMessage:
+    def __init__(self, attempts=0):
+        self.id = 1
+        self.to_email = "guest@example.com"
+        self.subject = "Subject"
+        self.body = "Body"
+        self.status = "pending"
+        self.attempts = attempts
+        self.last_error = None
+        self.next_attempt_at = datetime.now(timezone.utc)
+        self.sent_at = None
+
+
+def failing_send(*args):
+    raise OSError("SMTP unavailable")
+
+
+# --- Tests ---
+def test_deliver_marks_sent():
+    # Arrange
+    message = MockMessage()
+    sent = []
+
+    # Act
+    email_worker.deliver([message], send=lambda *args: sent.append(args))
+
+    # Assert
+    assert message.status == "sent"
+    assert message.sent_at is not None
+    assert sent == [("guest@example.com", "Subject", "Body")]
+
+
+def test_deliver_failure_schedules_retry():
+    # Arrange
+    message = MockMessage()
+    before = message.next_attempt_at
+
+    # Act
+    email_worker.deliver([message], send=failing_send)
+
+    # Assert
+    assert message.status == "pending"
+    assert message.attempts == 1
+    assert message.next_attempt_at > before
+    assert "SMTP unavailable" in message.last_error
+
+
+def test_deliver_dead_letters_after_max_attempts():
+    # Arrange
+    message = MockMessage(attempts=email_worker.EMAIL_MAX_ATTEMPTS - 1)
+
+    # Act
+    email_worker.deliver([message], send=failing_send)
+
+    # Assert
+    assert message.status == "dead"
+
+
+def test_retry_delay_grows_and_caps():
+    # Act
+    first = email_worker.retry_delay(1).total_seconds()
+    later = email_worker.retry_delay(30).total_seconds()
+
+    # Assert
+    assert first <= email_worker.EMAIL_BACKOFF_BASE * 1.2
+    assert later <= email_worker.EMAIL_BACKOFF_MAX * 1.2
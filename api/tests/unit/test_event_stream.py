@@ -0,0 +1,148 @@
+"""
+Tests for the event change stream:
+- Test that changes reach only the streams of their event.
+- Test that slow streams are told to resync instead of growing.
+- Test that the listener connection is opened once, off the event loop.
+- Test the Server-Sent Events formatting.
+"""
+
+import asyncio
+import json
+import socket
+import threading
+
+from src.main.utils import EventChangeBroker, format_sse, invite_change
+
+
+# --- Mocks ---
+class MockCursor:
+    def __init__(self, statements):
+        self._statements = statements
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, statement):
+        self._statements.append(statement)
+
+
+class MockConnection:
+    def __init__(self):
+        self.statements = []
+        self.notifies = []
+        self.closed = False
+        self._socket, self._peer = socket.socketpair()
+
+    def cursor(self):
+        return MockCursor(self.statements)
+
+    def fileno(self):
+        return self._socket.fileno()
+
+    def poll(self):
+        self._socket.recv(1)
+
+    def close(self):
+        self.closed = True
+        self._socket.close()
+        self._peer.close()
+
+
+class MockInvite:
+    id = 5
+    event_id = 1
+    email = "guest@example.com"
+    role = "participant"
+    status = "accepted"
+
+
+# --- Tests ---
+def test_broker_routes_changes_by_event():
+    # Arrange
+    connection = MockConnection()
+    broker = EventChangeBroker(lambda: connection)
+
+    async def scenario():
+        watched = await broker.subscribe(1)
+        other = await broker.subscribe(2)
+        broker.publish(invite_change("updated", MockInvite()))
+        change, other_empty = watched.get_nowait(), other.empty()
+        broker.unsubscribe(1, watched)
+        still_listening = not connection.closed
+        broker.unsubscribe(2, other)
+        return change, other_empty, still_listening
+
+    # Act
+    change, other_empty, still_listening = asyncio.run(scenario())
+
+    # Assert
+    assert connection.statements == ["LISTEN event_changes"]
+    assert change["data"]["status"] == "accepted"
+    assert other_empty
+    assert still_listening
+    assert connection.closed
+
+
+def test_broker_resyncs_full_queue():
+    # Arrange
+    broker = EventChangeBroker(MockConnection, queue_size=2)
+
+    async def scenario():
+        queue = await broker.subscribe(1)
+        for _ in range(3):
+            broker.publish(invite_change("created", MockInvite()))
+        changes = [queue.get_nowait() for _ in range(queue.qsize())]
+        broker.unsubscribe(1, queue)
+        return changes
+
+    # Act
+    changes = asyncio.run(scenario())
+
+    # Assert
+    assert [change["type"] for change in changes] == ["resync"]
+
+
+def test_broker_connects_once_off_the_event_loop():
+    # Arrange
+    connections, threads = [], []
+
+    def connect():
+        threads.append(threading.current_thread())
+        connections.append(MockConnection())
+        return connections[-1]
+
+    broker = EventChangeBroker(connect)
+
+    async def scenario():
+        for queue in await asyncio.gather(
+            broker.subscribe(1), broker.subscribe(1)
+        ):
+            broker.unsubscribe(1, queue)
+        # A stream dropped before it started never unsubscribes; its
+        # listener closes on the next notification
+        dropped = await broker.subscribe(2)
+        del dropped
+        connections[-1]._peer.send(b"\0")
+        await asyncio.sleep(0.05)
+
+    # Act
+    asyncio.run(scenario())
+
+    # Assert
+    assert len(connections) == 2
+    assert threads[0] is not threading.main_thread()
+    assert all(connection.closed for connection in connections)
+
+
+def test_format_sse_names_event_by_type():
+    # Act
+    message = format_sse(invite_change("deleted", MockInvite()))
+
+    # Assert
+    name, data, blank, end = message.split("\n")
+    assert name == "event: invite"
+    assert json.loads(data.removeprefix("data: "))["action"] == "deleted"
+    assert blank == end == ""
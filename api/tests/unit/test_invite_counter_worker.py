@@ -0,0 +1,62 @@
+"""
+Tests for the invite counter reconciliation worker:
+- Test that every event id range is reconciled and committed in batches.
+"""
+
+from src.main.workers import invite_counter_worker
+
+
+# --- Mocks ---
+class MockQuery:
+    def __init__(self, bounds):
+        self._bounds = bounds
+
+    def one(self):
+        return self._bounds
+
+
+class MockSession:
+    def __init__(self, bounds):
+        self._bounds = bounds
+        self.commits = 0
+
+    def query(self, *columns):
+        return MockQuery(self._bounds)
+
+    def commit(self):
+        self.commits += 1
+
+
+# --- Tests ---
+def test_reconcile_all_walks_id_ranges(monkeypatch):
+    # Arrange
+    ranges = []
+
+    def reconcile(db, first_id, last_id):
+        ranges.append((first_id, last_id))
+        return [first_id] if first_id == 11 else []
+
+    monkeypatch.setattr(
+        invite_counter_worker, "reconcile_invite_counts", reconcile
+    )
+    db = MockSession((1, 25))
+
+    # Act
+    repaired = invite_counter_worker.reconcile_all(db, batch_size=10)
+
+    # Assert
+    assert ranges == [(1, 10), (11, 20), (21, 30)]
+    assert db.commits == 3
+    assert repaired == 1
+
+
+def test_reconcile_all_without_events():
+    # Arrange
+    db = MockSession((None, None))
+
+    # Act
+    repaired = invite_counter_worker.reconcile_all(db)
+
+    # Assert
+    assert repaired == 0
+    assert db.commits == 0
@@ -4,3 +4,168 @@ Tests for invite_router:
 - Test invite expiration and error handling.
 - Test permissions for invite actions.
 """
+
+from fastapi.testclient import TestClient
+from src.main.database import get_db
+from src.main.main import app
+from src.main.utils import get_current_user_from_token
+
+client = TestClient(app)
+
+
+# --- Mocks ---
+class MockUser:
+    id = 2
+    email = "guest@example.com"
+    first_name = "Guest"
+    last_name = None
+
+
+class MockHost:
+    id = 1
+    email = "host@example.com"
+    first_name = "Host"
+    last_name = None
+
+
+class MockEvent:
+    id = 1
+    title = "Mock Event"
+    description = None
+    host_id = 1
+    host = MockHost()
+    start_time = "2025-11-25T22:17:41.110000Z"
+    end_time = "2025-11-26T22:17:41.110000Z"
+
+
+class MockInvite:
+    id = 1
+    event_id = 1
+    user_id = 2
+    token = "token"
+    email = "guest@example.com"
+    role = "participant"
+    status = "accepted"
+
+
+class MockExpiredInvite(MockInvite):
+    status = "expired"
+
+
+class MockQuery:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def options(self, *args, **kwargs):
+        return self
+
+    def filter(self, *args, **kwargs):
+        return self
+
+    def with_for_update(self):
+        return self
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+    def all(self):
+        return self._rows
+
+
+class MockSession:
+    def __init__(self, invites):
+        self._invites = invites
+        self.writes = 0
+        self.commits = 0
+        self.deleted = []
+
+    def query(self, model):
+        if model.__name__ == "Invite":
+            return MockQuery(self._invites)
+        if model.__name__ == "Event":
+            return MockQuery([MockEvent()])
+        return MockQuery([MockUser()])
+
+    def execute(self, *args, **kwargs):
+        self.writes += 1
+
+    def scalar(self, *args, **kwargs):
+        self.writes += 1
+
+    def delete(self, instance):
+        self.deleted.append(instance)
+
+    def flush(self):
+        pass
+
+    def commit(self):
+        self.commits += 1
+
+
+# --- Tests ---
+def test_update_invite_repeated_response_is_idempotent():
+    # Arrange
+    mock_db = MockSession([MockInvite()])
+    app.dependency_overrides[get_db] = lambda: mock_db
+
+    # Act
+    response = client.put("/api/invites/token", json={"status": "accepted"})
+
+    # Clean-up
+    app.dependency_overrides = {}
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["status"] == "accepted"
+    assert response.json()["user_name"] == "Guest"
+    assert mock_db.writes == 0
+
+
+def test_update_invite_changed_response_rejected():
+    # Arrange
+    mock_db = MockSession([MockInvite()])
+    app.dependency_overrides[get_db] = lambda: mock_db
+
+    # Act
+    response = client.put("/api/invites/token", json={"status": "declined"})
+
+    # Clean-up
+    app.dependency_overrides = {}
+
+    # Assert
+    assert response.status_code == 404
+    assert mock_db.writes == 0
+
+
+def test_update_invite_invalid_status():
+    # Arrange
+    mock_db = MockSession([])
+    app.dependency_overrides[get_db] = lambda: mock_db
+
+    # Act
+    response = client.put("/api/invites/token", json={"status": "maybe"})
+
+    # Clean-up
+    app.dependency_overrides = {}
+
+    # Assert
+    assert response.status_code == 400
+
+
+def test_delete_expired_invite():
+    # Arrange: expired invites have no counter to decrement
+    invite = MockExpiredInvite()
+    mock_db = MockSession([invite])
+    app.dependency_overrides[get_db] = lambda: mock_db
+    app.dependency_overrides[get_current_user_from_token] = MockHost
+
+    # Act
+    response = client.delete("/api/invites/1")
+
+    # Clean-up
+    app.dependency_overrides = {}
+
+    # Assert
+    assert response.status_code == 204
+    assert mock_db.deleted == [invite]
+    assert mock_db.commits == 1
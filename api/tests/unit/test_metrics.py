@@ -0,0 +1,110 @@
+"""
+Tests for metrics and request instrumentation:
+- Test Prometheus text rendering of labeled families.
+- Test per-request SQL statement attribution.
+- Test N+1 detection from statement fingerprints.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from src.main.instrumentation import (
+    HTTP_REQUEST_DB_QUERIES,
+    HTTP_REQUESTS,
+    MetricsMiddleware,
+    QueryInspectionError,
+    fingerprint_statement,
+    instrument_engine,
+    query_inspector,
+)
+from src.main.metrics import CounterFamily, HistogramFamily, render_metrics
+
+
+# --- Tests ---
+def test_render_metrics_counter_and_histogram():
+    # Arrange
+    registry = []
+    counter = CounterFamily(
+        "requests_total", "Requests.", ("route",), registry=registry
+    )
+    histogram = HistogramFamily(
+        "latency_seconds", "Latency.", buckets=(0.1, 1.0), registry=registry
+    )
+
+    # Act
+    counter.labels('/a"b').inc()
+    histogram.labels().observe(0.5)
+    output = render_metrics(registry)
+
+    # Assert
+    assert "# TYPE requests_total counter" in output
+    assert 'requests_total{route="/a\\"b"} 1.0' in output
+    assert 'latency_seconds_bucket{le="0.1"} 0' in output
+    assert 'latency_seconds_bucket{le="1.0"} 1' in output
+    assert 'latency_seconds_bucket{le="+Inf"} 1' in output
+    assert "latency_seconds_count 1" in output
+
+
+def test_middleware_counts_queries_per_route():
+    # Arrange
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test")
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as conn:
+            for _ in range(3):
+                conn.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    # Act
+    with TestClient(app) as client:
+        client.get("/items/1")
+        client.get("/missing")
+
+    # Assert
+    queries = HTTP_REQUEST_DB_QUERIES.labels("GET", "/items/{item_id}")
+    assert queries.snapshot()["sum"] == 3
+    assert HTTP_REQUESTS.labels("GET", "/items/{item_id}", 200).get() == 1
+    assert HTTP_REQUESTS.labels("GET", "unmatched", 404).get() == 1
+
+
+def test_fingerprint_statement_collapses_parameters():
+    # Act
+    shape = fingerprint_statement(
+        "SELECT users.id FROM users\n WHERE users.id IN "
+        "(%(id_1_1)s, %(id_1_2)s) AND users.email = 'a@b.c' LIMIT 5"
+    )
+
+    # Assert
+    assert shape == (
+        "SELECT users.id FROM users WHERE users.id IN (?) "
+        "AND users.email = ? LIMIT ?"
+    )
+
+
+def test_query_inspector_raises_on_repeated_statement():
+    # Arrange
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test")
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/n-plus-one")
+    def n_plus_one():
+        with engine.connect() as conn:
+            for item_id in range(4):
+                conn.execute(text("SELECT :id"), {"id": item_id})
+        return {}
+
+    # Act / Assert
+    query_inspector.configure(mode="raise", max_repeats=3)
+    try:
+        with TestClient(app) as client:
+            with pytest.raises(QueryInspectionError):
+                client.get("/n-plus-one")
+    finally:
+        query_inspector.configure(mode="off", max_repeats=5)
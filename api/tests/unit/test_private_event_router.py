@@ -6,7 +6,7 @@ Tests for event_router:
 """
 
 from fastapi.testclient import TestClient
-from src.main.database import get_db
+from src.main.database import get_db, get_read_db
 from src.main.main import app
 from src.main.utils import get_current_user_from_token
 
@@ -31,6 +31,9 @@ class MockEvent:
         end_time="2025-11-26T22:17:41.110000Z",
         host_id=1,
         host_name="Test User",
+        pending_count=0,
+        accepted_count=0,
+        declined_count=0,
     ):
         self.id = id
         self.title = title
@@ -39,6 +42,9 @@ class MockEvent:
         self.end_time = end_time
         self.host_id = host_id
         self.host_name = host_name
+        self.pending_count = pending_count
+        self.accepted_count = accepted_count
+        self.declined_count = declined_count
 
 
 class MockEventQuery:
@@ -53,6 +59,9 @@ class MockEventQuery:
         # No-op for mock, just return self
         return self
 
+    def limit(self, count):
+        return MockEventQuery(self._events[:count])
+
     def all(self):
         return self._events
 
@@ -67,6 +76,9 @@ class MockUserQuery:
     def filter(self, *args, **kwargs):
         return self
 
+    def all(self):
+        return self._users
+
     def first(self):
         return self._users[0] if self._users else None
 
@@ -115,7 +127,7 @@ def test_get_events_host_success():
     app.dependency_overrides[get_current_user_from_token] = (
         mock_get_current_user_from_token
     )
-    app.dependency_overrides[get_db] = mock_get_db
+    app.dependency_overrides[get_read_db] = mock_get_db
 
     # --- Act ---
     response = client.get("/api/private/events/?role=host&time=all")
@@ -126,8 +138,62 @@ def test_get_events_host_success():
     # --- Assert ---
     assert response.status_code == 200
     data = response.json()
-    assert len(data) == 2
-    assert all(event["host_id"] == 1 for event in data)
+    assert len(data["items"]) == 2
+    assert all(event["host_id"] == 1 for event in data["items"])
+    assert data["next_cursor"] is None
+
+
+def test_get_events_returns_next_cursor():
+    # --- Arrange ---
+    global mock_db
+    mock_events = [
+        MockEvent(id=1, title="Event 1", host_id=1),
+        MockEvent(id=2, title="Event 2", host_id=1),
+    ]
+    mock_db = MockSession(events=mock_events)
+    app.dependency_overrides[get_current_user_from_token] = (
+        mock_get_current_user_from_token
+    )
+    app.dependency_overrides[get_read_db] = mock_get_db
+
+    # --- Act ---
+    response = client.get("/api/private/events/?role=host&limit=1")
+
+    # --- Clean-up ---
+    app.dependency_overrides = {}
+
+    # --- Assert ---
+    assert response.status_code == 200
+    data = response.json()
+    assert [event["id"] for event in data["items"]] == [1]
+    assert data["next_cursor"] is not None
+
+
+def test_get_event_summary_reads_counters():
+    # --- Arrange ---
+    global mock_db
+    mock_events = [
+        MockEvent(id=1, pending_count=3, accepted_count=2, declined_count=1)
+    ]
+    mock_db = MockSession(events=mock_events)
+    app.dependency_overrides[get_current_user_from_token] = (
+        mock_get_current_user_from_token
+    )
+    app.dependency_overrides[get_read_db] = mock_get_db
+
+    # --- Act ---
+    response = client.get("/api/private/events/1/summary")
+
+    # --- Clean-up ---
+    app.dependency_overrides = {}
+
+    # --- Assert ---
+    assert response.status_code == 200
+    assert response.json() == {
+        "event_id": 1,
+        "invite_counts": {"pending": 3, "accepted": 2, "declined": 1},
+        "total_invites": 6,
+    }
 
 
 # def test_create_event_success():
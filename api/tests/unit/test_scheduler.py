@@ -0,0 +1,127 @@
+"""
+Tests for the scheduled jobs worker:
+- Test advisory lock leader election and failover.
+- Test that jobs run in bounded batches.
+- Test the reminder email contents.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy.exc import OperationalError
+from src.main.utils.email import build_reminder_email
+from src.main.workers import scheduler
+
+
+# --- Mocks ---
+class MockConnection:
+    def __init__(self, acquired=True):
+        self.acquired = acquired
+        self.alive = True
+        self.invalidated = False
+        self.closed = False
+
+    def scalar(self, statement):
+        if not self.alive:
+            raise OperationalError("SELECT 1", {}, Exception("gone"))
+        return self.acquired
+
+    def commit(self):
+        pass
+
+    def invalidate(self):
+        self.invalidated = True
+
+    def close(self):
+        self.closed = True
+
+
+class MockEngine:
+    def __init__(self, connections):
+        self._connections = iter(connections)
+
+    def connect(self):
+        return next(self._connections)
+
+
+class MockSession:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+# --- Tests ---
+def test_leader_keeps_lock_until_connection_drops():
+    # Arrange
+    first, second = MockConnection(), MockConnection()
+    leader = scheduler.AdvisoryLockLeader(MockEngine([first, second]))
+
+    # Act / Assert
+    assert leader.is_leader()
+    assert leader.is_leader()
+    first.alive = False
+    assert not leader.is_leader()
+    assert first.invalidated
+    assert leader.is_leader()
+
+
+def test_follower_releases_connection():
+    # Arrange
+    connection = MockConnection(acquired=False)
+    leader = scheduler.AdvisoryLockLeader(MockEngine([connection]))
+
+    # Act
+    is_leader = leader.is_leader()
+
+    # Assert
+    assert not is_leader
+    assert connection.closed
+    assert not connection.invalidated
+
+
+def test_run_job_stops_when_batch_runs_dry(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(scheduler.database, "SessionLocal", MockSession)
+    monkeypatch.setattr(scheduler, "SCHEDULER_BATCH_PAUSE", 0)
+    remaining = [10, 10, 4]
+
+    def job(db, now, batch_size):
+        return remaining.pop(0)
+
+    # Act
+    total = scheduler.run_job(job, datetime.now(timezone.utc), batch_size=10)
+
+    # Assert
+    assert total == 24
+    assert remaining == []
+
+
+def test_run_job_caps_batches_per_tick(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(scheduler.database, "SessionLocal", MockSession)
+    monkeypatch.setattr(scheduler, "SCHEDULER_BATCH_PAUSE", 0)
+    monkeypatch.setattr(scheduler, "SCHEDULER_MAX_BATCHES", 3)
+
+    # Act
+    total = scheduler.run_job(
+        lambda db, now, batch_size: batch_size,
+        datetime.now(timezone.utc),
+        batch_size=5,
+    )
+
+    # Assert
+    assert total == 15
+
+
+def test_build_reminder_email_uses_utc():
+    # Arrange
+    start = datetime(2030, 6, 1, 18, 30, tzinfo=timezone.utc)
+
+    # Act
+    subject, body = build_reminder_email("Party", start, "http://ui/e/1")
+
+    # Assert
+    assert subject == "Reminder: Party starts soon"
+    assert "June 01 at 18:30 UTC" in body
+    assert "http://ui/e/1" in body
@@ -4,3 +4,74 @@ Tests for user_router:
 - Test user-related permissions and error cases.
 - Test edge cases for user data.
 """
+
+from fastapi.testclient import TestClient
+from src.main.database import get_db
+from src.main.main import app
+from src.main.utils import get_current_user_from_token
+
+client = TestClient(app)
+
+
+# --- Mocks ---
+class MockUser:
+    id = 2
+    email = "guest@example.com"
+    first_name = "Guest"
+    last_name = None
+
+
+class MockDeletedInvite:
+    event_id = 1
+    token = "token"
+    status = "expired"
+    id = 1
+    email = "guest@example.com"
+    role = "participant"
+
+
+class MockResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class MockSession:
+    def __init__(self, deleted_invites):
+        self._deleted_invites = deleted_invites
+        self.statements = 0
+        self.commits = 0
+
+    def execute(self, *args, **kwargs):
+        self.statements += 1
+        if self.statements == 1:
+            return MockResult(self._deleted_invites)
+        return MockResult([])
+
+    def scalars(self, *args, **kwargs):
+        return MockResult([])
+
+    def commit(self):
+        self.commits += 1
+
+
+# --- Tests ---
+def test_delete_current_user_with_expired_invite():
+    # Arrange
+    mock_db = MockSession([MockDeletedInvite()])
+    app.dependency_overrides[get_db] = lambda: mock_db
+    app.dependency_overrides[get_current_user_from_token] = MockUser
+
+    # Act
+    response = client.delete("/api/users/me")
+
+    # Clean-up
+    app.dependency_overrides = {}
+
+    # Assert: invite delete, change notification and user delete, with no
+    # counter update for the expired invite
+    assert response.status_code == 204
+    assert mock_db.statements == 3
+    assert mock_db.commits == 1
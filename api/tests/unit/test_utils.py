@@ -4,3 +4,561 @@ Tests for utils:
 - Test email utility functions (email formatting, sending).
 - Test error handling in utility functions.
 """
+
+import asyncio
+import smtplib
+import threading
+from datetime import datetime, timezone
+
+import bcrypt
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from src.main.schemas import EventOut, InviteOut
+from src.main.utils import (
+    MemoryResponseCache,
+    RateLimiter,
+    RedisResponseCache,
+    SerializedJSONResponse,
+    SMTPConnectionPool,
+    TTLCache,
+    authentication,
+    cache_event_page,
+    cache_user,
+    etag_matches,
+    event_etag,
+    get_async_current_user_from_token,
+    get_cached_event_page,
+    get_current_user_from_token,
+    hash_password,
+    hash_password_async,
+    ics_escape,
+    ics_fold,
+    invalidate_event_pages,
+    invite_counters,
+    invite_import,
+    make_etag,
+    parse_invite_rows,
+    participants_etag,
+    password_needs_rehash,
+    response_cache,
+    serialize_eventouts,
+    serialize_inviteouts,
+    verify_password,
+    verify_password_async,
+)
+
+
+# --- Mocks ---
+class MockUser:
+    def __init__(self, id, email, first_name=None, last_name=None):
+        self.id = id
+        self.email = email
+        self.first_name = first_name
+        self.last_name = last_name
+        self.is_registered = True
+
+
+class MockEvent:
+    def __init__(self, id, host):
+        self.id = id
+        self.title = f"Event {id}"
+        self.description = None
+        self.host_id = host.id
+        self.host = host
+        self.start_time = "2025-11-25T22:17:41.110000Z"
+        self.end_time = "2025-11-26T22:17:41.110000Z"
+        self.pending_count = 2
+        self.accepted_count = 1
+        self.declined_count = 0
+
+
+class MockInvite:
+    def __init__(self, id, event_id, user_id=None):
+        self.id = id
+        self.event_id = event_id
+        self.user_id = user_id
+        self.token = f"token-{id}"
+        self.email = f"guest{id}@example.com"
+        self.role = "participant"
+        self.status = "pending"
+
+
+class MockQuery:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def options(self, *args, **kwargs):
+        return self
+
+    def filter(self, *args, **kwargs):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class CountingSession:
+    def __init__(self, events, users):
+        self._events = events
+        self._users = users
+        self.query_count = 0
+
+    def query(self, model):
+        self.query_count += 1
+        if model.__name__ == "Event":
+            return MockQuery(self._events)
+        return MockQuery(self._users)
+
+
+# --- Tests ---
+def test_serialize_eventouts_single_host_query():
+    # Arrange
+    host = MockUser(1, "host@example.com", "Test", "Host")
+    events = [MockEvent(i, host) for i in range(50)]
+    db = CountingSession(events, [host])
+
+    # Act
+    data = serialize_eventouts(events, db)
+
+    # Assert
+    assert db.query_count == 1
+    assert len(data) == 50
+    assert all(event["host_name"] == "Test Host" for event in data)
+
+
+def test_serialize_inviteouts_constant_queries():
+    # Arrange
+    host = MockUser(1, "host@example.com")
+    guest = MockUser(2, "guest@example.com", "Guest")
+    event = MockEvent(1, host)
+    invites = [MockInvite(i, event.id, guest.id) for i in range(100)]
+    db = CountingSession([event], [guest])
+
+    # Act
+    data = serialize_inviteouts(invites, db)
+
+    # Assert
+    assert db.query_count == 2
+    assert data[0]["event"]["host_name"] == "host@example.com"
+    assert data[0]["user_name"] == "Guest"
+
+
+def test_serializers_match_response_models():
+    # Arrange: SerializedJSONResponse skips response_model validation
+    host = MockUser(1, "host@example.com", "Test", "Host")
+    event = MockEvent(1, host)
+    invites = [MockInvite(1, event.id, host.id)]
+    db = CountingSession([event], [host])
+
+    # Act
+    event_data = serialize_eventouts([event], db)[0]
+    invite_data = serialize_inviteouts(invites, db)[0]
+
+    # Assert
+    assert set(event_data) == set(EventOut.model_fields)
+    assert set(invite_data) == set(InviteOut.model_fields)
+    assert InviteOut.model_validate(invite_data).event.id == event.id
+    assert event_data["invite_counts"] == {
+        "pending": 2,
+        "accepted": 1,
+        "declined": 0,
+    }
+    # Invitees don't see the other guests' replies
+    assert invite_data["event"]["invite_counts"] is None
+
+
+def test_subtract_invite_counts_single_statement():
+    # Arrange
+    statements = []
+
+    class RecordingSession:
+        def execute(self, statement):
+            statements.append(statement)
+
+    # Act
+    invite_counters.subtract_invite_counts(
+        RecordingSession(),
+        [(2, "pending"), (1, "accepted"), (2, "pending"), (2, "declined")],
+    )
+    invite_counters.subtract_invite_counts(RecordingSession(), [])
+
+    # Assert: per-event totals as (event_id, pending, accepted, declined)
+    assert len(statements) == 1
+    sql = str(
+        statements[0].compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+    assert "FROM (VALUES (1, 0, 1, 0), (2, 2, 0, 1))" in sql
+
+
+def test_serialized_json_response_encodes_utc_like_pydantic():
+    # Arrange
+    start = datetime(2030, 1, 1, 12, 30, tzinfo=timezone.utc)
+
+    # Act
+    response = SerializedJSONResponse({"start_time": start, "id": 1})
+
+    # Assert
+    assert response.body == b'{"start_time":"2030-01-01T12:30:00Z","id":1}'
+    assert response.media_type == "application/json"
+
+
+def test_hash_password_round_trip():
+    # Arrange
+    hashed = hash_password("secret")
+
+    # Act / Assert
+    assert verify_password("secret", hashed)
+    assert not verify_password("wrong", hashed)
+    assert not password_needs_rehash(hashed)
+
+
+def test_hash_password_async_round_trip():
+    # Act
+    async def scenario():
+        hashed = await hash_password_async("secret")
+        return (
+            hashed,
+            await verify_password_async("secret", hashed),
+            await verify_password_async("wrong", hashed),
+        )
+
+    hashed, right, wrong = asyncio.run(scenario())
+
+    # Assert
+    assert verify_password("secret", hashed)
+    assert right and not wrong
+
+
+def test_password_needs_rehash_on_cost_change():
+    # Arrange
+    cheap_hash = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4)).decode()
+
+    # Act / Assert
+    assert password_needs_rehash(cheap_hash)
+
+
+def test_password_pool_rejects_when_saturated(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(
+        authentication, "_password_slots", threading.BoundedSemaphore(1)
+    )
+    authentication._password_slots.acquire()
+
+    # Act
+    with pytest.raises(HTTPException) as exc_info:
+        hash_password("secret")
+
+    # Assert
+    assert exc_info.value.status_code == 503
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    # Arrange
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # Act
+    cache.set("c", 3)
+
+    # Assert
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries():
+    # Arrange
+    cache = TTLCache(maxsize=2, ttl=0)
+
+    # Act
+    cache.set("a", 1)
+
+    # Assert
+    assert cache.get("a") is None
+
+
+def test_current_user_resolved_from_cache():
+    # Arrange
+    cache_user(MockUser(42, "cached@example.com", "Cached"))
+    db = CountingSession([], [])
+    payload = {"sub": "cached@example.com", "uid": 42}
+
+    # Act
+    user = get_current_user_from_token(db=db, jwt_payload=payload)
+
+    # Assert
+    assert db.query_count == 0
+    assert user.id == 42
+    assert user.first_name == "Cached"
+
+
+def test_async_current_user_loaded_on_cache_miss():
+    # Arrange
+    loaded = MockUser(43, "loaded@example.com", "Loaded")
+    statements = []
+
+    class MockAsyncSession:
+        async def scalar(self, statement):
+            statements.append(statement)
+            return loaded
+
+    payload = {"sub": "loaded@example.com", "uid": 43}
+
+    # Act
+    user = asyncio.run(
+        get_async_current_user_from_token(
+            db=MockAsyncSession(), jwt_payload=payload
+        )
+    )
+    cached = asyncio.run(
+        get_async_current_user_from_token(
+            db=MockAsyncSession(), jwt_payload=payload
+        )
+    )
+
+    # Assert: the second lookup is served from the cache
+    assert user is loaded
+    assert len(statements) == 1
+    assert cached.first_name == "Loaded"
+
+
+class FakeSMTP:
+    def __init__(self, disconnected=False):
+        self.disconnected = disconnected
+        self.sent = 0
+        self.closed = False
+
+    def send_message(self, msg):
+        if self.disconnected:
+            raise smtplib.SMTPServerDisconnected()
+        self.sent += 1
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+def test_smtp_pool_reuses_connections():
+    # Arrange
+    connections = []
+
+    def connect():
+        connections.append(FakeSMTP())
+        return connections[-1]
+
+    pool = SMTPConnectionPool(connect, size=1, rate=0, max_messages=100)
+
+    # Act
+    for _ in range(10):
+        pool.send_message("message")
+
+    # Assert
+    assert len(connections) == 1
+    assert connections[0].sent == 10
+
+
+def test_smtp_pool_reconnects_after_disconnect():
+    # Arrange
+    dropped = FakeSMTP(disconnected=True)
+    fresh = FakeSMTP()
+    connections = iter([dropped, fresh])
+    pool = SMTPConnectionPool(lambda: next(connections), size=1, rate=0)
+
+    # Act
+    pool.send_message("message")
+
+    # Assert
+    assert dropped.closed
+    assert fresh.sent == 1
+
+
+def test_parse_invite_rows_validates_each_row():
+    # Arrange
+    lines = [
+        "email,role",
+        "guest@example.com",
+        "",
+        "cohost@example.com,cohost",
+        "not-an-email",
+    ]
+
+    # Act
+    rows = list(parse_invite_rows(lines))
+
+    # Assert
+    assert rows[0] == (2, "guest@example.com", "participant", None)
+    assert rows[1] == (4, "cohost@example.com", "cohost", None)
+    assert rows[2][0] == 5
+    assert rows[2][3] is not None
+
+
+def test_ics_escape_and_fold():
+    # Act
+    escaped = ics_escape("Dinner; drinks, and\nmore")
+    folded = ics_fold("DESCRIPTION:" + "x" * 100)
+
+    # Assert
+    assert escaped == "Dinner\\; drinks\\, and\\nmore"
+    assert all(len(line) <= 75 for line in folded.split("\r\n"))
+    assert folded.replace("\r\n ", "").rstrip() == "DESCRIPTION:" + "x" * 100
+
+
+def test_etag_matches_if_none_match():
+    # Arrange
+    etag = make_etag(1, "2025-01-01")
+
+    # Act / Assert
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(make_etag(2, "2025-01-01"), etag)
+
+
+def test_event_etag_changes_with_host_name():
+    # Arrange
+    class MockEvent:
+        id = 1
+        updated_at = "2025-01-01"
+
+    host = MockUser(1, "host@example.com", "Host")
+    etag = event_etag(MockEvent(), host)
+
+    # Act
+    host.first_name = "Renamed"
+
+    # Assert
+    assert event_etag(MockEvent(), host) != etag
+
+
+def test_participants_etag_changes_with_version():
+    # Act / Assert
+    assert participants_etag(1, 0) == participants_etag(1, 0)
+    assert participants_etag(1, 0) != participants_etag(1, 1)
+    assert participants_etag(1, 0) != participants_etag(2, 0)
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the redis-py client methods the cache uses.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode("utf-8")
+        self.expiry[key] = ex
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        lambda: MemoryResponseCache(maxsize=10, ttl=60),
+        lambda: RedisResponseCache(FakeRedis(), ttl=60),
+    ],
+)
+def test_event_page_cache_invalidated_by_event(backend, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(response_cache, "_response_cache", backend())
+    cache_event_page("tok", 7, '"etag"', {"id": 7, "title": "Party"})
+
+    # Act
+    cached = get_cached_event_page("tok")
+    invalidate_event_pages([7])
+
+    # Assert
+    assert cached == {"etag": '"etag"', "body": {"id": 7, "title": "Party"}}
+    assert get_cached_event_page("tok") is None
+
+
+def test_redis_response_cache_sets_expiry_and_prefix():
+    # Arrange
+    client = FakeRedis()
+    cache = RedisResponseCache(client, ttl=30)
+
+    # Act
+    cache.set("event:1", {"etag": "x"})
+
+    # Assert
+    assert client.expiry == {"response:event:1": 30}
+    assert cache.get("event:1") == {"etag": "x"}
+    assert cache.get("event:2") is None
+
+
+def test_invite_import_flushes_invalid_rows_per_batch(monkeypatch, tmp_path):
+    # Arrange: a file of invalid rows never fills a batch of invites
+    class MockImportJob:
+        event_id = 1
+        processed_rows = created_count = skipped_count = error_count = 0
+        errors = []
+        status = "running"
+        finished_at = None
+
+    class MockImportSession:
+        def __init__(self):
+            self.job = MockImportJob()
+            self.progress = []
+
+        def get(self, model, id):
+            return self.job if model.__name__ == "InviteImport" else None
+
+        def commit(self):
+            self.progress.append(self.job.processed_rows)
+
+        def close(self):
+            pass
+
+    db = MockImportSession()
+    path = tmp_path / "guests.csv"
+    path.write_text("email\n" + "not-an-email\n" * 5)
+    monkeypatch.setattr(invite_import.database, "SessionLocal", lambda: db)
+    monkeypatch.setattr(invite_import, "INVITE_IMPORT_BATCH_SIZE", 2)
+
+    # Act
+    invite_import.run_invite_import(1, str(path))
+
+    # Assert
+    assert db.progress == [2, 4, 5, 5]
+    assert db.job.error_count == 5
+    assert db.job.status == "completed"
+    assert not path.exists()
+
+
+def test_rate_limiter_fractional_rate(monkeypatch):
+    # Arrange: one message every two seconds, on a fake clock
+    clock = [0.0]
+    monkeypatch.setattr(
+        "src.main.utils.email.time.monotonic", lambda: clock[0]
+    )
+    monkeypatch.setattr(
+        "src.main.utils.email.time.sleep",
+        lambda seconds: clock.__setitem__(0, clock[0] + seconds),
+    )
+    limiter = RateLimiter(0.5)
+
+    # Act
+    limiter.acquire()
+    first = clock[0]
+    limiter.acquire()
+    second = clock[0]
+
+    # Assert
+    assert first == 0
+    assert second == pytest.approx(2)
@@ -71,21 +71,30 @@ export async function fetchInvites(
     userId?: number
 ): Promise<InviteOut[]> {
     try {
-        // Build query string
-        const params = new URLSearchParams();
-        if (status) params.append('status', status);
-        if (eventId !== undefined) params.append('event_id', String(eventId));
-        if (userId !== undefined) params.append('user_id', String(userId));
-        const response = await fetch(
-            `${baseUrl}/api/invites/?${params.toString()}`,
-            {
-                credentials: 'include',
-            }
-        );
-        if (!response.ok) throw new Error('Failed to fetch invites');
+        // Fetch every page, following cursors until the last page
+        const data: any[] = [];
+        let cursor: string | null = null;
+        do {
+            // Build query string
+            const params = new URLSearchParams();
+            if (status) params.append('status', status);
+            if (eventId !== undefined)
+                params.append('event_id', String(eventId));
+            if (userId !== undefined) params.append('user_id', String(userId));
+            if (cursor) params.append('cursor', cursor);
+            const response = await fetch(
+                `${baseUrl}/api/invites/?${params.toString()}`,
+                {
+                    credentials: 'include',
+                }
+            );
+            if (!response.ok) throw new Error('Failed to fetch invites');
 
-        // Transform Response object to JSON
-        const data = await response.json();
+            // Transform Response object to JSON
+            const page = await response.json();
+            data.push(...page.items);
+            cursor = page.next_cursor;
+        } while (cursor);
 
         // Transform from snake_case to camelCase
         const invites: InviteOut[] = data.map((invite: any) => ({
@@ -9,21 +9,29 @@ export async function fetchEvents(
     role: 'host' | 'participant',
     time: 'upcoming' | 'past' | 'all'
 ): Promise<EventOut[]> {
-    // Sent GET request to the API
+    // Sent GET requests to the API, following cursors until the last page
     try {
-        const response = await fetch(
-            `${baseUrl}/api/private/events/?role=${role}&time=${time}`,
-            {
-                credentials: 'include',
-            }
-        );
-        if (!response.ok)
-            throw new Error(
-                `Failed to fetch ${time} events where the user is a ${role}`
+        const data: any[] = [];
+        let cursor: string | null = null;
+        do {
+            const params = new URLSearchParams({ role, time });
+            if (cursor) params.append('cursor', cursor);
+            const response = await fetch(
+                `${baseUrl}/api/private/events/?${params.toString()}`,
+                {
+                    credentials: 'include',
+                }
             );
+            if (!response.ok)
+                throw new Error(
+                    `Failed to fetch ${time} events where the user is a ${role}`
+                );
 
-        // Transform Response object to JSON
-        const data = await response.json();
+            // Transform Response object to JSON
+            const page = await response.json();
+            data.push(...page.items);
+            cursor = page.next_cursor;
+        } while (cursor);
 
         // Transform from snake_case to camelCase
         const events: EventOut[] = data.map((event: any) => ({